@@ -1,2779 +1,3827 @@
-#!/usr/bin/env python3
-"""
-Simplified RFC and Internet Draft MCP Server using only standard library
-This version avoids external dependencies for easier setup
-"""
-
-import asyncio
-import json
-import re
-import sys
-import urllib.request
-import urllib.parse
-from typing import Any, Dict, List, Optional
-from html.parser import HTMLParser
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import threading
-import argparse
-import logging
-import logging.handlers
-import os
-import time
-from datetime import datetime
-
-# Simple MCP server implementation without FastMCP
-class SimpleMCPServer:
-    def __init__(self, name: str):
-        self.name = name
-        self.tools = {}
-        self.resources = {}
-        self.logger = logging.getLogger('rfc_server')
-        self.logger.info(f"Initializing MCP Server: {name}")
-    
-    def tool(self, func):
-        """Decorator to register a tool"""
-        self.tools[func.__name__] = func
-        return func
-    
-    def resource(self, uri_template):
-        """Decorator to register a resource"""
-        def decorator(func):
-            self.resources[uri_template] = func
-            return func
-        return decorator
-    
-    def _get_tool_schema(self, tool_name: str) -> Dict[str, Any]:
-        """Get proper input schema for a tool - MCP Inspector compatible format"""
-        schemas = {
-            "get_rfc": {
-                "GetRfcInput": {
-                    "type": "object",
-                    "properties": {
-                        "number": {
-                            "type": "string",
-                            "description": "RFC number (e.g., '2616', '7540')"
-                        },
-                        "format": {
-                            "type": "string",
-                            "enum": ["full", "metadata", "sections"],
-                            "default": "full",
-                            "description": "Output format: full document, metadata only, or sections only"
-                        }
-                    },
-                    "required": ["number"],
-                    "description": "Parameters for fetching an RFC document"
-                }
-            },
-            "search_rfcs": {
-                "SearchRfcsInput": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query or keyword to find RFCs"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "default": 10,
-                            "minimum": 1,
-                            "maximum": 50,
-                            "description": "Maximum number of results to return"
-                        }
-                    },
-                    "required": ["query"],
-                    "description": "Parameters for searching RFC documents"
-                }
-            },
-            "get_rfc_section": {
-                "GetRfcSectionInput": {
-                    "type": "object",
-                    "properties": {
-                        "number": {
-                            "type": "string",
-                            "description": "RFC number (e.g., '2616')"
-                        },
-                        "section": {
-                            "type": "string",
-                            "description": "Section title or identifier to retrieve"
-                        }
-                    },
-                    "required": ["number", "section"],
-                    "description": "Parameters for fetching a specific RFC section"
-                }
-            },
-            "get_internet_draft": {
-                "GetInternetDraftInput": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Internet Draft name (e.g., 'draft-ietf-httpbis-http2' or 'draft-ietf-httpbis-http2-17')"
-                        },
-                        "format": {
-                            "type": "string",
-                            "enum": ["full", "metadata", "sections"],
-                            "default": "full",
-                            "description": "Output format: full document, metadata only, or sections only"
-                        }
-                    },
-                    "required": ["name"],
-                    "description": "Parameters for fetching an Internet Draft document"
-                }
-            },
-            "search_internet_drafts": {
-                "SearchInternetDraftsInput": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query or keyword to find Internet Drafts"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "default": 10,
-                            "minimum": 1,
-                            "maximum": 50,
-                            "description": "Maximum number of results to return"
-                        }
-                    },
-                    "required": ["query"],
-                    "description": "Parameters for searching Internet Draft documents"
-                }
-            },
-            "get_internet_draft_section": {
-                "GetInternetDraftSectionInput": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Internet Draft name"
-                        },
-                        "section": {
-                            "type": "string",
-                            "description": "Section title or identifier to retrieve"
-                        }
-                    },
-                    "required": ["name", "section"],
-                    "description": "Parameters for fetching a specific Internet Draft section"
-                }
-            },
-            "get_openid_spec": {
-                "GetOpenIdSpecInput": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "OpenID specification name (e.g., 'openid-connect-core', 'oauth-2.0-multiple-response-types')"
-                        },
-                        "format": {
-                            "type": "string",
-                            "enum": ["full", "metadata", "sections"],
-                            "default": "full",
-                            "description": "Output format: full document, metadata only, or sections only"
-                        }
-                    },
-                    "required": ["name"],
-                    "description": "Parameters for fetching an OpenID Foundation specification"
-                }
-            },
-            "search_openid_specs": {
-                "SearchOpenIdSpecsInput": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query or keyword to find OpenID specifications"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "default": 10,
-                            "minimum": 1,
-                            "maximum": 20,
-                            "description": "Maximum number of results to return"
-                        }
-                    },
-                    "required": ["query"],
-                    "description": "Parameters for searching OpenID Foundation specifications"
-                }
-            },
-            "get_openid_spec_section": {
-                "GetOpenIdSpecSectionInput": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "OpenID specification name"
-                        },
-                        "section": {
-                            "type": "string",
-                            "description": "Section title or identifier to retrieve"
-                        }
-                    },
-                    "required": ["name", "section"],
-                    "description": "Parameters for fetching a specific OpenID specification section"
-                }
-            },
-            "get_working_group_documents": {
-                "GetWorkingGroupDocumentsInput": {
-                    "type": "object",
-                    "properties": {
-                        "working_group": {
-                            "type": "string",
-                            "description": "IETF working group name (e.g., 'httpbis', 'oauth', 'tls')"
-                        },
-                        "include_rfcs": {
-                            "type": "boolean",
-                            "default": True,
-                            "description": "Include RFCs published by the working group"
-                        },
-                        "include_drafts": {
-                            "type": "boolean",
-                            "default": True,
-                            "description": "Include active Internet Drafts from the working group"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "default": 50,
-                            "minimum": 1,
-                            "maximum": 100,
-                            "description": "Maximum number of documents to return"
-                        }
-                    },
-                    "required": ["working_group"],
-                    "description": "Parameters for fetching working group documents"
-                }
-            }
-        }
-        
-        # Return the schema for the tool, or a default empty schema
-        return schemas.get(tool_name, {
-            "DefaultInput": {
-                "type": "object",
-                "properties": {},
-                "required": [],
-                "description": "Default input parameters"
-            }
-        })
-    
-    async def send_progress_notification(self, request_id: str, progress: int, message: str):
-        """Send progress notification to client"""
-        notification = {
-            "jsonrpc": "2.0",
-            "method": "notifications/progress",
-            "params": {
-                "progressToken": request_id,
-                "value": {
-                    "kind": "report",
-                    "percentage": progress,
-                    "message": message
-                }
-            }
-        }
-        # In stdio mode, send notification immediately
-        if hasattr(self, '_current_mode') and self._current_mode == 'stdio':
-            print(json.dumps(notification), flush=True)
-        
-    async def handle_request(self, request):
-        """Handle MCP request"""
-        method = request.get("method", "")
-        params = request.get("params", {})
-        request_id = request.get("id")
-        
-        # Enhanced logging for initialize requests
-        if method == "initialize":
-            self.logger.info(f"🚀 INITIALIZE REQUEST RECEIVED")
-            self.logger.info(f"Handling request: {method} (ID: {request_id})")
-            self.logger.info(f"Request timestamp: {datetime.now().isoformat()}")
-            self.logger.info(f"Request size: {len(json.dumps(request))} bytes")
-        else:
-            self.logger.info(f"Handling request: {method} (ID: {request_id})")
-        
-        self.logger.debug(f"Request params: {params}")
-        self.logger.debug(f"Full request: {request}")
-        
-        # Check if this is a notification (no ID) vs a request (has ID)
-        is_notification = request_id is None
-        
-        if is_notification:
-            self.logger.debug(f"Processing as notification (no response expected)")
-        else:
-            self.logger.debug(f"Processing as request (response required with ID: {request_id})")
-            
-        # Log request validation for initialize
-        if method == "initialize":
-            self.logger.info("Validating initialize request format:")
-            self.logger.info(f"  jsonrpc field: {request.get('jsonrpc', 'MISSING')}")
-            self.logger.info(f"  method field: {request.get('method', 'MISSING')}")
-            self.logger.info(f"  id field: {request.get('id', 'MISSING')} (type: {type(request.get('id')).__name__})")
-            self.logger.info(f"  params field: {'present' if 'params' in request else 'MISSING'}")
-            
-            # Validate JSON-RPC 2.0 compliance
-            if request.get("jsonrpc") != "2.0":
-                self.logger.warning(f"⚠️  Non-standard jsonrpc version: {request.get('jsonrpc')}")
-            else:
-                self.logger.info("✅ JSON-RPC 2.0 version confirmed")
-        
-        try:
-            if method == "initialize":
-                self.logger.info("=" * 60)
-                self.logger.info("INITIALIZE REQUEST PROCESSING")
-                self.logger.info("=" * 60)
-                
-                # Log the full request details
-                self.logger.info(f"Initialize request received:")
-                self.logger.info(f"  Request ID: {request_id} (type: {type(request_id).__name__})")
-                self.logger.info(f"  Request method: {method}")
-                self.logger.info(f"  Request params: {json.dumps(params, indent=2)}")
-                self.logger.info(f"  Full request: {json.dumps(request, indent=2)}")
-                
-                # Initialize must have an ID (not a notification)
-                if is_notification:
-                    self.logger.error("Initialize request missing ID - this is invalid")
-                    self.logger.error("MCP initialize requests MUST have an ID field")
-                    return None  # Can't respond to a malformed initialize
-                
-                # Validate request structure
-                self.logger.info("Validating initialize request structure:")
-                
-                # Check required params
-                required_params = ["protocolVersion", "capabilities", "clientInfo"]
-                for param in required_params:
-                    if param in params:
-                        self.logger.info(f"  ✅ {param}: {type(params[param]).__name__}")
-                        if param == "protocolVersion":
-                            self.logger.info(f"     Protocol version: {params[param]}")
-                        elif param == "clientInfo":
-                            client_info = params[param]
-                            self.logger.info(f"     Client name: {client_info.get('name', 'unknown')}")
-                            self.logger.info(f"     Client version: {client_info.get('version', 'unknown')}")
-                        elif param == "capabilities":
-                            caps = params[param]
-                            self.logger.info(f"     Client capabilities: {list(caps.keys()) if isinstance(caps, dict) else 'invalid'}")
-                    else:
-                        self.logger.warning(f"  ⚠️  Missing parameter: {param}")
-                
-                # Build response
-                self.logger.info("Building initialize response:")
-                
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {
-                            "tools": {},
-                            "resources": {}
-                        },
-                        "serverInfo": {
-                            "name": self.name,
-                            "version": "0.2504.4"
-                        }
-                    }
-                }
-                
-                # Log response construction details
-                self.logger.info(f"Response structure built:")
-                self.logger.info(f"  Response ID: {response['id']} (type: {type(response['id']).__name__})")
-                self.logger.info(f"  Protocol version: {response['result']['protocolVersion']}")
-                self.logger.info(f"  Server name: {response['result']['serverInfo']['name']}")
-                self.logger.info(f"  Server version: {response['result']['serverInfo']['version']}")
-                self.logger.info(f"  Capabilities: {response['result']['capabilities']}")
-                
-                # Safety check: never send null ID
-                if response["id"] is None:
-                    self.logger.error(f"Response ID is None for {method} - this should not happen!")
-                    self.logger.error(f"Original request ID was: {request_id} (type: {type(request_id).__name__})")
-                    del response["id"]  # Remove the field entirely
-                
-                # Log the complete response
-                self.logger.info("Complete initialize response:")
-                self.logger.info(json.dumps(response, indent=2))
-                
-                # Log serialized response (as it will be sent over STDIO)
-                try:
-                    serialized_response = json.dumps(response, ensure_ascii=False, separators=(',', ':'))
-                    self.logger.info(f"Serialized response ({len(serialized_response)} bytes):")
-                    self.logger.info(serialized_response)
-                    
-                    # Validate serialized response can be parsed back
-                    try:
-                        parsed_back = json.loads(serialized_response)
-                        self.logger.info("✅ Response JSON serialization/parsing validation successful")
-                    except json.JSONDecodeError as json_err:
-                        self.logger.error(f"❌ Response JSON validation failed: {json_err}")
-                        
-                except Exception as serialize_err:
-                    self.logger.error(f"❌ Response serialization failed: {serialize_err}")
-                
-                # Log ID consistency check
-                if request.get("id") == response.get("id"):
-                    self.logger.info(f"✅ ID consistency verified: {request.get('id')} == {response.get('id')}")
-                else:
-                    self.logger.error(f"❌ ID mismatch: request={request.get('id')} != response={response.get('id')}")
-                
-                self.logger.info("=" * 60)
-                self.logger.info("INITIALIZE REQUEST PROCESSING COMPLETE")
-                self.logger.info("=" * 60)
-                
-                return response
-            
-            elif method == "tools/list":
-                # tools/list must have an ID (not a notification)
-                if is_notification:
-                    self.logger.error("tools/list request missing ID - this is invalid")
-                    return None
-                
-                tools_list = []
-                for tool_name, tool_func in self.tools.items():
-                    # Extract docstring and create tool definition
-                    doc = tool_func.__doc__ or f"{tool_name} tool"
-                    
-                    # Create proper input schema based on tool name
-                    schema_wrapper = self._get_tool_schema(tool_name)
-                    
-                    # Extract the actual schema from the wrapper (MCP Inspector compatible)
-                    if schema_wrapper and isinstance(schema_wrapper, dict):
-                        # Get the first (and should be only) key from the wrapper
-                        input_schema_key = next(iter(schema_wrapper.keys()))
-                        input_schema = schema_wrapper[input_schema_key]
-                    else:
-                        # Fallback to empty schema
-                        input_schema = {
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    
-                    tools_list.append({
-                        "name": tool_name,
-                        "description": doc.split('\n')[0].strip(),
-                        "inputSchema": input_schema
-                    })
-                
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {"tools": tools_list}
-                }
-                
-                # Safety check: never send null ID
-                if response["id"] is None:
-                    self.logger.error(f"Response ID is None for {method} - this should not happen!")
-                    del response["id"]
-                
-                return response
-            
-            elif method == "tools/call":
-                # tools/call must have an ID (not a notification)
-                if is_notification:
-                    self.logger.error("tools/call request missing ID - this is invalid")
-                    return None
-                
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-                
-                if tool_name in self.tools:
-                    # Handle MCP Inspector wrapped parameters format
-                    # Check if arguments contain a single key that matches our expected input wrapper
-                    schema_wrapper = self._get_tool_schema(tool_name)
-                    if schema_wrapper and isinstance(schema_wrapper, dict) and len(arguments) == 1:
-                        # Get the expected wrapper key name
-                        expected_wrapper_key = next(iter(schema_wrapper.keys()))
-                        actual_key = next(iter(arguments.keys()))
-                        
-                        # If the argument key matches our wrapper key, unwrap it
-                        if actual_key == expected_wrapper_key and isinstance(arguments[actual_key], dict):
-                            self.logger.debug(f"Unwrapping MCP Inspector format parameters for {tool_name}")
-                            arguments = arguments[actual_key]
-                        # Otherwise, check if it's the old direct format by looking for expected parameters
-                        elif any(key in arguments for key in ['number', 'name', 'query', 'working_group']):
-                            self.logger.debug(f"Using direct parameter format for {tool_name}")
-                            # Keep arguments as-is for backward compatibility
-                        else:
-                            self.logger.debug(f"Unknown parameter format for {tool_name}, trying as-is")
-                    
-                    # Pass request_id to tools that support progress notifications
-                    if tool_name in ['get_internet_draft', 'get_rfc', 'get_openid_spec', 'search_openid_specs']:
-                        arguments['_request_id'] = request_id
-                        arguments['_progress_callback'] = self.send_progress_notification
-                    
-                    result = await self.tools[tool_name](**arguments)
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "content": [{
-                                "type": "text",
-                                "text": str(result)
-                            }]
-                        }
-                    }
-                    
-                    # Safety check: never send null ID
-                    if response["id"] is None:
-                        self.logger.error(f"Response ID is None for {method}/{tool_name} - this should not happen!")
-                        del response["id"]
-                    
-                    return response
-                else:
-                    raise Exception(f"Unknown tool: {tool_name}")
-            
-            elif method == "notifications/initialized":
-                # This is a notification sent by the client after receiving initialize response
-                # It should not have an ID (it's a notification, not a request)
-                self.logger.info("📢 NOTIFICATIONS/INITIALIZED RECEIVED")
-                self.logger.info("Client has confirmed initialization is complete")
-                
-                if not is_notification:
-                    self.logger.warning(f"notifications/initialized should be a notification (no ID), but received ID: {request_id}")
-                
-                # Log the notification details
-                self.logger.info(f"Initialization notification params: {params}")
-                
-                # Notifications don't require a response
-                self.logger.info("✅ Client initialization confirmed - server is ready for requests")
-                return None  # No response for notifications
-            
-            elif method.startswith("notifications/"):
-                # Handle other MCP notifications
-                self.logger.info(f"📢 NOTIFICATION RECEIVED: {method}")
-                self.logger.info(f"Notification params: {params}")
-                
-                if not is_notification:
-                    self.logger.warning(f"Notification {method} should not have an ID, but received ID: {request_id}")
-                
-                # Common MCP notifications that we can acknowledge but don't need to act on
-                known_notifications = [
-                    "notifications/cancelled",
-                    "notifications/progress",
-                    "notifications/message",
-                    "notifications/resources/updated",
-                    "notifications/tools/updated"
-                ]
-                
-                if method in known_notifications:
-                    self.logger.info(f"✅ Acknowledged known notification: {method}")
-                else:
-                    self.logger.info(f"ℹ️  Received unknown notification: {method} (ignoring)")
-                
-                return None  # No response for notifications
-            
-            else:
-                raise Exception(f"Unknown method: {method}")
-        
-        except Exception as e:
-            # Enhanced error logging for initialize requests
-            if method == "initialize":
-                self.logger.error("❌ INITIALIZE REQUEST FAILED")
-                self.logger.error("=" * 50)
-                self.logger.error(f"Initialize request processing failed: {str(e)}")
-                self.logger.error(f"Request ID: {request_id}")
-                self.logger.error(f"Request params: {params}")
-                self.logger.error(f"Full request: {request}")
-                self.logger.error("Stack trace:", exc_info=True)
-                self.logger.error("=" * 50)
-            else:
-                self.logger.error(f"Error handling request {method}: {str(e)}", exc_info=True)
-            
-            # Create error response with proper ID handling
-            error_response = {
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32603,
-                    "message": str(e)
-                }
-            }
-            
-            # Only add ID if the original request had one and it's not None
-            if not is_notification and request_id is not None:
-                error_response["id"] = request_id
-                self.logger.debug(f"Adding ID {request_id} to error response")
-            else:
-                self.logger.debug(f"Not adding ID to error response (is_notification: {is_notification}, request_id: {request_id})")
-            
-            # Log error response for initialize requests
-            if method == "initialize":
-                self.logger.error("Initialize error response being sent:")
-                self.logger.error(json.dumps(error_response, indent=2))
-            
-            return error_response
-    
-    async def run_stdio(self):
-        """Run server in stdio mode"""
-        self._current_mode = 'stdio'
-        connection_id = f"stdio_{int(time.time())}"
-        self.logger.info(f"Starting RFC MCP Server in stdio mode (Connection ID: {connection_id})")
-        self.logger.info(f"Connection details - PID: {os.getpid()}, stdin: {sys.stdin}, stdout: {sys.stdout}")
-        print("RFC MCP Server running on stdio", file=sys.stderr)
-        
-        request_count = 0
-        last_activity = time.time()
-        
-        while True:
-            try:
-                self.logger.debug(f"Waiting for input (Connection: {connection_id}, Requests processed: {request_count})")
-                
-                # Check if stdin is still available
-                if sys.stdin.closed:
-                    self.logger.error(f"STDIN is closed (Connection: {connection_id})")
-                    break
-                
-                if sys.stdout.closed:
-                    self.logger.error(f"STDOUT is closed (Connection: {connection_id})")
-                    break
-                
-                line = input()
-                current_time = time.time()
-                time_since_last = current_time - last_activity
-                last_activity = current_time
-                request_count += 1
-                
-                self.logger.info(f"Received request #{request_count} (Connection: {connection_id}, Time since last: {time_since_last:.2f}s)")
-                
-                if not line.strip():
-                    self.logger.debug(f"Empty line received, skipping (Connection: {connection_id})")
-                    continue
-                
-                self.logger.debug(f"Processing input: {line[:100]}... (Connection: {connection_id})")
-                
-                try:
-                    request = json.loads(line)
-                    self.logger.debug(f"JSON parsed successfully (Connection: {connection_id})")
-                    self.logger.debug(f"Parsed request: {request}")
-                    
-                    # Validate basic request structure
-                    if not isinstance(request, dict):
-                        self.logger.error(f"Request is not a dict: {type(request)}")
-                        continue
-                    
-                    if "method" not in request:
-                        self.logger.error(f"Request missing method field: {request}")
-                        continue
-                        
-                except json.JSONDecodeError as json_err:
-                    self.logger.error(f"JSON parse error (Connection: {connection_id}): {str(json_err)}")
-                    self.logger.error(f"Problematic input: {line}")
-                    continue
-                
-                self.logger.debug(f"Handling request (Connection: {connection_id})")
-                response = await self.handle_request(request)
-                self.logger.debug(f"Request handled, preparing response (Connection: {connection_id})")
-                
-                # Debug: Log and validate the response immediately after handle_request
-                if response is not None:
-                    self.logger.debug(f"Response from handle_request: {response}")
-                    
-                    # Validate response structure
-                    if not isinstance(response, dict):
-                        self.logger.error(f"handle_request returned non-dict: {type(response)}")
-                        response = None
-                    elif "jsonrpc" not in response:
-                        self.logger.error(f"handle_request returned response without jsonrpc field")
-                        response = None
-                    elif "id" in response:
-                        self.logger.debug(f"Response ID from handle_request: {response['id']} (type: {type(response['id'])})")
-                        if response["id"] is None:
-                            self.logger.warning(f"handle_request returned response with null ID")
-                        elif not isinstance(response["id"], (str, int, float)):
-                            self.logger.error(f"handle_request returned response with invalid ID type: {type(response['id'])}")
-                            response = None
-                
-                # Only send response if it's not None (notifications don't require responses)
-                if response is not None:
-                    self.logger.debug(f"Preparing to send response (Connection: {connection_id})")
-                    try:
-                        # Check stdout status before serialization
-                        if sys.stdout.closed:
-                            self.logger.error(f"STDOUT closed before response serialization (Connection: {connection_id})")
-                            break
-                        
-                        # Validate response structure before serialization
-                        if not isinstance(response, dict):
-                            self.logger.error(f"Response is not a dict: {type(response)} - {response}")
-                            response = {
-                                "jsonrpc": "2.0",
-                                "error": {
-                                    "code": -32603,
-                                    "message": "Invalid response type"
-                                }
-                            }
-                        
-                        # Ensure response has required fields
-                        if "jsonrpc" not in response:
-                            response["jsonrpc"] = "2.0"
-                        
-                        # Validate ID field if present
-                        if "id" in response:
-                            if response["id"] is None:
-                                self.logger.warning(f"Response has null ID, removing it")
-                                del response["id"]
-                            elif not isinstance(response["id"], (str, int, float)):
-                                self.logger.error(f"Response has invalid ID type: {type(response['id'])} - {response['id']}")
-                                del response["id"]
-                        
-                        # Serialize with additional safety checks
-                        try:
-                            # Debug: Log the response object before serialization
-                            self.logger.debug(f"Response object before serialization: {response}")
-                            if isinstance(response, dict) and "id" in response:
-                                self.logger.debug(f"Response ID value: {response['id']} (type: {type(response['id'])})")
-                            
-                            response_str = json.dumps(response, ensure_ascii=False, separators=(',', ':'))
-                            response_size = len(response_str)
-                            self.logger.info(f"Response serialized: {response_size} bytes (Connection: {connection_id})")
-                            
-                            # Debug: Log the actual JSON string being sent
-                            self.logger.debug(f"JSON being sent: {response_str[:500]}...")
-                            
-                            # Final validation: ensure the JSON doesn't contain "undefined"
-                            if '"undefined"' in response_str:
-                                self.logger.error(f"Response contains 'undefined' string: {response_str}")
-                                # Create a safe fallback response
-                                safe_response = {
-                                    "jsonrpc": "2.0",
-                                    "error": {
-                                        "code": -32603,
-                                        "message": "Response validation failed"
-                                    }
-                                }
-                                response_str = json.dumps(safe_response, ensure_ascii=True)
-                                response_size = len(response_str)
-                                self.logger.info(f"Safe fallback response created: {response_size} bytes")
-                            
-                            # Validate the JSON can be parsed back
-                            json.loads(response_str)
-                            self.logger.debug(f"JSON validation passed (Connection: {connection_id})")
-                            
-                        except (UnicodeDecodeError, UnicodeEncodeError) as unicode_error:
-                            self.logger.error(f"Unicode encoding error in response (Connection: {connection_id}): {str(unicode_error)}")
-                            # Create a safe ASCII-only response
-                            response_str = json.dumps(response, ensure_ascii=True, separators=(',', ':'))
-                            response_size = len(response_str)
-                            self.logger.info(f"Fallback ASCII response created: {response_size} bytes (Connection: {connection_id})")
-                            
-                        except json.JSONDecodeError as json_decode_error:
-                            self.logger.error(f"JSON validation failed (Connection: {connection_id}): {str(json_decode_error)}")
-                            # Create minimal error response
-                            error_response = {
-                                "jsonrpc": "2.0",
-                                "error": {
-                                    "code": -32603,
-                                    "message": "Response contains invalid JSON characters"
-                                }
-                            }
-                            # Add ID only if we have one from the original response
-                            if isinstance(response, dict) and response.get("id") is not None:
-                                error_response["id"] = response["id"]
-                            response_str = json.dumps(error_response, ensure_ascii=True)
-                            response_size = len(response_str)
-                            self.logger.info(f"Safe error response created: {response_size} bytes (Connection: {connection_id})")
-                        
-                        # Debug: Check for potentially problematic characters
-                        preview = response_str[:200]
-                        problematic_chars = []
-                        for char in preview:
-                            if ord(char) < 32 and char not in ['\t', '\n', '\r']:
-                                problematic_chars.append(f"\\x{ord(char):02x}")
-                            elif ord(char) > 127:
-                                problematic_chars.append(f"\\u{ord(char):04x}")
-                        
-                        if problematic_chars:
-                            self.logger.warning(f"Found potentially problematic characters: {problematic_chars[:10]} (Connection: {connection_id})")
-                        
-                        self.logger.debug(f"Response preview: {preview}...")
-                        
-                        # Check for large responses that might cause stdio issues
-                        if response_size > 100 * 1024:  # 100KB - much more conservative limit
-                            self.logger.warning(f"Large response detected: {response_size} bytes - truncating for stdio transport (Connection: {connection_id})")
-                            # Truncate the response if it's too large
-                            if isinstance(response, dict) and "result" in response and "content" in response["result"]:
-                                content_list = response["result"]["content"]
-                                if content_list and "text" in content_list[0]:
-                                    result_content = content_list[0]["text"]
-                                    # More aggressive truncation for stdio
-                                    max_content_size = 50000  # 50KB limit for content
-                                    if len(result_content) > max_content_size:
-                                        truncated_content = result_content[:max_content_size] + "\n\n[TRUNCATED: Response too large for stdio transport]"
-                                        response["result"]["content"][0]["text"] = truncated_content
-                                        response_str = json.dumps(response, ensure_ascii=True)
-                                        response_size = len(response_str)
-                                        self.logger.info(f"Response truncated to {response_size} bytes (Connection: {connection_id})")
-                        
-                        # Final size check - if still too large, create a minimal error response
-                        if response_size > 200 * 1024:  # 200KB absolute limit
-                            self.logger.error(f"Response still too large after truncation: {response_size} bytes - creating minimal response (Connection: {connection_id})")
-                            minimal_response = {
-                                "jsonrpc": "2.0",
-                                "error": {
-                                    "code": -32603,
-                                    "message": f"Response too large for stdio transport ({response_size} bytes). Try using HTTP mode or request metadata format only."
-                                }
-                            }
-                            # Add ID only if we have one from the original response
-                            if isinstance(response, dict) and response.get("id") is not None:
-                                minimal_response["id"] = response["id"]
-                            response_str = json.dumps(minimal_response, ensure_ascii=True)
-                            response_size = len(response_str)
-                            self.logger.info(f"Minimal error response created: {response_size} bytes (Connection: {connection_id})")
-                        
-                        # Check stdout status before writing
-                        if sys.stdout.closed:
-                            self.logger.error(f"STDOUT closed before writing response (Connection: {connection_id})")
-                            break
-                        
-                        # Attempt to write response with detailed error handling
-                        try:
-                            # Final safety check - ensure response is stdio-safe
-                            try:
-                                # Test if the response can be safely printed
-                                test_output = str(response_str)
-                                test_output.encode('utf-8')
-                                self.logger.debug(f"Response passed final safety check (Connection: {connection_id})")
-                            except Exception as safety_error:
-                                self.logger.error(f"Response failed safety check (Connection: {connection_id}): {str(safety_error)}")
-                                # Create ultra-safe ASCII response
-                                safe_response = {
-                                    "jsonrpc": "2.0",
-                                    "error": {
-                                        "code": -32603,
-                                        "message": "Response contains unsafe characters for stdio transport"
-                                    }
-                                }
-                                # Add ID only if we have one from the original response
-                                if isinstance(response, dict) and response.get("id") is not None:
-                                    safe_response["id"] = response["id"]
-                                response_str = json.dumps(safe_response, ensure_ascii=True)
-                                response_size = len(response_str)
-                                self.logger.info(f"Ultra-safe response created: {response_size} bytes (Connection: {connection_id})")
-                            
-                            self.logger.debug(f"Writing {response_size} byte response to stdout (Connection: {connection_id})")
-                            
-                            # Special logging for initialize responses
-                            if isinstance(response, dict) and response.get("result", {}).get("protocolVersion"):
-                                self.logger.info("📤 SENDING INITIALIZE RESPONSE")
-                                self.logger.info("=" * 50)
-                                self.logger.info(f"Initialize response being sent to client:")
-                                self.logger.info(f"  Response size: {response_size} bytes")
-                                self.logger.info(f"  Response ID: {response.get('id')} (type: {type(response.get('id')).__name__})")
-                                self.logger.info(f"  Protocol version: {response.get('result', {}).get('protocolVersion')}")
-                                self.logger.info(f"  Raw JSON being sent:")
-                                self.logger.info(f"  {response_str}")
-                                self.logger.info("=" * 50)
-                            
-                            # Write the response
-                            print(response_str)
-                            self.logger.debug(f"Response written to stdout buffer (Connection: {connection_id})")
-                            
-                            # Flush stdout
-                            self.logger.debug(f"Flushing stdout buffer (Connection: {connection_id})")
-                            sys.stdout.flush()
-                            self.logger.debug(f"Stdout buffer flushed successfully (Connection: {connection_id})")
-                            
-                            # Special confirmation for initialize responses
-                            if isinstance(response, dict) and response.get("result", {}).get("protocolVersion"):
-                                self.logger.info("✅ INITIALIZE RESPONSE SENT SUCCESSFULLY")
-                                self.logger.info(f"Client should now be initialized with protocol version {response.get('result', {}).get('protocolVersion')}")
-                            
-                            self.logger.info(f"Response sent successfully for request #{request_count} (Connection: {connection_id})")
-                            
-                        except BrokenPipeError as pipe_error:
-                            self.logger.error(f"Broken pipe during response transmission (Connection: {connection_id}): {str(pipe_error)}")
-                            self.logger.error(f"Client likely disconnected while receiving {response_size} byte response")
-                            break
-                        except IOError as io_error:
-                            self.logger.error(f"IO error during response transmission (Connection: {connection_id}): {str(io_error)}")
-                            self.logger.error(f"Error details: errno={getattr(io_error, 'errno', 'unknown')}")
-                            break
-                        except OSError as os_error:
-                            self.logger.error(f"OS error during response transmission (Connection: {connection_id}): {str(os_error)}")
-                            self.logger.error(f"OS error details: errno={getattr(os_error, 'errno', 'unknown')}")
-                            if os_error.errno == 32:  # EPIPE
-                                self.logger.error("Broken pipe (EPIPE) - client disconnected during response")
-                            break
-                        except Exception as write_error:
-                            self.logger.error(f"Unexpected error during response transmission (Connection: {connection_id}): {str(write_error)}", exc_info=True)
-                            break
-                            
-                    except BrokenPipeError as pipe_error:
-                        self.logger.error(f"Broken pipe error - client disconnected (Connection: {connection_id}): {str(pipe_error)}")
-                        break
-                    except IOError as io_error:
-                        self.logger.error(f"IO error during response transmission (Connection: {connection_id}): {str(io_error)}")
-                        break
-                    except Exception as json_error:
-                        self.logger.error(f"Error serializing/sending response (Connection: {connection_id}): {str(json_error)}", exc_info=True)
-                        try:
-                            error_response = {
-                                "jsonrpc": "2.0",
-                                "error": {
-                                    "code": -32603,
-                                    "message": f"Response serialization error: {str(json_error)}"
-                                }
-                            }
-                            # Add ID only if we have one from the original response
-                            if isinstance(response, dict) and response.get("id") is not None:
-                                error_response["id"] = response["id"]
-                            print(json.dumps(error_response, ensure_ascii=True))
-                            sys.stdout.flush()
-                            self.logger.info(f"Error response sent (Connection: {connection_id})")
-                        except Exception as error_send_error:
-                            self.logger.error(f"Failed to send error response (Connection: {connection_id}): {str(error_send_error)}")
-                            break
-                else:
-                    self.logger.debug(f"No response needed for request #{request_count} (notification) (Connection: {connection_id})")
-                
-            except EOFError as eof_error:
-                self.logger.info(f"Received EOF - client closed connection (Connection: {connection_id}): {str(eof_error)}")
-                self.logger.info(f"Connection stats - Requests processed: {request_count}, Duration: {time.time() - (last_activity - time_since_last if 'time_since_last' in locals() else 0):.2f}s")
-                break
-            except KeyboardInterrupt as kb_interrupt:
-                self.logger.info(f"Keyboard interrupt received (Connection: {connection_id}): {str(kb_interrupt)}")
-                break
-            except BrokenPipeError as pipe_error:
-                self.logger.error(f"Broken pipe in main loop - client disconnected abruptly (Connection: {connection_id}): {str(pipe_error)}")
-                break
-            except ConnectionResetError as conn_reset:
-                self.logger.error(f"Connection reset by peer (Connection: {connection_id}): {str(conn_reset)}")
-                break
-            except OSError as os_error:
-                self.logger.error(f"OS error in stdio loop (Connection: {connection_id}): {str(os_error)}")
-                if os_error.errno == 32:  # EPIPE
-                    self.logger.error("Broken pipe detected - client disconnected")
-                break
-            except Exception as e:
-                self.logger.error(f"Unexpected error in stdio loop (Connection: {connection_id}): {str(e)}", exc_info=True)
-                self.logger.error(f"Error type: {type(e).__name__}")
-                
-                # Try to send error response if possible
-                try:
-                    if not sys.stdout.closed:
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "error": {
-                                "code": -32603,
-                                "message": f"Server error: {str(e)}"
-                            }
-                        }
-                        print(json.dumps(error_response, ensure_ascii=True))
-                        sys.stdout.flush()
-                        self.logger.info(f"Error response sent for unexpected error (Connection: {connection_id})")
-                except Exception as error_send_error:
-                    self.logger.error(f"Failed to send error response for unexpected error (Connection: {connection_id}): {str(error_send_error)}")
-                
-                # Continue processing unless it's a critical error
-                if isinstance(e, (SystemExit, KeyboardInterrupt)):
-                    break
-        
-        # Connection cleanup logging
-        final_time = time.time()
-        total_duration = final_time - (last_activity - time_since_last if 'time_since_last' in locals() else final_time)
-        
-        self.logger.info(f"STDIO connection closed (Connection: {connection_id})")
-        self.logger.info(f"Final connection stats:")
-        self.logger.info(f"  - Total requests processed: {request_count}")
-        self.logger.info(f"  - Connection duration: {total_duration:.2f} seconds")
-        self.logger.info(f"  - Average request rate: {request_count/max(total_duration, 1):.2f} req/sec")
-        self.logger.info(f"  - STDIN status: {'closed' if sys.stdin.closed else 'open'}")
-        self.logger.info(f"  - STDOUT status: {'closed' if sys.stdout.closed else 'open'}")
-        self.logger.info(f"  - Process PID: {os.getpid()}")
-    
-    def run_http(self, port: int = 3000):
-        """Run server in HTTP mode"""
-        self.logger.info(f"Starting RFC MCP Server in HTTP mode on port {port}")
-        
-        class MCPHTTPHandler(BaseHTTPRequestHandler):
-            def __init__(self, mcp_server, *args, **kwargs):
-                self.mcp_server = mcp_server
-                super().__init__(*args, **kwargs)
-            
-            def do_OPTIONS(self):
-                """Handle CORS preflight requests"""
-                self.mcp_server.logger.debug(f"OPTIONS request from {self.client_address[0]}")
-                self.send_response(200)
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-                self.end_headers()
-            
-            def do_GET(self):
-                """Handle GET requests"""
-                client_info = f"{self.client_address[0]}:{self.client_address[1]}"
-                self.mcp_server.logger.info(f"HTTP GET {self.path} from {client_info}")
-                self.mcp_server.logger.debug(f"HTTP headers: {dict(self.headers)}")
-                
-                if self.path == '/' or self.path == '/health':
-                    # Health check endpoint
-                    response_data = {
-                        "status": "ok",
-                        "name": "Standards Finder - RFC, Internet Draft, and OpenID Server",
-                        "version": "0.2504.4",
-                        "transport": "http",
-                        "endpoints": {
-                            "mcp": "/mcp (POST)",
-                            "message": "/message (POST) - SSE compatible",
-                            "health": "/health (GET)"
-                        }
-                    }
-                    
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(response_data).encode())
-                elif self.path == '/sse' or self.path.startswith('/sse/'):
-                    # SSE endpoint for MCP Inspector compatibility
-                    self.mcp_server.logger.info(f"SSE connection request ({client_info})")
-                    
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'text/event-stream')
-                    self.send_header('Cache-Control', 'no-cache')
-                    self.send_header('Connection', 'keep-alive')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                    self.end_headers()
-                    
-                    # Send initial SSE connection established event
-                    sse_data = "event: connected\ndata: {\"status\": \"connected\"}\n\n"
-                    self.wfile.write(sse_data.encode())
-                    self.wfile.flush()
-                    
-                    # Keep connection alive (simplified - real SSE would need proper handling)
-                    self.mcp_server.logger.info(f"SSE connection established ({client_info})")
-                else:
-                    self.send_response(404)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    error_response = {
-                        "error": "Not Found",
-                        "message": f"Path '{self.path}' not found. Available paths: /, /health, /mcp, /message",
-                        "available_paths": ["/", "/health", "/mcp", "/message", "/sse"]
-                    }
-                    self.wfile.write(json.dumps(error_response).encode())
-            
-            def do_POST(self):
-                """Handle POST requests"""
-                client_info = f"{self.client_address[0]}:{self.client_address[1]}"
-                request_start = time.time()
-                self.mcp_server.logger.info(f"HTTP POST {self.path} from {client_info}")
-                
-                if self.path == '/mcp' or self.path == '/message':
-                    endpoint_type = "SSE-compatible" if self.path == '/message' else "standard MCP"
-                    self.mcp_server.logger.debug(f"{endpoint_type} request to {self.path} ({client_info})")
-                    
-                    try:
-                        # Read request body with error handling
-                        content_length = int(self.headers.get('Content-Length', 0))
-                        
-                        if content_length == 0:
-                            self.mcp_server.logger.info(f"Empty request body - treating as connection test ({client_info})")
-                            self.send_response(200)
-                            self.send_header('Content-Type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            health_response = {
-                                "status": "ok",
-                                "message": "MCP server is running",
-                                "transport": "http",
-                                "endpoint": self.path
-                            }
-                            self.wfile.write(json.dumps(health_response).encode())
-                            return
-                        
-                        body = self.rfile.read(content_length).decode('utf-8')
-                        
-                        if not body.strip():
-                            self.mcp_server.logger.info(f"Whitespace-only request body - treating as connection test ({client_info})")
-                            self.send_response(200)
-                            self.send_header('Content-Type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            health_response = {
-                                "status": "ok",
-                                "message": "MCP server is running",
-                                "transport": "http",
-                                "endpoint": self.path
-                            }
-                            self.wfile.write(json.dumps(health_response).encode())
-                            return
-                        
-                        self.mcp_server.logger.debug(f"Received HTTP request body ({len(body)} bytes): {body[:200]}...")
-                        
-                        # Parse JSON request
-                        request = json.loads(body)
-                        
-                        # Process request asynchronously
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        response = loop.run_until_complete(self.mcp_server.handle_request(request))
-                        loop.close()
-                        
-                        # Handle response
-                        if response is not None:
-                            response_json = json.dumps(response)
-                            response_size = len(response_json)
-                            processing_time = time.time() - request_start
-                            
-                            self.mcp_server.logger.info(f"HTTP response ready: {response_size} bytes, processed in {processing_time:.2f}s ({client_info})")
-                            self.mcp_server.logger.debug(f"Response preview: {response_json[:200]}...")
-                            
-                            self.send_response(200)
-                            self.send_header('Content-Type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(response_json.encode())
-                            
-                            self.mcp_server.logger.info(f"HTTP response sent successfully ({client_info})")
-                        else:
-                            # For notifications
-                            processing_time = time.time() - request_start
-                            self.mcp_server.logger.info(f"HTTP notification processed in {processing_time:.2f}s ({client_info})")
-                            
-                            notification_response = {
-                                "status": "ok",
-                                "message": "Notification processed"
-                            }
-                            
-                            self.send_response(200)
-                            self.send_header('Content-Type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(json.dumps(notification_response).encode())
-                    
-                    except json.JSONDecodeError as json_err:
-                        self.mcp_server.logger.error(f"JSON parse error ({client_info}): {str(json_err)}")
-                        self.send_response(400)
-                        self.send_header('Content-Type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "error": {
-                                "code": -32700,
-                                "message": f"Parse error: {str(json_err)}"
-                            }
-                        }
-                        self.wfile.write(json.dumps(error_response).encode())
-                    
-                    except Exception as e:
-                        processing_time = time.time() - request_start
-                        self.mcp_server.logger.error(f"Error processing HTTP request from {client_info} after {processing_time:.2f}s: {str(e)}", exc_info=True)
-                        
-                        self.send_response(500)
-                        self.send_header('Content-Type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "error": {
-                                "code": -32603,
-                                "message": f"Server error: {str(e)}"
-                            }
-                        }
-                        self.wfile.write(json.dumps(error_response).encode())
-                        
-                    except Exception as e:
-                        self.mcp_server.logger.error(f"Error processing HTTP request: {str(e)}", exc_info=True)
-                        
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "error": {
-                                "code": -32603,
-                                "message": f"Server error: {str(e)}"
-                            }
-                        }
-                        
-                        self.send_response(500)
-                        self.send_header('Content-Type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(error_response).encode())
-                else:
-                    self.send_response(404)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    error_response = {
-                        "error": "Not Found",
-                        "message": f"Path '{self.path}' not found. Available paths: /, /health, /mcp, /message",
-                        "available_paths": ["/", "/health", "/mcp", "/message", "/sse"]
-                    }
-                    self.wfile.write(json.dumps(error_response).encode())
-            
-            def log_message(self, format, *args):
-                """Override to use our logger"""
-                self.mcp_server.logger.debug(f"HTTP: {format % args}")
-        
-        # Create handler with MCP server reference
-        def handler_factory(*args, **kwargs):
-            return MCPHTTPHandler(self, *args, **kwargs)
-        
-        # Start HTTP server
-        server = HTTPServer(('localhost', port), handler_factory)
-        print(f"RFC MCP Server running on HTTP port {port}", file=sys.stderr)
-        print(f"Health check: http://localhost:{port}/health", file=sys.stderr)
-        print(f"MCP endpoint: http://localhost:{port}/mcp", file=sys.stderr)
-        
-        try:
-            server.serve_forever()
-        except KeyboardInterrupt:
-            print("\nShutting down HTTP server...", file=sys.stderr)
-            server.shutdown()
-
-
-# Simple HTML parser for extracting content
-class SimpleHTMLParser(HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.text_content = []
-        self.current_tag = None
-        self.title = ""
-        self.in_title = False
-    
-    def handle_starttag(self, tag, attrs):
-        self.current_tag = tag
-        if tag == 'title':
-            self.in_title = True
-    
-    def handle_endtag(self, tag):
-        if tag == 'title':
-            self.in_title = False
-        self.current_tag = None
-    
-    def handle_data(self, data):
-        if self.in_title:
-            self.title += data.strip()
-        self.text_content.append(data.strip())
-    
-    def get_text(self):
-        return ' '.join(filter(None, self.text_content))
-
-
-# Cache for storing fetched documents
-document_cache: Dict[str, Any] = {}
-
-def setup_logging(log_dir: str = "/tmp/rfc_server", log_level: str = "INFO") -> logging.Logger:
-    """Setup logging with rotation and instance-specific files"""
-    
-    # Create log directory if it doesn't exist
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Create instance-specific log filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    pid = os.getpid()
-    log_filename = f"rfc_server_{timestamp}_{pid}.log"
-    log_path = os.path.join(log_dir, log_filename)
-    
-    # Create logger
-    logger = logging.getLogger('rfc_server')
-    logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Clear any existing handlers
-    logger.handlers.clear()
-    
-    # Create rotating file handler (10MB max, keep 5 files)
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_path,
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
-    )
-    
-    # Create console handler for errors
-    console_handler = logging.StreamHandler(sys.stderr)
-    console_handler.setLevel(logging.WARNING)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-    )
-    
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
-    # Log startup information
-    logger.info(f"RFC MCP Server starting - PID: {pid}")
-    logger.info(f"Log file: {log_path}")
-    logger.info(f"Log level: {log_level}")
-    logger.info(f"Python version: {sys.version}")
-    
-    return logger
-
-# Global logger instance
-logger = setup_logging()
-
-class SimpleRFCService:
-    """Simplified RFC service using only standard library"""
-    
-    BASE_URL = "https://www.ietf.org/rfc"
-    
-    def __init__(self):
-        self.logger = logging.getLogger('rfc_server.rfc_service')
-    
-    def fetch_url(self, url: str) -> str:
-        """Fetch content from URL"""
-        try:
-            with urllib.request.urlopen(url, timeout=30) as response:
-                return response.read().decode('utf-8')
-        except Exception as e:
-            raise Exception(f"Failed to fetch {url}: {str(e)}")
-    
-    async def fetch_rfc(self, rfc_number: str) -> Dict[str, Any]:
-        """Fetch an RFC document by its number"""
-        self.logger.info(f"Fetching RFC {rfc_number}")
-        
-        cache_key = f"rfc_{rfc_number}"
-        if cache_key in document_cache:
-            self.logger.debug(f"RFC {rfc_number} found in cache")
-            return document_cache[cache_key]
-        
-        # Try TXT format (more reliable)
-        txt_url = f"{self.BASE_URL}/rfc{rfc_number}.txt"
-        self.logger.debug(f"Fetching RFC from URL: {txt_url}")
-        
-        try:
-            txt_content = self.fetch_url(txt_url)
-            self.logger.info(f"Successfully fetched RFC {rfc_number} ({len(txt_content)} bytes)")
-            
-            rfc_data = self._parse_txt_rfc(txt_content, rfc_number, txt_url)
-            document_cache[cache_key] = rfc_data
-            
-            self.logger.debug(f"Parsed RFC {rfc_number}: {len(rfc_data['sections'])} sections")
-            return rfc_data
-        except Exception as e:
-            self.logger.error(f"Failed to fetch RFC {rfc_number}: {str(e)}")
-            raise Exception(f"Failed to fetch RFC {rfc_number}: {str(e)}")
-    
-    async def search_rfcs(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search for RFCs using the RFC Editor search API"""
-        self.logger.info(f"Searching RFCs for query: {query}")
-        
-        try:
-            # Use the RFC Editor search API
-            search_url = f"https://www.rfc-editor.org/search/rfc_search_detail.php?title={urllib.parse.quote(query)}&pubstatus%5B%5D=Any&pub_date_type=any"
-            self.logger.debug(f"RFC search URL: {search_url}")
-            
-            html_content = self.fetch_url(search_url)
-            results = self._parse_rfc_search_results(html_content)
-            
-            self.logger.info(f"RFC search found {len(results)} results")
-            return results[:limit]
-            
-        except Exception as e:
-            self.logger.error(f"RFC search failed: {str(e)}")
-            # Don't return mock data - return empty list if search fails
-            return []
-    
-    def _parse_rfc_search_results(self, html: str) -> List[Dict[str, Any]]:
-        """Parse RFC search results from HTML"""
-        results = []
-        
-        try:
-            # Look for table rows with RFC data
-            # The RFC Editor search returns results in a table
-            import re
-            
-            # Find all table rows that contain RFC information
-            row_pattern = r'<tr[^>]*>.*?</tr>'
-            rows = re.findall(row_pattern, html, re.DOTALL | re.IGNORECASE)
-            
-            for row in rows:
-                # Look for RFC number in the row
-                rfc_match = re.search(r'rfc(\d+)', row, re.IGNORECASE)
-                if not rfc_match:
-                    continue
-                
-                rfc_number = rfc_match.group(1)
-                
-                # Extract title - look for text in cells
-                cell_pattern = r'<td[^>]*>(.*?)</td>'
-                cells = re.findall(cell_pattern, row, re.DOTALL | re.IGNORECASE)
-                
-                if len(cells) >= 3:
-                    # Clean up HTML tags from cells
-                    clean_cells = []
-                    for cell in cells:
-                        clean_cell = re.sub(r'<[^>]+>', '', cell).strip()
-                        clean_cells.append(clean_cell)
-                    
-                    # Try to extract title (usually in second or third cell)
-                    title = ""
-                    for cell in clean_cells[1:4]:  # Check cells 1-3 for title
-                        if len(cell) > 10 and not cell.isdigit():  # Likely a title
-                            title = cell
-                            break
-                    
-                    if title:
-                        results.append({
-                            'number': rfc_number,
-                            'title': title,
-                            'authors': [],  # Would need more complex parsing
-                            'date': '',     # Would need more complex parsing
-                            'status': '',   # Would need more complex parsing
-                            'abstract': '',
-                            'url': f"https://www.rfc-editor.org/info/rfc{rfc_number}"
-                        })
-            
-            self.logger.debug(f"Parsed {len(results)} RFC search results")
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Failed to parse RFC search results: {str(e)}")
-            return []
-    
-    def _parse_txt_rfc(self, text: str, rfc_number: str, url: str) -> Dict[str, Any]:
-        """Parse RFC from TXT format"""
-        lines = text.split('\n')
-        
-        # Extract title - try multiple patterns
-        title = f"RFC {rfc_number}"
-        
-        # Pattern 1: Look for "Title:" field
-        title_match = re.search(r'(?:Title|Internet-Draft):\s*(.*?)(?:\r?\n\r?\n|\r?\n\s*\r?\n)', text, re.IGNORECASE)
-        if title_match:
-            title = title_match.group(1).strip()
-        else:
-            # Pattern 2: Look for RFC title in standard format
-            # Based on RFC 2616 format: title appears as a centered line after the header block
-            found_date = False
-            
-            for i, line in enumerate(lines[:50]):  # Check first 50 lines
-                line_stripped = line.strip()
-                
-                # Skip empty lines
-                if not line_stripped:
-                    continue
-                
-                # Look for date line (indicates end of header)
-                if re.match(r'^\w+\s+\d{4}$', line_stripped):
-                    found_date = True
-                    continue
-                
-                # After finding the date, look for the title
-                if found_date:
-                    # Skip "Status of this Memo" and similar section headers
-                    if any(skip in line_stripped.lower() for skip in [
-                        'status of this memo', 'copyright notice', 'abstract'
-                    ]):
-                        continue
-                    
-                    # Look for a substantial line that could be the title
-                    if (len(line_stripped) > 15 and 
-                        not line_stripped.isupper() and 
-                        len(line_stripped.split()) > 2 and
-                        not line_stripped.startswith('This document') and
-                        not line_stripped.startswith('Copyright')):
-                        title = line_stripped
-                        break
-            
-            # Pattern 3: Look for specific RFC title patterns if still not found
-            if title == f"RFC {rfc_number}":
-                # Look for lines that contain protocol names or common RFC terms
-                title_patterns = [
-                    r'^\s*([^.]*(?:Protocol|Transfer|Transport|System|Method|Format|Standard|Specification)[^.]*)\s*$',
-                    r'^\s*([A-Z][^.]*--[^.]*)\s*$',  # Pattern like "Hypertext Transfer Protocol -- HTTP/1.1"
-                    r'^\s*([A-Z][a-z].*[a-z])\s*$'   # Capitalized line ending with lowercase
-                ]
-                
-                for pattern in title_patterns:
-                    for line in lines[20:40]:  # Look in the likely title area
-                        line_stripped = line.strip()
-                        match = re.match(pattern, line_stripped)
-                        if match and len(line_stripped) > 15:
-                            title = line_stripped
-                            break
-                    if title != f"RFC {rfc_number}":
-                        break
-        
-        # Extract authors
-        authors = []
-        author_match = re.search(r'(?:Author|Authors):\s*(.*?)(?:\r?\n\r?\n|\r?\n\s*\r?\n)', text, re.IGNORECASE | re.DOTALL)
-        if author_match:
-            author_lines = author_match.group(1).split('\n')
-            for line in author_lines:
-                line = line.strip()
-                if line and not line.startswith('Authors:'):
-                    authors.append(line)
-        
-        # Extract abstract
-        abstract_match = re.search(r'(?:Abstract)\s*(?:\r?\n)+\s*(.*?)(?:\r?\n\r?\n|\r?\n\s*\r?\n)', text, re.IGNORECASE | re.DOTALL)
-        abstract = abstract_match.group(1).replace('\n', ' ').strip() if abstract_match else ""
-        
-        # Extract sections
-        sections = []
-        current_section = None
-        current_content = []
-        
-        section_regex = re.compile(r'^(?:\d+\.)+\s+(.+)$')
-        
-        for line in lines:
-            section_match = section_regex.match(line)
-            if section_match:
-                if current_section:
-                    sections.append({
-                        'title': current_section,
-                        'content': '\n'.join(current_content)
-                    })
-                current_section = section_match.group(1).strip()
-                current_content = []
-            elif current_section:
-                current_content.append(line)
-        
-        if current_section and current_content:
-            sections.append({
-                'title': current_section,
-                'content': '\n'.join(current_content)
-            })
-        
-        return {
-            'metadata': {
-                'number': rfc_number,
-                'title': title,
-                'authors': authors,
-                'date': '',
-                'status': '',
-                'abstract': abstract,
-                'url': url
-            },
-            'sections': sections,
-            'fullText': text
-        }
-
-
-class SimpleOpenIDService:
-    """OpenID Foundation drafts and standards service"""
-    
-    BASE_URL = "https://openid.net"
-    SPECS_URL = "https://openid.net/developers/specs"
-    
-    def __init__(self):
-        self.logger = logging.getLogger('rfc_server.openid_service')
-    
-    def fetch_url(self, url: str) -> str:
-        """Fetch content from URL"""
-        try:
-            with urllib.request.urlopen(url, timeout=30) as response:
-                return response.read().decode('utf-8')
-        except Exception as e:
-            raise Exception(f"Failed to fetch {url}: {str(e)}")
-    
-    async def fetch_openid_spec(self, spec_name: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
-        """Fetch an OpenID specification by name"""
-        self.logger.info(f"Fetching OpenID spec: {spec_name}")
-        
-        cache_key = f"openid_{spec_name}"
-        if cache_key in document_cache:
-            if progress_callback and request_id:
-                await progress_callback(request_id, 80, "Found in cache, retrieving...")
-            return document_cache[cache_key]
-        
-        if progress_callback and request_id:
-            await progress_callback(request_id, 20, "Searching OpenID specifications...")
-        
-        # Try to find the spec URL
-        spec_url = await self._find_spec_url(spec_name, request_id, progress_callback)
-        
-        if not spec_url:
-            raise Exception(f"Could not find OpenID specification: {spec_name}")
-        
-        if progress_callback and request_id:
-            await progress_callback(request_id, 50, f"Fetching specification from {spec_url}")
-        
-        try:
-            content = self.fetch_url(spec_url)
-            self.logger.info(f"Successfully fetched content from {spec_url}, length: {len(content)}")
-            
-            if progress_callback and request_id:
-                await progress_callback(request_id, 70, "Parsing specification content...")
-            
-            spec_data = self._parse_openid_spec(content, spec_name, spec_url)
-            self.logger.info(f"Successfully parsed OpenID spec {spec_name}")
-            document_cache[cache_key] = spec_data
-            return spec_data
-            
-        except Exception as e:
-            self.logger.error(f"Failed to fetch OpenID spec {spec_name}: {str(e)}")
-            raise Exception(f"Failed to fetch OpenID spec {spec_name}: {str(e)}")
-    
-    async def _find_spec_url(self, spec_name: str, request_id: str = None, progress_callback = None) -> Optional[str]:
-        """Find the URL for an OpenID specification"""
-        try:
-            if progress_callback and request_id:
-                await progress_callback(request_id, 25, "Fetching OpenID specs page...")
-            
-            # Fetch the main specs page
-            specs_content = self.fetch_url(self.SPECS_URL)
-            
-            if progress_callback and request_id:
-                await progress_callback(request_id, 35, "Searching for specification...")
-            
-            # Common OpenID spec patterns and their likely URLs
-            spec_patterns = {
-                'openid-connect-core': 'https://openid.net/specs/openid-connect-core-1_0.html',
-                'openid-connect-discovery': 'https://openid.net/specs/openid-connect-discovery-1_0.html',
-                'openid-connect-registration': 'https://openid.net/specs/openid-connect-registration-1_0.html',
-                'openid-connect-session': 'https://openid.net/specs/openid-connect-session-1_0.html',
-                'openid-connect-frontchannel': 'https://openid.net/specs/openid-connect-frontchannel-1_0.html',
-                'openid-connect-backchannel': 'https://openid.net/specs/openid-connect-backchannel-1_0.html',
-                'oauth-2.0-multiple-response-types': 'https://openid.net/specs/oauth-v2-multiple-response-types-1_0.html',
-                'oauth-2.0-form-post-response-mode': 'https://openid.net/specs/oauth-v2-form-post-response-mode-1_0.html',
-                'openid-financial-api-part-1': 'https://openid.net/specs/openid-financial-api-part-1-1_0.html',
-                'openid-financial-api-part-2': 'https://openid.net/specs/openid-financial-api-part-2-1_0.html',
-            }
-            
-            # Normalize spec name for lookup
-            normalized_name = spec_name.lower().replace('_', '-').replace(' ', '-')
-            
-            # Try direct pattern match first
-            if normalized_name in spec_patterns:
-                return spec_patterns[normalized_name]
-            
-            # Try partial matches
-            for pattern, url in spec_patterns.items():
-                if normalized_name in pattern or pattern in normalized_name:
-                    return url
-            
-            # Try to parse the specs page for links
-            import re
-            
-            # Look for links that might match the spec name
-            link_pattern = r'href=["\']([^"\']*\.html)["\'][^>]*>([^<]*)</a>'
-            links = re.findall(link_pattern, specs_content, re.IGNORECASE)
-            
-            for url, link_text in links:
-                if (normalized_name in link_text.lower() or 
-                    normalized_name in url.lower() or
-                    any(word in link_text.lower() for word in normalized_name.split('-') if len(word) > 3)):
-                    
-                    # Make URL absolute if relative
-                    if url.startswith('/'):
-                        return f"{self.BASE_URL}{url}"
-                    elif not url.startswith('http'):
-                        return f"{self.BASE_URL}/specs/{url}"
-                    else:
-                        return url
-            
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error finding spec URL for {spec_name}: {e}")
-            return None
-    
-    def _parse_openid_spec(self, content: str, spec_name: str, url: str) -> Dict[str, Any]:
-        """Parse OpenID specification content"""
-        
-        self.logger.debug(f"Parsing OpenID spec content, length: {len(content)}")
-        
-        # Try to extract title
-        title_match = re.search(r'<title[^>]*>([^<]+)</title>', content, re.IGNORECASE)
-        title = title_match.group(1).strip() if title_match else spec_name
-        self.logger.debug(f"Extracted title: {title}")
-        
-        # Try to extract abstract/introduction
-        abstract = ""
-        abstract_patterns = [
-            r'<div[^>]*class[^>]*abstract[^>]*>(.*?)</div>',
-            r'<section[^>]*id[^>]*abstract[^>]*>(.*?)</section>',
-            r'<h[12][^>]*>Abstract</h[12]>(.*?)(?=<h[12]|$)',
-            r'<h[12][^>]*>Introduction</h[12]>(.*?)(?=<h[12]|$)'
-        ]
-        
-        for pattern in abstract_patterns:
-            match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-            if match:
-                abstract_html = match.group(1)
-                # Clean HTML tags
-                abstract = re.sub(r'<[^>]+>', ' ', abstract_html).strip()
-                abstract = ' '.join(abstract.split())[:500]  # Limit length
-                break
-        
-        # Extract sections
-        sections = []
-        
-        # Look for section headings
-        section_patterns = [
-            r'<h([2-6])[^>]*id[^>]*=["\']*([^"\'>\s]+)[^>]*>([^<]+)</h\1>',
-            r'<h([2-6])[^>]*>(\d+\.?\d*\.?\s*[^<]+)</h\1>'
-        ]
-        
-        for pattern in section_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                groups = match.groups()
-                level = int(groups[0])
-                
-                if len(groups) >= 3:
-                    # Pattern with id attribute
-                    section_id = groups[1]
-                    section_title = groups[2].strip()
-                else:
-                    # Pattern without id
-                    section_id = ""
-                    section_title = groups[1].strip() if len(groups) > 1 else ""
-                
-                # Extract content after this heading until next heading of same or higher level
-                start_pos = match.end()
-                next_heading_pattern = f'<h[1-{level}][^>]*>'
-                next_match = re.search(next_heading_pattern, content[start_pos:], re.IGNORECASE)
-                
-                if next_match:
-                    section_content = content[start_pos:start_pos + next_match.start()]
-                else:
-                    section_content = content[start_pos:start_pos + 2000]  # Limit content
-                
-                # Clean HTML from content
-                clean_content = re.sub(r'<[^>]+>', ' ', section_content).strip()
-                clean_content = ' '.join(clean_content.split())[:1000]  # Limit length
-                
-                sections.append({
-                    'title': section_title,
-                    'content': clean_content,
-                    'level': level,
-                    'id': section_id
-                })
-        
-        # Extract authors if available
-        authors = []
-        author_patterns = [
-            r'<meta[^>]*name[^>]*author[^>]*content[^>]*=["\']*([^"\']+)',
-            r'<div[^>]*class[^>]*author[^>]*>([^<]+)</div>',
-            r'Author[s]?:\s*([^<\n]+)'
-        ]
-        
-        for pattern in author_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                author = match.group(1).strip()
-                if author and author not in authors:
-                    authors.append(author)
-        
-        # Extract date
-        date = ""
-        date_patterns = [
-            r'<meta[^>]*name[^>]*date[^>]*content[^>]*=["\']*([^"\']+)',
-            r'Date:\s*([^<\n]+)',
-            r'(\d{1,2}\s+\w+\s+\d{4})',
-            r'(\w+\s+\d{4})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                date = match.group(1).strip()
-                break
-        
-        return {
-            'metadata': {
-                'name': spec_name,
-                'title': title,
-                'authors': authors,
-                'date': date,
-                'abstract': abstract,
-                'url': url,
-                'type': 'OpenID Specification'
-            },
-            'sections': sections,
-            'fullText': content[:10000]  # Limit full text size
-        }
-    
-    async def search_openid_specs(self, query: str, limit: int = 10, request_id: str = None, progress_callback = None) -> List[Dict[str, Any]]:
-        """Search OpenID specifications"""
-        self.logger.info(f"Searching OpenID specs for: {query}")
-        
-        try:
-            if progress_callback and request_id:
-                await progress_callback(request_id, 20, "Fetching OpenID specifications list...")
-            
-            specs_content = self.fetch_url(self.SPECS_URL)
-            
-            if progress_callback and request_id:
-                await progress_callback(request_id, 50, "Parsing specifications...")
-            
-            results = []
-            
-            # Extract links and titles from the specs page
-            link_pattern = r'<a[^>]*href=["\']([^"\']*\.html)["\'][^>]*>([^<]+)</a>'
-            links = re.findall(link_pattern, specs_content, re.IGNORECASE)
-            
-            query_lower = query.lower()
-            
-            for url, title in links:
-                title_clean = re.sub(r'<[^>]+>', '', title).strip()
-                
-                # Check if query matches title or URL
-                if (query_lower in title_clean.lower() or 
-                    query_lower in url.lower() or
-                    any(word in title_clean.lower() for word in query_lower.split() if len(word) > 2)):
-                    
-                    # Make URL absolute
-                    if url.startswith('/'):
-                        full_url = f"{self.BASE_URL}{url}"
-                    elif not url.startswith('http'):
-                        full_url = f"{self.BASE_URL}/specs/{url}"
-                    else:
-                        full_url = url
-                    
-                    results.append({
-                        'name': title_clean,
-                        'title': title_clean,
-                        'url': full_url,
-                        'type': 'OpenID Specification',
-                        'abstract': '',
-                        'authors': [],
-                        'date': ''
-                    })
-                    
-                    if len(results) >= limit:
-                        break
-            
-            if progress_callback and request_id:
-                await progress_callback(request_id, 80, f"Found {len(results)} matching specifications")
-            
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"OpenID search failed: {e}")
-            return []
-
-
-class SimpleInternetDraftService:
-    """Simplified Internet Draft service"""
-    
-    BASE_URL = "https://datatracker.ietf.org"
-    
-    def __init__(self):
-        self.logger = logging.getLogger('rfc_server.draft_service')
-    
-    def fetch_url(self, url: str) -> str:
-        """Fetch content from URL"""
-        try:
-            with urllib.request.urlopen(url, timeout=30) as response:
-                return response.read().decode('utf-8')
-        except Exception as e:
-            raise Exception(f"Failed to fetch {url}: {str(e)}")
-    
-    async def fetch_internet_draft(self, draft_name: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
-        """Fetch an Internet Draft by its name"""
-        draft_name = draft_name.replace('.txt', '')
-        self.logger.info(f"Fetching Internet Draft: {draft_name}")
-        
-        # Check if this is a versioned draft or base name
-        has_version = re.search(r'-\d+$', draft_name)
-        
-        if not has_version:
-            self.logger.debug(f"No version detected in {draft_name}, trying to find latest version")
-            if progress_callback and request_id:
-                await progress_callback(request_id, 20, "Searching for latest version...")
-            
-            # Try to find the latest version
-            try:
-                return await self.get_latest_version(draft_name, request_id, progress_callback)
-            except Exception as e:
-                self.logger.warning(f"Could not find latest version, trying direct fetch: {e}")
-        
-        cache_key = f"draft_{draft_name}"
-        if cache_key in document_cache:
-            if progress_callback and request_id:
-                await progress_callback(request_id, 80, "Found in cache, retrieving...")
-            return document_cache[cache_key]
-        
-        if progress_callback and request_id:
-            await progress_callback(request_id, 30, "Fetching draft content...")
-        
-        # Try TXT format first
-        txt_url = f"{self.BASE_URL}/doc/txt/{draft_name}.txt"
-        
-        try:
-            if progress_callback and request_id:
-                await progress_callback(request_id, 40, "Downloading TXT format...")
-            
-            txt_content = self.fetch_url(txt_url)
-            
-            if progress_callback and request_id:
-                await progress_callback(request_id, 70, "Parsing draft content...")
-            
-            draft_data = self._parse_txt_draft(txt_content, draft_name, txt_url)
-            document_cache[cache_key] = draft_data
-            return draft_data
-        except Exception as txt_error:
-            print(f"TXT fetch failed: {txt_error}", file=sys.stderr)
-            
-            if progress_callback and request_id:
-                await progress_callback(request_id, 50, "TXT failed, trying HTML format...")
-            
-            # Try HTML format as fallback
-            html_url = f"{self.BASE_URL}/doc/html/{draft_name}"
-            
-            try:
-                html_content = self.fetch_url(html_url)
-                
-                if progress_callback and request_id:
-                    await progress_callback(request_id, 70, "Parsing HTML content...")
-                
-                draft_data = self._parse_html_draft(html_content, draft_name, html_url)
-                document_cache[cache_key] = draft_data
-                return draft_data
-            except Exception as html_error:
-                print(f"HTML fetch also failed: {html_error}", file=sys.stderr)
-                raise Exception(f"Failed to fetch Internet Draft {draft_name}: TXT error: {txt_error}, HTML error: {html_error}")
-    
-    def _extract_version(self, draft_name: str) -> Optional[str]:
-        """Extract version number from draft name"""
-        match = re.search(r'-(\d+)$', draft_name)
-        return match.group(1) if match else None
-    
-    async def get_latest_version(self, base_name: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
-        """Get the latest version of an Internet Draft"""
-        try:
-            if progress_callback and request_id:
-                await progress_callback(request_id, 25, "Querying IETF API for versions...")
-            
-            # Search for all versions of this draft
-            search_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&name__startswith={urllib.parse.quote(base_name)}&limit=50"
-            
-            response_data = self.fetch_url(search_url)
-            data = json.loads(response_data)
-            
-            if progress_callback and request_id:
-                await progress_callback(request_id, 35, "Finding latest version...")
-            
-            latest_version = ''
-            latest_version_number = -1
-            
-            for doc in data.get('objects', []):
-                name = doc.get('name', '')
-                version = self._extract_version(name)
-                if version:
-                    version_number = int(version)
-                    if version_number > latest_version_number:
-                        latest_version_number = version_number
-                        latest_version = name
-                elif name == base_name:
-                    # Exact match without version - this might be the base name
-                    latest_version = name
-                    break
-            
-            if latest_version:
-                # Directly fetch without going through get_latest_version again
-                cache_key = f"draft_{latest_version}"
-                if cache_key in document_cache:
-                    if progress_callback and request_id:
-                        await progress_callback(request_id, 80, "Found in cache, retrieving...")
-                    return document_cache[cache_key]
-                
-                if progress_callback and request_id:
-                    await progress_callback(request_id, 40, f"Fetching latest version: {latest_version}")
-                
-                # Try TXT format first
-                txt_url = f"{self.BASE_URL}/doc/txt/{latest_version}.txt"
-                
-                try:
-                    if progress_callback and request_id:
-                        await progress_callback(request_id, 50, "Downloading TXT format...")
-                    
-                    txt_content = self.fetch_url(txt_url)
-                    
-                    if progress_callback and request_id:
-                        await progress_callback(request_id, 70, "Parsing draft content...")
-                    
-                    draft_data = self._parse_txt_draft(txt_content, latest_version, txt_url)
-                    document_cache[cache_key] = draft_data
-                    return draft_data
-                except Exception as txt_error:
-                    # Try HTML format as fallback
-                    html_url = f"{self.BASE_URL}/doc/html/{latest_version}"
-                    
-                    try:
-                        if progress_callback and request_id:
-                            await progress_callback(request_id, 60, "TXT failed, trying HTML format...")
-                        
-                        html_content = self.fetch_url(html_url)
-                        
-                        if progress_callback and request_id:
-                            await progress_callback(request_id, 70, "Parsing HTML content...")
-                        
-                        draft_data = self._parse_html_draft(html_content, latest_version, html_url)
-                        document_cache[cache_key] = draft_data
-                        return draft_data
-                    except Exception as html_error:
-                        raise Exception(f"Failed to fetch latest version {latest_version}: TXT error: {txt_error}, HTML error: {html_error}")
-            else:
-                # If no versioned drafts found, try the base name directly
-                raise Exception(f"No versions found for {base_name}")
-                
-        except Exception as e:
-            print(f"Latest version search failed: {e}", file=sys.stderr)
-            # Fallback: try to fetch the base name directly with a version suffix
-            fallback_name = f"{base_name}-00"  # Try version 00 as fallback
-            cache_key = f"draft_{fallback_name}"
-            
-            if progress_callback and request_id:
-                await progress_callback(request_id, 45, f"Trying fallback: {fallback_name}")
-            
-            try:
-                txt_url = f"{self.BASE_URL}/doc/txt/{fallback_name}.txt"
-                txt_content = self.fetch_url(txt_url)
-                
-                if progress_callback and request_id:
-                    await progress_callback(request_id, 70, "Parsing fallback content...")
-                
-                draft_data = self._parse_txt_draft(txt_content, fallback_name, txt_url)
-                document_cache[cache_key] = draft_data
-                return draft_data
-            except Exception:
-                raise Exception(f"Could not find any version of {base_name}")
-    
-    async def search_internet_drafts(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search for Internet Drafts using IETF Datatracker API"""
-        self.logger.info(f"Searching Internet Drafts for query: {query}")
-        
-        try:
-            # Try API search first
-            search_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&name__icontains={urllib.parse.quote(query)}&limit={limit}"
-            
-            try:
-                response_data = self.fetch_url(search_url)
-                data = json.loads(response_data)
-                results = []
-                
-                for doc in data.get('objects', []):
-                    results.append({
-                        'name': doc.get('name', ''),
-                        'title': doc.get('title', ''),
-                        'authors': [],  # Would need additional API call for authors
-                        'date': doc.get('time', ''),
-                        'status': doc.get('intended_std_level', ''),
-                        'abstract': doc.get('abstract', ''),
-                        'url': f"{self.BASE_URL}/doc/{doc.get('name', '')}/",
-                        'version': self._extract_version(doc.get('name', '')),
-                        'workingGroup': doc.get('group', '')
-                    })
-                
-                return results
-            
-            except Exception as api_error:
-                print(f"API search failed, trying title search: {api_error}", file=sys.stderr)
-                
-                # Fallback: search by title
-                title_search_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&title__icontains={urllib.parse.quote(query)}&limit={limit}"
-                
-                try:
-                    response_data = self.fetch_url(title_search_url)
-                    data = json.loads(response_data)
-                    results = []
-                    
-                    for doc in data.get('objects', []):
-                        results.append({
-                            'name': doc.get('name', ''),
-                            'title': doc.get('title', ''),
-                            'authors': [],
-                            'date': doc.get('time', ''),
-                            'status': doc.get('intended_std_level', ''),
-                            'abstract': doc.get('abstract', ''),
-                            'url': f"{self.BASE_URL}/doc/{doc.get('name', '')}/",
-                            'version': self._extract_version(doc.get('name', '')),
-                            'workingGroup': doc.get('group', '')
-                        })
-                    
-                    return results
-                
-                except Exception as title_error:
-                    self.logger.error(f"Title search also failed: {title_error}")
-                    
-                    # Try one more approach: search without API filters
-                    try:
-                        simple_search_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&limit={limit * 2}"
-                        self.logger.debug(f"Trying simple search: {simple_search_url}")
-                        
-                        response_data = self.fetch_url(simple_search_url)
-                        data = json.loads(response_data)
-                        results = []
-                        
-                        query_lower = query.lower()
-                        
-                        for doc in data.get('objects', []):
-                            name = doc.get('name', '').lower()
-                            title = doc.get('title', '').lower()
-                            
-                            # Filter results that match the query
-                            if (query_lower in name or query_lower in title):
-                                results.append({
-                                    'name': doc.get('name', ''),
-                                    'title': doc.get('title', ''),
-                                    'authors': [],
-                                    'date': doc.get('time', ''),
-                                    'status': doc.get('intended_std_level', ''),
-                                    'abstract': doc.get('abstract', ''),
-                                    'url': f"{self.BASE_URL}/doc/{doc.get('name', '')}/",
-                                    'version': self._extract_version(doc.get('name', '')),
-                                    'workingGroup': doc.get('group', '')
-                                })
-                                
-                                if len(results) >= limit:
-                                    break
-                        
-                        self.logger.info(f"Simple search found {len(results)} matching results")
-                        return results
-                        
-                    except Exception as simple_error:
-                        self.logger.error(f"Simple search also failed: {simple_error}")
-                        # Return empty list - no mock data
-                        return []
-        
-        except Exception as e:
-            self.logger.error(f"Search failed completely: {e}")
-            return []
-    
-    async def search_draft_by_exact_name(self, draft_name: str) -> List[Dict[str, Any]]:
-        """Search for a specific draft by exact name"""
-        self.logger.info(f"Searching for exact draft name: {draft_name}")
-        
-        try:
-            # Try to get the specific document
-            doc_url = f"{self.BASE_URL}/api/v1/doc/document/{draft_name}/?format=json"
-            self.logger.debug(f"Exact search URL: {doc_url}")
-            
-            response_data = self.fetch_url(doc_url)
-            doc = json.loads(response_data)
-            
-            if doc and doc.get('name'):
-                result = {
-                    'name': doc.get('name', ''),
-                    'title': doc.get('title', ''),
-                    'authors': [],
-                    'date': doc.get('time', ''),
-                    'status': doc.get('intended_std_level', ''),
-                    'abstract': doc.get('abstract', ''),
-                    'url': f"{self.BASE_URL}/doc/{doc.get('name', '')}/",
-                    'version': self._extract_version(doc.get('name', '')),
-                    'workingGroup': doc.get('group', '')
-                }
-                
-                self.logger.info(f"Found exact match for {draft_name}")
-                return [result]
-            
-        except Exception as e:
-            self.logger.debug(f"Exact name search failed: {e}")
-        
-        return []
-    
-    async def get_working_group_documents(self, working_group: str, include_rfcs: bool = True, include_drafts: bool = True, limit: int = 50) -> Dict[str, Any]:
-        """Get all active RFCs and Internet Drafts for a specific IETF working group"""
-        self.logger.info(f"Getting documents for working group: {working_group}")
-        
-        result = {
-            'workingGroup': working_group,
-            'rfcs': [],
-            'internetDrafts': [],
-            'summary': {
-                'totalRfcs': 0,
-                'totalDrafts': 0,
-                'totalDocuments': 0
-            }
-        }
-        
-        try:
-            # Get working group information first - try different API endpoints
-            wg_info_found = False
-            
-            # Try the group API endpoint
-            try:
-                wg_url = f"{self.BASE_URL}/api/v1/group/group/?format=json&acronym={working_group}"
-                self.logger.debug(f"Working group info URL: {wg_url}")
-                
-                wg_response = self.fetch_url(wg_url)
-                wg_data = json.loads(wg_response)
-                
-                if wg_data.get('objects') and len(wg_data['objects']) > 0:
-                    wg_obj = wg_data['objects'][0]
-                    result['workingGroupInfo'] = {
-                        'name': wg_obj.get('name', working_group),
-                        'acronym': wg_obj.get('acronym', working_group),
-                        'description': wg_obj.get('description', ''),
-                        'state': wg_obj.get('state', ''),
-                        'type': wg_obj.get('type', '')
-                    }
-                    wg_info_found = True
-                    self.logger.debug(f"Found working group info: {wg_obj.get('name', working_group)}")
-            except Exception as wg_error:
-                self.logger.debug(f"First WG API attempt failed: {wg_error}")
-            
-            if not wg_info_found:
-                self.logger.warning(f"Could not fetch working group info for {working_group}")
-                result['workingGroupInfo'] = {
-                    'name': working_group.upper(),
-                    'acronym': working_group,
-                    'description': 'Working group information not available',
-                    'state': 'unknown',
-                    'type': 'wg'
-                }
-            
-            # Get RFCs for the working group - search by name pattern
-            if include_rfcs:
-                self.logger.debug("Fetching RFCs for working group")
-                try:
-                    # Search for RFCs that contain the working group name in their name
-                    rfc_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=rfc&name__icontains={working_group}&limit={limit * 2}"
-                    self.logger.debug(f"RFC search URL: {rfc_url}")
-                    
-                    rfc_response = self.fetch_url(rfc_url)
-                    rfc_data = json.loads(rfc_response)
-                    
-                    rfc_count = 0
-                    for doc in rfc_data.get('objects', []):
-                        if rfc_count >= limit:
-                            break
-                            
-                        # Extract RFC number from name (e.g., "rfc7540" -> "7540")
-                        rfc_number = ""
-                        name = doc.get('name', '')
-                        if name.startswith('rfc'):
-                            rfc_number = name[3:]
-                        
-                        rfc_info = {
-                            'number': rfc_number,
-                            'name': name,
-                            'title': doc.get('title', ''),
-                            'authors': self._extract_authors_from_api(doc),
-                            'date': doc.get('time', ''),
-                            'status': doc.get('intended_std_level', ''),
-                            'abstract': doc.get('abstract', ''),
-                            'url': f"https://www.rfc-editor.org/info/{name}",
-                            'workingGroup': working_group
-                        }
-                        result['rfcs'].append(rfc_info)
-                        rfc_count += 1
-                    
-                    result['summary']['totalRfcs'] = len(result['rfcs'])
-                    self.logger.info(f"Found {len(result['rfcs'])} RFCs for working group {working_group}")
-                    
-                except Exception as rfc_error:
-                    self.logger.error(f"Failed to fetch RFCs for working group: {rfc_error}")
-            
-            # Get Internet Drafts for the working group - search by name pattern
-            if include_drafts:
-                self.logger.debug("Fetching Internet Drafts for working group")
-                try:
-                    # Search for drafts that contain the working group name
-                    draft_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&name__icontains=ietf-{working_group}&limit={limit * 2}"
-                    self.logger.debug(f"Draft search URL: {draft_url}")
-                    
-                    draft_response = self.fetch_url(draft_url)
-                    draft_data = json.loads(draft_response)
-                    
-                    draft_count = 0
-                    for doc in draft_data.get('objects', []):
-                        if draft_count >= limit:
-                            break
-                            
-                        # Only include active drafts (not expired or replaced)
-                        doc_states = doc.get('states', [])
-                        is_active = True
-                        
-                        # Check document states
-                        for state in doc_states:
-                            if isinstance(state, str):
-                                state_name = state.lower()
-                            elif isinstance(state, dict):
-                                state_name = state.get('name', '').lower()
-                            else:
-                                continue
-                                
-                            if any(inactive in state_name for inactive in ['expired', 'replaced', 'withdrawn', 'dead']):
-                                is_active = False
-                                break
-                        
-                        if is_active:
-                            draft_info = {
-                                'name': doc.get('name', ''),
-                                'title': doc.get('title', ''),
-                                'authors': self._extract_authors_from_api(doc),
-                                'date': doc.get('time', ''),
-                                'status': doc.get('intended_std_level', ''),
-                                'abstract': doc.get('abstract', ''),
-                                'url': f"{self.BASE_URL}/doc/{doc.get('name', '')}/",
-                                'version': self._extract_version(doc.get('name', '')),
-                                'workingGroup': working_group,
-                                'state': [s.get('name', '') if isinstance(s, dict) else str(s) for s in doc_states]
-                            }
-                            result['internetDrafts'].append(draft_info)
-                            draft_count += 1
-                    
-                    result['summary']['totalDrafts'] = len(result['internetDrafts'])
-                    self.logger.info(f"Found {len(result['internetDrafts'])} active Internet Drafts for working group {working_group}")
-                    
-                except Exception as draft_error:
-                    self.logger.error(f"Failed to fetch Internet Drafts for working group: {draft_error}")
-            
-            result['summary']['totalDocuments'] = result['summary']['totalRfcs'] + result['summary']['totalDrafts']
-            self.logger.info(f"Total documents found for {working_group}: {result['summary']['totalDocuments']}")
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get working group documents: {str(e)}")
-            raise Exception(f"Failed to get documents for working group {working_group}: {str(e)}")
-    
-    def _extract_authors_from_api(self, doc: Dict[str, Any]) -> List[str]:
-        """Extract authors from API document response"""
-        authors = []
-        
-        # Try to get authors from the document
-        if 'authors' in doc and doc['authors']:
-            for author in doc['authors']:
-                if isinstance(author, dict):
-                    if 'person' in author and author['person']:
-                        if isinstance(author['person'], dict):
-                            name = author['person'].get('name', '')
-                        else:
-                            name = str(author['person'])
-                        if name:
-                            authors.append(name)
-                    elif 'name' in author:
-                        authors.append(author['name'])
-                else:
-                    authors.append(str(author))
-        
-        return authors
-    
-    def _parse_txt_draft(self, text: str, draft_name: str, url: str) -> Dict[str, Any]:
-        """Parse Internet Draft from TXT format"""
-        lines = text.split('\n')
-        
-        # Extract title
-        title_match = re.search(r'(?:Title|Internet-Draft):\s*(.*?)(?:\r?\n\r?\n|\r?\n\s*\r?\n)', text, re.IGNORECASE)
-        title = title_match.group(1).strip() if title_match else draft_name
-        
-        # Extract authors
-        authors = []
-        author_match = re.search(r'(?:Author|Authors):\s*(.*?)(?:\r?\n\r?\n|\r?\n\s*\r?\n)', text, re.IGNORECASE | re.DOTALL)
-        if author_match:
-            author_lines = author_match.group(1).split('\n')
-            for line in author_lines:
-                line = line.strip()
-                if line and not line.startswith('Authors:'):
-                    authors.append(line)
-        
-        # Extract abstract
-        abstract_match = re.search(r'(?:Abstract)\s*(?:\r?\n)+\s*(.*?)(?:\r?\n\r?\n|\r?\n\s*\r?\n)', text, re.IGNORECASE | re.DOTALL)
-        abstract = abstract_match.group(1).replace('\n', ' ').strip() if abstract_match else ""
-        
-        # Extract sections
-        sections = []
-        current_section = None
-        current_content = []
-        
-        section_regex = re.compile(r'^(?:\d+\.)+\s+(.+)$')
-        
-        for line in lines:
-            section_match = section_regex.match(line)
-            if section_match:
-                if current_section:
-                    sections.append({
-                        'title': current_section,
-                        'content': '\n'.join(current_content)
-                    })
-                current_section = section_match.group(1).strip()
-                current_content = []
-            elif current_section:
-                current_content.append(line)
-        
-        if current_section and current_content:
-            sections.append({
-                'title': current_section,
-                'content': '\n'.join(current_content)
-            })
-        
-        return {
-            'metadata': {
-                'name': draft_name,
-                'title': title,
-                'authors': authors,
-                'date': '',
-                'status': '',
-                'abstract': abstract,
-                'url': url,
-                'version': self._extract_version(draft_name)
-            },
-            'sections': sections,
-            'fullText': text
-        }
-    
-    def _parse_html_draft(self, html: str, draft_name: str, url: str) -> Dict[str, Any]:
-        """Parse Internet Draft from HTML format (simple parsing)"""
-        # Simple HTML parsing without BeautifulSoup
-        parser = SimpleHTMLParser()
-        parser.feed(html)
-        
-        # Extract title from HTML title tag or h1
-        title = parser.title or draft_name
-        if not title or title == draft_name:
-            # Try to find title in content
-            title_match = re.search(r'<h1[^>]*>(.*?)</h1>', html, re.IGNORECASE | re.DOTALL)
-            if title_match:
-                title = re.sub(r'<[^>]+>', '', title_match.group(1)).strip()
-        
-        # Extract text content
-        text_content = parser.get_text()
-        
-        # Try to extract sections from HTML
-        sections = []
-        section_matches = re.findall(r'<h[2-4][^>]*>(.*?)</h[2-4]>', html, re.IGNORECASE | re.DOTALL)
-        for i, section_title in enumerate(section_matches):
-            clean_title = re.sub(r'<[^>]+>', '', section_title).strip()
-            if clean_title:
-                sections.append({
-                    'title': clean_title,
-                    'content': f"Section content for {clean_title}"  # Simplified
-                })
-        
-        return {
-            'metadata': {
-                'name': draft_name,
-                'title': title,
-                'authors': [],  # Would need more complex parsing
-                'date': '',
-                'status': '',
-                'abstract': '',  # Would need more complex parsing
-                'url': url,
-                'version': self._extract_version(draft_name)
-            },
-            'sections': sections,
-            'fullText': text_content
-        }
-    
-    def _extract_version(self, draft_name: str) -> Optional[str]:
-        """Extract version number from draft name"""
-        match = re.search(r'-(\d+)$', draft_name)
-        return match.group(1) if match else None
-
-
-# Initialize server and services
-mcp = SimpleMCPServer("RFC and Internet Draft Server")
-rfc_service = SimpleRFCService()
-draft_service = SimpleInternetDraftService()
-openid_service = SimpleOpenIDService()
-
-
-# RFC Tools
-@mcp.tool
-async def get_rfc(number: str, format: str = "full", _request_id: str = None, _progress_callback = None) -> str:
-    """Fetch an RFC document by its number"""
-    logger.info(f"Tool call: get_rfc(number={number}, format={format})")
-    
-    try:
-        rfc = await rfc_service.fetch_rfc(number)
-        
-        if format == "metadata":
-            result = rfc["metadata"]
-        elif format == "sections":
-            result = rfc["sections"]
-        else:
-            result = rfc
-        
-        logger.info(f"Successfully processed get_rfc for RFC {number}")
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error in get_rfc for RFC {number}: {str(e)}")
-        return f"Error fetching RFC {number}: {str(e)}"
-
-
-@mcp.tool
-async def search_rfcs(query: str, limit: int = 10) -> str:
-    """Search for RFCs by keyword"""
-    logger.info(f"Tool call: search_rfcs(query={query}, limit={limit})")
-    
-    try:
-        results = await rfc_service.search_rfcs(query, limit)
-        logger.info(f"Successfully processed search_rfcs, found {len(results)} results")
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.error(f"Error in search_rfcs: {str(e)}")
-        return f"Error searching for RFCs: {str(e)}"
-
-
-@mcp.tool
-async def get_rfc_section(number: str, section: str) -> str:
-    """Get a specific section from an RFC"""
-    try:
-        rfc = await rfc_service.fetch_rfc(number)
-        
-        # Find matching section
-        section_query = section.lower()
-        for sect in rfc["sections"]:
-            if (section_query in sect["title"].lower() or 
-                sect["title"].lower() == section_query):
-                return json.dumps(sect, indent=2)
-        
-        return f'Section "{section}" not found in RFC {number}'
-    except Exception as e:
-        return f"Error fetching section from RFC {number}: {str(e)}"
-
-
-# Internet Draft Tools
-@mcp.tool
-async def get_internet_draft(name: str, format: str = "full", _request_id: str = None, _progress_callback = None) -> str:
-    """Fetch an Internet Draft document by its name"""
-    logger.info(f"Tool call: get_internet_draft(name={name}, format={format})")
-    
-    try:
-        # Send initial progress notification
-        if _progress_callback and _request_id:
-            await _progress_callback(_request_id, 10, f"Starting to fetch Internet Draft: {name}")
-        
-        # Pass progress callback to the service
-        draft = await draft_service.fetch_internet_draft(name, _request_id, _progress_callback)
-        
-        if _progress_callback and _request_id:
-            await _progress_callback(_request_id, 90, "Processing draft content...")
-        
-        if format == "metadata":
-            result = draft["metadata"]
-        elif format == "sections":
-            result = draft["sections"]
-        else:
-            result = draft
-        
-        if _progress_callback and _request_id:
-            await _progress_callback(_request_id, 100, "Internet Draft fetch completed")
-        
-        logger.info(f"Successfully processed get_internet_draft for {name}")
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error in get_internet_draft for {name}: {str(e)}")
-        return f"Error fetching Internet Draft {name}: {str(e)}"
-
-
-@mcp.tool
-async def search_internet_drafts(query: str, limit: int = 10) -> str:
-    """Search for Internet Drafts by keyword"""
-    logger.info(f"Tool call: search_internet_drafts(query={query}, limit={limit})")
-    
-    try:
-        # First try exact name search if query looks like a draft name
-        results = []
-        if query.startswith('draft-'):
-            logger.debug("Query looks like draft name, trying exact search first")
-            exact_results = await draft_service.search_draft_by_exact_name(query)
-            results.extend(exact_results)
-        
-        # If no exact results or query doesn't look like draft name, do general search
-        if not results:
-            logger.debug("Doing general search")
-            search_results = await draft_service.search_internet_drafts(query, limit)
-            results.extend(search_results)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_results = []
-        for result in results:
-            if result['name'] not in seen:
-                seen.add(result['name'])
-                unique_results.append(result)
-        
-        final_results = unique_results[:limit]
-        logger.info(f"Successfully processed search_internet_drafts, found {len(final_results)} results")
-        
-        return json.dumps(final_results, indent=2)
-    except Exception as e:
-        logger.error(f"Error in search_internet_drafts: {str(e)}")
-        return f"Error searching for Internet Drafts: {str(e)}"
-
-
-@mcp.tool
-async def get_internet_draft_section(name: str, section: str) -> str:
-    """Get a specific section from an Internet Draft"""
-    try:
-        draft = await draft_service.fetch_internet_draft(name)
-        
-        # Find matching section
-        section_query = section.lower()
-        for sect in draft["sections"]:
-            if (section_query in sect["title"].lower() or 
-                sect["title"].lower() == section_query):
-                return json.dumps(sect, indent=2)
-        
-        return f'Section "{section}" not found in Internet Draft {name}'
-    except Exception as e:
-        return f"Error fetching section from Internet Draft {name}: {str(e)}"
-
-
-# OpenID Foundation Tools
-@mcp.tool
-async def get_openid_spec(name: str, format: str = "full", _request_id: str = None, _progress_callback = None) -> str:
-    """Fetch an OpenID Foundation specification by its name"""
-    logger.info(f"Tool call: get_openid_spec(name={name}, format={format})")
-    
-    try:
-        # Send initial progress notification
-        if _progress_callback and _request_id:
-            await _progress_callback(_request_id, 10, f"Starting to fetch OpenID spec: {name}")
-        
-        # Pass progress callback to the service
-        spec = await openid_service.fetch_openid_spec(name, _request_id, _progress_callback)
-        
-        if _progress_callback and _request_id:
-            await _progress_callback(_request_id, 90, "Processing specification content...")
-        
-        if format == "metadata":
-            result = spec["metadata"]
-        elif format == "sections":
-            result = spec["sections"]
-        else:
-            result = spec
-        
-        if _progress_callback and _request_id:
-            await _progress_callback(_request_id, 100, "OpenID specification fetch completed")
-        
-        logger.info(f"Successfully processed get_openid_spec for {name}")
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error in get_openid_spec for {name}: {str(e)}")
-        return f"Error fetching OpenID specification {name}: {str(e)}"
-
-
-@mcp.tool
-async def search_openid_specs(query: str, limit: int = 10, _request_id: str = None, _progress_callback = None) -> str:
-    """Search for OpenID Foundation specifications by keyword"""
-    logger.info(f"Tool call: search_openid_specs(query={query}, limit={limit})")
-    
-    try:
-        if _progress_callback and _request_id:
-            await _progress_callback(_request_id, 10, f"Searching OpenID specs for: {query}")
-        
-        results = await openid_service.search_openid_specs(query, limit, _request_id, _progress_callback)
-        
-        if _progress_callback and _request_id:
-            await _progress_callback(_request_id, 100, f"Found {len(results)} OpenID specifications")
-        
-        logger.info(f"Successfully processed search_openid_specs for '{query}': {len(results)} results")
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.error(f"Error in search_openid_specs for '{query}': {str(e)}")
-        return f"Error searching OpenID specifications for '{query}': {str(e)}"
-
-
-@mcp.tool
-async def get_openid_spec_section(name: str, section: str) -> str:
-    """Get a specific section from an OpenID Foundation specification"""
-    logger.info(f"Tool call: get_openid_spec_section(name={name}, section={section})")
-    
-    try:
-        spec = await openid_service.fetch_openid_spec(name)
-        
-        # Find matching section
-        section_query = section.lower()
-        for sect in spec["sections"]:
-            if (section_query in sect["title"].lower() or 
-                sect["title"].lower() == section_query):
-                logger.info(f"Successfully found section '{section}' in OpenID spec {name}")
-                return json.dumps(sect, indent=2)
-        
-        logger.warning(f"Section '{section}' not found in OpenID spec {name}")
-        return f'Section "{section}" not found in OpenID specification {name}'
-    except Exception as e:
-        logger.error(f"Error in get_openid_spec_section for {name}, section {section}: {str(e)}")
-        return f"Error fetching section from OpenID specification {name}: {str(e)}"
-
-
-@mcp.tool
-async def get_working_group_documents(working_group: str, include_rfcs: bool = True, include_drafts: bool = True, limit: int = 50) -> str:
-    """Get all active RFCs and Internet Drafts for a specific IETF working group"""
-    logger.info(f"Tool call: get_working_group_documents(working_group={working_group}, include_rfcs={include_rfcs}, include_drafts={include_drafts}, limit={limit})")
-    
-    try:
-        result = await draft_service.get_working_group_documents(working_group, include_rfcs, include_drafts, limit)
-        
-        logger.info(f"Successfully processed get_working_group_documents for {working_group}: {result['summary']['totalDocuments']} documents")
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error in get_working_group_documents for {working_group}: {str(e)}")
-        return f"Error fetching documents for working group {working_group}: {str(e)}"
-
-
-def main():
-    """Main entry point with command line argument parsing"""
-    parser = argparse.ArgumentParser(description='RFC and Internet Draft MCP Server')
-    parser.add_argument('--http', action='store_true', help='Run in HTTP mode')
-    parser.add_argument('--port', type=int, default=3000, help='Port for HTTP mode (default: 3000)')
-    parser.add_argument('--stdio', action='store_true', help='Run in stdio mode (default)')
-    parser.add_argument('--log-dir', default='/tmp/rfc_server', help='Log directory (default: /tmp/rfc_server)')
-    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
-                       help='Log level (default: INFO)')
-    
-    args = parser.parse_args()
-    
-    # Setup logging with custom directory and level
-    global logger
-    logger = setup_logging(args.log_dir, args.log_level)
-    
-    # Update service loggers
-    rfc_service.logger = logging.getLogger('rfc_server.rfc_service')
-    draft_service.logger = logging.getLogger('rfc_server.draft_service')
-    
-    # Log startup configuration
-    logger.info(f"Starting RFC MCP Server with arguments: {vars(args)}")
-    
-    # Default to stdio if no mode specified
-    if not args.http and not args.stdio:
-        args.stdio = True
-    
-    try:
-        if args.http:
-            logger.info(f"Starting HTTP server on port {args.port}")
-            # Run HTTP server
-            mcp.run_http(args.port)
-        else:
-            logger.info("Starting stdio server")
-            # Run stdio server
-            asyncio.run(mcp.run_stdio())
-    except KeyboardInterrupt:
-        logger.info("Received keyboard interrupt, shutting down")
-    except Exception as e:
-        logger.error(f"Server crashed: {str(e)}", exc_info=True)
-        raise
-    finally:
-        logger.info("RFC MCP Server shutdown complete")
-
-
-if __name__ == "__main__":
-    main()
-
-# Resources
-@mcp.resource("rfc://{number}")
-def get_rfc_resource(number: str) -> str:
-    """Get an RFC document by its number"""
-    import asyncio
-    return asyncio.run(get_rfc(number))
-
-
-@mcp.resource("draft://{name}")
-def get_draft_resource(name: str) -> str:
-    """Get an Internet Draft document by its name"""
-    import asyncio
-    return asyncio.run(get_internet_draft(name))
-
-
-@mcp.resource("wg://{group}")
-def get_working_group_resource(group: str) -> str:
-    """Get all documents for a working group"""
-    import asyncio
-    return asyncio.run(get_working_group_documents(group))
-
-
-@mcp.resource("wg://{group}/rfcs")
-def get_working_group_rfcs_resource(group: str) -> str:
-    """Get only RFCs for a working group"""
-    import asyncio
-    return asyncio.run(get_working_group_documents(group, include_rfcs=True, include_drafts=False))
-
-
-@mcp.resource("wg://{group}/drafts")
-def get_working_group_drafts_resource(group: str) -> str:
-    """Get only Internet Drafts for a working group"""
-    import asyncio
-    return asyncio.run(get_working_group_documents(group, include_rfcs=False, include_drafts=True))
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Simplified RFC and Internet Draft MCP Server using only standard library
+This version avoids external dependencies for easier setup
+"""
+
+import asyncio
+import inspect
+import json
+import re
+import sys
+import urllib.parse
+import http.client
+import codecs
+import functools
+from typing import Any, Callable, Dict, List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import threading
+import argparse
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sqlite3
+import ssl
+import atexit
+import time
+import zlib
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the standard library
+    orjson = None
+try:
+    import uvloop
+except ImportError:  # uvloop is optional - fall back to the default asyncio loop
+    uvloop = None
+
+
+class LazyText:
+    """Document text kept zlib-compressed in memory and decompressed only when serialized"""
+    
+    __slots__ = ('_data', '_length')
+    
+    def __init__(self, text: str):
+        self._data = zlib.compress(text.encode('utf-8'))
+        self._length = len(text)
+    
+    def __str__(self) -> str:
+        return zlib.decompress(self._data).decode('utf-8')
+    
+    def __len__(self) -> int:
+        return self._length
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the non-JSON types that cached documents may contain"""
+    if isinstance(obj, LazyText):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# JSON helpers for the MCP transports (orjson when available, stdlib otherwise)
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string"""
+        return orjson.dumps(obj, default=_json_default).decode('utf-8')
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes"""
+        return orjson.dumps(obj, default=_json_default)
+
+    def _dumps_pretty(obj: Any) -> str:
+        """Serialize an object to a JSON string indented by two spaces"""
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes"""
+        return _dumps(obj).encode('utf-8')
+
+    def _dumps_pretty(obj: Any) -> str:
+        """Serialize an object to a JSON string indented by two spaces"""
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+
+    _loads = json.loads
+
+
+# Precompiled patterns for RFC text and search result parsing
+_DATE_LINE_RE = re.compile(r'^\w+\s+\d{4}$')
+_ABSTRACT_LINE_RE = re.compile(r'abstract\s*$', re.IGNORECASE)
+_RFC_TITLE_PATTERNS = (
+    re.compile(r'^\s*([^.]*(?:Protocol|Transfer|Transport|System|Method|Format|Standard|Specification)[^.]*)\s*$'),
+    re.compile(r'^\s*([A-Z][^.]*--[^.]*)\s*$'),  # Pattern like "Hypertext Transfer Protocol -- HTTP/1.1"
+    re.compile(r'^\s*([A-Z][a-z].*[a-z])\s*$'),  # Capitalized line ending with lowercase
+)
+_RFCNUM_RE = re.compile(r'rfc(\d+)', re.IGNORECASE)
+
+# Precompiled patterns for Internet Draft revision suffixes and inactive document states
+_VERSION_RE = re.compile(r'-(\d+)$')
+_INACTIVE_STATE_RE = re.compile(r'expired|replaced|withdrawn|dead', re.IGNORECASE)
+# Datatracker group acronyms (checked after lower-casing, before they are put in a URL)
+_WG_ACRONYM_RE = re.compile(r'[a-z0-9][a-z0-9-]{1,39}')
+
+# Precompiled patterns for OpenID specification pages. Where a tag must contain several words
+# in order, each word is matched as an atomic group, emulated as (?=(...))\1, so a long or
+# unclosed tag is scanned once per start instead of once per combination of occurrences
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPEC_LINK_RE = re.compile(r'href=["\']([^"\']*\.html)["\'][^>]*>([^<]*)</a>', re.IGNORECASE)
+# The last .html href in the tag, or else the last one whose value stays inside the tag
+_SPEC_ANCHOR_RE = re.compile(
+    r'<a(?:(?=([^>]*href=["\'](?=[^"\']*\.html["\'])))\1|(?=([^>]*href=["\'](?=[^"\'>]*\.html["\'])))\2)'
+    r'(?P<url>[^"\']*\.html)["\'][^>]*>(?P<title>[^<]+)</a>', re.IGNORECASE)
+_HTML_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_SPEC_ABSTRACT_RES = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'<div(?=([^>]*?class))\1(?=([^>]*?abstract))\2[^>]*>(?P<body>.*?)</div>',
+    r'<section(?=([^>]*?id))\1(?=([^>]*?abstract))\2[^>]*>(?P<body>.*?)</section>',
+    r'<h[12][^>]*>Abstract</h[12]>(?P<body>.*?)(?=<h[12]|$)',
+    r'<h[12][^>]*>Introduction</h[12]>(?P<body>.*?)(?=<h[12]|$)'
+))
+# The id is the value of the last "=" after the first "id" in the tag
+_SPEC_SECTION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'<h(?P<level>[2-6])(?=([^>]*?id))\2(?=([^>]*=["\']*)[^"\'>\s])\3(?=(?P<id>[^"\'>\s]+))(?P=id)[^>]*>'
+    r'(?P<title>[^<]+)</h(?P=level)>',
+    r'<h(?P<level>[2-6])[^>]*>(?P<title>\d[^<]+)</h(?P=level)>'
+))
+# Indexed by heading level: the next heading of the same or a higher level ends a section
+_SPEC_NEXT_HEADING_RES = (None,) + tuple(re.compile(f'<h[1-{level}][^>]*>', re.IGNORECASE) for level in range(1, 7))
+_SPEC_AUTHOR_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'<meta(?=([^>]*?name))\1(?=([^>]*?author))\2(?=([^>]*?content))\3(?=([^>]*=)["\']*[^"\'])\4'
+    r'["\']*(?P<value>[^"\']+)',
+    r'<div(?=([^>]*?class))\1(?=([^>]*?author))\2[^>]*>(?P<value>[^<]+)</div>',
+    r'Author[s]?:\s*(?P<value>[^<\n]+)'
+))
+_SPEC_DATE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'<meta(?=([^>]*?name))\1(?=([^>]*?date))\2(?=([^>]*?content))\3(?=([^>]*=)["\']*[^"\'])\4'
+    r'["\']*(?P<value>[^"\']+)',
+    r'Date:\s*(?P<value>[^<\n]+)',
+    r'(?P<value>\d{1,2}\s+\w+\s+\d{4})',
+    r'(?P<value>\w+\s+\d{4})'
+))
+# Header-area lines that are never the RFC title
+_TITLE_SKIP_KEYWORDS = ('status of this memo', 'copyright notice', 'abstract')
+_TITLE_BAD_PREFIXES = ('This document', 'Copyright')
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancel a task whose result is no longer needed (retrieving its error if it already failed)"""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def _iter_lines(text: str):
+    """Yield the lines of text one at a time (the same lines as text.split('\n'), without the list)"""
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_version(draft_name: str) -> Optional[str]:
+    """Extract version number from draft name (memoized - the same names recur across searches)"""
+    match = _VERSION_RE.search(draft_name)
+    return match.group(1) if match else None
+
+
+def _strip_tags(html: str, limit: int, start: int = 0, end: Optional[int] = None) -> str:
+    """Return up to limit characters of html[start:end] with tags removed and whitespace collapsed"""
+    # Tags count as word breaks, so words can be gathered run by run between tags,
+    # stopping as soon as enough text is collected instead of cleaning the whole fragment
+    end = len(html) if end is None else end
+    words = []
+    length = -1
+    pos = start
+    for match in _TAG_RE.finditer(html, start, end):
+        for word in html[pos:match.start()].split():
+            words.append(word)
+            length += len(word) + 1
+        pos = match.end()
+        if length >= limit:
+            break
+    else:
+        words.extend(html[pos:end].split())
+    return ' '.join(words)[:limit]
+
+
+def _section_header_title(line: str) -> Optional[str]:
+    """Return the title of a numbered section header ("3.2.  Title"), or None if line is not one"""
+    # Equivalent to matching r'^(?:\d+\.)+\s+(.+)$', but most lines are rejected by the first character
+    if not line or not '0' <= line[0] <= '9':
+        return None
+    pos, end = 0, len(line)
+    while pos < end and '0' <= line[pos] <= '9':
+        while pos < end and '0' <= line[pos] <= '9':
+            pos += 1
+        if pos == end or line[pos] != '.':
+            return None
+        pos += 1
+    rest = line[pos:]
+    if len(rest) < 2 or not rest[0].isspace():
+        return None
+    return rest.strip()
+
+
+def _field_value_start(line: str, markers: tuple) -> int:
+    """Return the index just past the earliest field marker in line (case-insensitive), or -1"""
+    # Every marker ends with ':', so most lines are rejected without a lowercased copy
+    if ':' not in line:
+        return -1
+    lower = line.lower()
+    positions = [pos + len(marker) for marker in markers for pos in (lower.find(marker),) if pos != -1]
+    return min(positions) if positions else -1
+
+
+def _scan_txt_document(text: str, header_titles: bool = False) -> Dict[str, Any]:
+    """Extract title candidates, authors, abstract and sections from a TXT RFC or draft in one pass"""
+    # Title candidates, in order of preference:
+    # 1. a "Title:" field followed by a blank line (anywhere in the document)
+    # 2. the first title-like line after the header date (first 50 lines, RFC header only)
+    # 3. the first line in the likely title area matching one of the title patterns (RFC header only)
+    field_title = None
+    title_candidate = None
+    title_pending = False
+    dated_title = None
+    found_date = False
+    pattern_titles = [None] * len(_RFC_TITLE_PATTERNS)
+    
+    # Authors and abstract are collected up to the first blank line after their marker;
+    # states: None (marker not seen) -> 'start' (skipping blank lines) -> 'collect' -> 'done'
+    author_lines = []
+    author_state = None
+    abstract_lines = []
+    abstract_state = None
+    
+    # Section content is sliced out of text once per section rather than collected line by line
+    sections = []
+    current_section = None
+    content_start = 0
+    line_start = 0
+    
+    # A blank line only ends a field when a newline follows it, so never the last line
+    last_index = text.count('\n')
+    
+    for i, line in enumerate(_iter_lines(text)):
+        line_end = line_start + len(line)
+        # Same as "not line.strip()" without building the stripped copy
+        is_blank = not line or line.isspace()
+        ends_field = is_blank and i < last_index
+        
+        # Sections
+        section_title = _section_header_title(line)
+        if section_title is not None:
+            if current_section:
+                sections.append({
+                    'title': current_section,
+                    'content': text[content_start:line_start - 1]
+                })
+            current_section = section_title
+            content_start = line_end + 1
+        
+        # Pattern 1: "Title:" field, confirmed by a following blank line
+        if field_title is None:
+            if title_candidate is not None and ends_field:
+                field_title = title_candidate
+            elif not is_blank:
+                value_start = _field_value_start(line, ('title:', 'internet-draft:'))
+                value = line[value_start:].strip() if value_start != -1 else ''
+                # An empty field takes the next non-blank line as its value
+                title_candidate = line.strip() if title_pending else (value or None)
+                title_pending = value_start != -1 and not value
+        
+        # Patterns 2 and 3 only look at the RFC header area
+        line_stripped = line.strip() if header_titles and i < 50 else ''
+        
+        # Pattern 2: title line after the header date
+        if header_titles and i < 50 and dated_title is None and not is_blank:
+            if _DATE_LINE_RE.match(line_stripped):
+                # Look for date line (indicates end of header)
+                found_date = True
+            elif found_date:
+                # Skip "Status of this Memo" and similar section headers
+                lower = line_stripped.lower()
+                if any(skip in lower for skip in _TITLE_SKIP_KEYWORDS):
+                    pass
+                # Look for a substantial line that could be the title
+                elif (len(line_stripped) > 15 and
+                      not line_stripped.isupper() and
+                      len(line_stripped.split()) > 2 and
+                      not line_stripped.startswith(_TITLE_BAD_PREFIXES)):
+                    dated_title = line_stripped
+        
+        # Pattern 3: protocol names or common RFC terms in the likely title area
+        if header_titles and 20 <= i < 40 and len(line_stripped) > 15:
+            for k, pattern in enumerate(_RFC_TITLE_PATTERNS):
+                if pattern_titles[k] is None and pattern.match(line_stripped):
+                    pattern_titles[k] = line_stripped
+        
+        # Authors
+        if author_state == 'start':
+            if not is_blank:
+                author_lines.append(line)
+                author_state = 'collect'
+        elif author_state == 'collect':
+            if ends_field:
+                author_state = 'done'
+            else:
+                author_lines.append(line)
+        elif author_state is None:
+            value_start = _field_value_start(line, ('author:', 'authors:'))
+            if value_start != -1:
+                rest = line[value_start:].strip()
+                if rest:
+                    author_lines.append(rest)
+                    author_state = 'collect'
+                else:
+                    author_state = 'start'
+        
+        # Abstract
+        if abstract_state == 'start':
+            if not is_blank:
+                abstract_lines.append(line.lstrip())
+                abstract_state = 'collect'
+        elif abstract_state == 'collect':
+            if ends_field:
+                abstract_state = 'done'
+            else:
+                abstract_lines.append(line)
+        elif abstract_state is None and i < last_index and _ABSTRACT_LINE_RE.search(line):
+            abstract_state = 'start'
+        
+        line_start = line_end + 1
+    
+    # The last section only counts if at least one line follows its header
+    if current_section and content_start <= len(text):
+        sections.append({
+            'title': current_section,
+            'content': text[content_start:]
+        })
+    
+    authors = []
+    if author_state == 'done':
+        for line in author_lines:
+            line = line.strip()
+            if line and not line.startswith('Authors:'):
+                authors.append(line)
+    
+    abstract = '\n'.join(abstract_lines).replace('\n', ' ').strip() if abstract_state == 'done' else ""
+    
+    return {
+        'field_title': field_title,
+        'dated_title': dated_title,
+        'pattern_titles': pattern_titles,
+        'authors': authors,
+        'abstract': abstract,
+        'sections': sections
+    }
+
+
+# Parameter names that mark tools/call arguments as passed directly rather than wrapped
+_DIRECT_PARAM_KEYS = frozenset({'number', 'name', 'query', 'working_group'})
+
+# Common MCP notifications that we can acknowledge but don't need to act on
+_KNOWN_NOTIFICATIONS = frozenset({
+    "notifications/cancelled",
+    "notifications/progress",
+    "notifications/message",
+    "notifications/resources/updated",
+    "notifications/tools/updated"
+})
+
+# Fixed HTTP transport response bodies, serialized once
+_HTTP_HEALTH_BODY = _dumpb({
+    "status": "ok",
+    "name": "Standards Finder - RFC, Internet Draft, and OpenID Server",
+    "version": "0.2504.4",
+    "transport": "http",
+    "endpoints": {
+        "mcp": "/mcp (POST)",
+        "message": "/message (POST) - SSE compatible",
+        "health": "/health (GET)"
+    }
+})
+_HTTP_CONNECTION_TEST_BODIES = {
+    path: _dumpb({
+        "status": "ok",
+        "message": "MCP server is running",
+        "transport": "http",
+        "endpoint": path
+    })
+    for path in ('/mcp', '/message')
+}
+_HTTP_NOTIFICATION_BODY = _dumpb({
+    "status": "ok",
+    "message": "Notification processed"
+})
+_SSE_CONNECTED_EVENT = b'event: connected\ndata: {"status": "connected"}\n\n'
+
+# Characters flagged in stdio response previews: controls other than tab/newline/CR, and non-ASCII
+_PROBLEMATIC_CHARS_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\x80-\U0010ffff]')
+
+# Hand-written input schemas for the built-in tools - MCP Inspector compatible format,
+# each wrapped in a single "<ToolName>Input" key
+_TOOL_SCHEMAS = {
+    "get_rfc": {
+        "GetRfcInput": {
+            "type": "object",
+            "properties": {
+                "number": {
+                    "type": "string",
+                    "description": "RFC number (e.g., '2616', '7540')"
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["full", "metadata", "sections"],
+                    "default": "full",
+                    "description": "Output format: full document, metadata only, or sections only"
+                },
+                "include_full_text": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Include the raw document text (fullText) in the full format"
+                }
+            },
+            "required": ["number"],
+            "description": "Parameters for fetching an RFC document"
+        }
+    },
+    "search_rfcs": {
+        "SearchRfcsInput": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query or keyword to find RFCs"
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                    "description": "Maximum number of results to return"
+                }
+            },
+            "required": ["query"],
+            "description": "Parameters for searching RFC documents"
+        }
+    },
+    "get_rfc_section": {
+        "GetRfcSectionInput": {
+            "type": "object",
+            "properties": {
+                "number": {
+                    "type": "string",
+                    "description": "RFC number (e.g., '2616')"
+                },
+                "section": {
+                    "type": "string",
+                    "description": "Section title or identifier to retrieve"
+                }
+            },
+            "required": ["number", "section"],
+            "description": "Parameters for fetching a specific RFC section"
+        }
+    },
+    "get_internet_draft": {
+        "GetInternetDraftInput": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Internet Draft name (e.g., 'draft-ietf-httpbis-http2' or 'draft-ietf-httpbis-http2-17')"
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["full", "metadata", "sections"],
+                    "default": "full",
+                    "description": "Output format: full document, metadata only, or sections only"
+                }
+            },
+            "required": ["name"],
+            "description": "Parameters for fetching an Internet Draft document"
+        }
+    },
+    "search_internet_drafts": {
+        "SearchInternetDraftsInput": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query or keyword to find Internet Drafts"
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                    "description": "Maximum number of results to return"
+                }
+            },
+            "required": ["query"],
+            "description": "Parameters for searching Internet Draft documents"
+        }
+    },
+    "get_internet_draft_section": {
+        "GetInternetDraftSectionInput": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Internet Draft name"
+                },
+                "section": {
+                    "type": "string",
+                    "description": "Section title or identifier to retrieve"
+                }
+            },
+            "required": ["name", "section"],
+            "description": "Parameters for fetching a specific Internet Draft section"
+        }
+    },
+    "get_openid_spec": {
+        "GetOpenIdSpecInput": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "OpenID specification name (e.g., 'openid-connect-core', 'oauth-2.0-multiple-response-types')"
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["full", "metadata", "sections"],
+                    "default": "full",
+                    "description": "Output format: full document, metadata only, or sections only"
+                }
+            },
+            "required": ["name"],
+            "description": "Parameters for fetching an OpenID Foundation specification"
+        }
+    },
+    "search_openid_specs": {
+        "SearchOpenIdSpecsInput": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query or keyword to find OpenID specifications"
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 20,
+                    "description": "Maximum number of results to return"
+                }
+            },
+            "required": ["query"],
+            "description": "Parameters for searching OpenID Foundation specifications"
+        }
+    },
+    "get_openid_spec_section": {
+        "GetOpenIdSpecSectionInput": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "OpenID specification name"
+                },
+                "section": {
+                    "type": "string",
+                    "description": "Section title or identifier to retrieve"
+                }
+            },
+            "required": ["name", "section"],
+            "description": "Parameters for fetching a specific OpenID specification section"
+        }
+    },
+    "get_working_group_documents": {
+        "GetWorkingGroupDocumentsInput": {
+            "type": "object",
+            "properties": {
+                "working_group": {
+                    "type": "string",
+                    "description": "IETF working group name (e.g., 'httpbis', 'oauth', 'tls')"
+                },
+                "include_rfcs": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Include RFCs published by the working group"
+                },
+                "include_drafts": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Include active Internet Drafts from the working group"
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": 50,
+                    "minimum": 1,
+                    "maximum": 100,
+                    "description": "Maximum number of documents to return"
+                }
+            },
+            "required": ["working_group"],
+            "description": "Parameters for fetching working group documents"
+        }
+    }
+}
+
+
+class ProgressThrottle:
+    """Progress callback wrapper that drops updates arriving faster than min_interval"""
+    
+    def __init__(self, callback: Callable, min_interval: float = 0.05):
+        self.callback = callback
+        self.min_interval = min_interval
+        self._last_sent = None
+    
+    async def __call__(self, request_id: str, progress: int, message: str):
+        # The first and the final update are always delivered
+        now = time.monotonic()
+        if self._last_sent is not None and progress < 100 and now - self._last_sent < self.min_interval:
+            return
+        self._last_sent = now
+        await self.callback(request_id, progress, message)
+
+
+# Simple MCP server implementation without FastMCP
+class SimpleMCPServer:
+    PROGRESS_FLUSH_INTERVAL = 0.05  # seconds; progress notifications are coalesced within this window
+    # stdio response size policy: above STDIO_TRUNCATE_SIZE the tool text is cut to STDIO_MAX_TEXT
+    # characters, and anything still above STDIO_MAX_SIZE is replaced by an error
+    STDIO_TRUNCATE_SIZE = 100 * 1024
+    STDIO_MAX_TEXT = 50000
+    STDIO_MAX_SIZE = 200 * 1024
+    HTTP_IDLE_TIMEOUT = 30  # seconds a kept-alive HTTP connection may sit idle before it is closed
+    
+    __slots__ = ('name', 'tools', '_tool_defs', '_tool_meta', 'resources', '_loop', '_loop_lock', '_method_handlers',
+                 '_init_result', '_tools_list_result', '_ping_result', '_static_result_json', '_pending_progress', '_progress_flush_handle', '_current_mode', 'logger')
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.tools = {}
+        self._tool_defs = []  # prebuilt tools/list entries, in registration order
+        self._tools_list_result = {"tools": self._tool_defs}
+        self._tool_meta = {}  # per-tool facts derived from the function signature
+        self.resources = {}
+        self._loop = None  # background event loop used by the HTTP transport and resource handlers
+        self._loop_lock = threading.Lock()
+        # JSON-RPC methods with their own handler; other notifications/* go to _handle_notification
+        self._method_handlers = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+            "ping": self._handle_ping,
+            "notifications/initialized": self._handle_initialized_notification
+        }
+        # The initialize result never changes, so every handshake shares this one
+        self._init_result = {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "tools": {},
+                "resources": {}
+            },
+            "serverInfo": {
+                "name": name,
+                "version": "0.2504.4"
+            }
+        }
+        self._ping_result = {}
+        self._static_result_json = {}  # id() of a shared result object -> its serialized JSON
+        self._pending_progress = {}  # request id -> latest unsent progress notification
+        self._progress_flush_handle = None
+        self._current_mode = None  # 'stdio' once run_stdio starts; progress is only sent then
+        self.logger = logging.getLogger('rfc_server')
+        self.logger.info(f"Initializing MCP Server: {name}")
+    
+    def tool(self, func):
+        """Decorator to register a tool"""
+        self.tools[func.__name__] = func
+        # Tools are static, so their metadata and tools/list entries are built once here
+        self._tool_meta[func.__name__] = {
+            'accepts_progress': '_progress_callback' in inspect.signature(func).parameters,
+            'wrapper_key': next(iter(self._get_tool_schema(func.__name__)))  # MCP Inspector argument wrapper
+        }
+        self._tool_defs.append(self._build_tool_def(func.__name__, func))
+        self._static_result_json.pop(id(self._tools_list_result), None)
+        return func
+    
+    def _build_tool_def(self, tool_name: str, tool_func) -> Dict[str, Any]:
+        """Build the tools/list entry for a tool"""
+        # Extract docstring and create tool definition
+        doc = tool_func.__doc__ or f"{tool_name} tool"
+        
+        # Create proper input schema based on tool name
+        schema_wrapper = self._get_tool_schema(tool_name)
+        
+        # Extract the actual schema from the wrapper (MCP Inspector compatible)
+        if schema_wrapper and isinstance(schema_wrapper, dict):
+            # Get the first (and should be only) key from the wrapper
+            input_schema_key = next(iter(schema_wrapper.keys()))
+            input_schema = schema_wrapper[input_schema_key]
+        else:
+            # Fallback to empty schema
+            input_schema = {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        
+        return {
+            "name": tool_name,
+            "description": doc.split('\n', 1)[0].strip(),
+            "inputSchema": input_schema
+        }
+    
+    def background_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the long-lived background event loop, starting it on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='mcp-background-loop', daemon=True).start()
+            return self._loop
+    
+    def stop_background_loop(self):
+        """Stop the background event loop (a later background_loop() call starts a new one)"""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+    
+    def run_coroutine(self, coro, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the background loop from synchronous code and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.background_loop()).result(timeout)
+    
+    def resource(self, uri_template):
+        """Decorator to register a resource"""
+        def decorator(func):
+            self.resources[uri_template] = func
+            return func
+        return decorator
+    
+    def _get_tool_schema(self, tool_name: str) -> Dict[str, Any]:
+        """Get proper input schema for a tool - MCP Inspector compatible format"""
+        if tool_name in _TOOL_SCHEMAS:
+            return _TOOL_SCHEMAS[tool_name]
+        
+        # Tools without a hand-written schema get one derived from their signature
+        if tool_name in self.tools:
+            return self._schema_from_signature(tool_name, self.tools[tool_name])
+        
+        # Otherwise a default empty schema
+        return {
+            "DefaultInput": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+                "description": "Default input parameters"
+            }
+        }
+    
+    def _schema_from_signature(self, tool_name: str, tool_func) -> Dict[str, Any]:
+        """Build an input schema wrapper from a tool function's signature"""
+        json_types = {str: "string", int: "integer", float: "number", bool: "boolean"}
+        properties = {}
+        required = []
+        for param in inspect.signature(tool_func).parameters.values():
+            # Underscore parameters are injected by the server, not supplied by clients
+            if param.name.startswith('_'):
+                continue
+            prop = {"type": json_types.get(param.annotation, "string")}
+            if param.default is inspect.Parameter.empty:
+                required.append(param.name)
+            elif param.default is not None:
+                prop["default"] = param.default
+            properties[param.name] = prop
+        
+        wrapper_key = ''.join(part.capitalize() for part in tool_name.split('_')) + "Input"
+        return {
+            wrapper_key: {
+                "type": "object",
+                "properties": properties,
+                "required": required,
+                "description": f"Parameters for {tool_name}"
+            }
+        }
+    
+    async def send_progress_notification(self, request_id: str, progress: int, message: str):
+        """Queue a progress notification for the client (coalesced per request, see flush_progress)"""
+        # Progress notifications are only delivered in stdio mode
+        if self._current_mode != 'stdio':
+            return
+        
+        # Only the latest progress per request is kept until the next flush
+        self._pending_progress[request_id] = {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {
+                "progressToken": request_id,
+                "value": {
+                    "kind": "report",
+                    "percentage": progress,
+                    "message": message
+                }
+            }
+        }
+        if self._progress_flush_handle is None:
+            self._progress_flush_handle = asyncio.get_running_loop().call_later(
+                self.PROGRESS_FLUSH_INTERVAL, self.flush_progress)
+    
+    def flush_progress(self):
+        """Write all pending progress notifications to stdout in a single write"""
+        if self._progress_flush_handle is not None:
+            self._progress_flush_handle.cancel()
+            self._progress_flush_handle = None
+        if not self._pending_progress:
+            return
+        pending, self._pending_progress = self._pending_progress, {}
+        try:
+            self._write_stdout(''.join(_dumps(notification) + '\n' for notification in pending.values()))
+        except (BrokenPipeError, OSError) as e:
+            self.logger.error(f"Failed to send progress notifications: {str(e)}")
+        
+    def _write_stdout(self, data: Union[str, bytes]) -> None:
+        """Write complete message lines (text, or UTF-8 encoded bytes) to stdout and flush them"""
+        # Encoding once and writing to the binary buffer skips the text layer's per-call
+        # encoding and print()'s separate writes; all stdio output goes through here
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            sys.stdout.write(data.decode('utf-8') if isinstance(data, bytes) else data)
+            sys.stdout.flush()
+            return
+        buffer.write(data.encode('utf-8') if isinstance(data, str) else data)
+        buffer.flush()
+    
+    def _spliced_response_json(self, response: Dict[str, Any]) -> Optional[str]:
+        """Serialize a response carrying a shared static result around that result's cached JSON, else None"""
+        # initialize, tools/list and ping answers differ only in their id, so the result is
+        # serialized once and only the id is encoded per request
+        result = response.get("result")
+        if not (result is self._tools_list_result or result is self._init_result or result is self._ping_result):
+            return None
+        if len(response) != 3 or "id" not in response:
+            return None
+        result_json = self._static_result_json.get(id(result))
+        if result_json is None:
+            result_json = self._static_result_json[id(result)] = _dumps(result)
+        return f'{{"jsonrpc":"2.0","id":{_dumps(response["id"])},"result":{result_json}}}'
+    
+    async def handle_request(self, request):
+        """Handle MCP request"""
+        method = request.get("method", "")
+        params = request.get("params", {})
+        request_id = request.get("id")
+        
+        # Check if this is a notification (no ID) vs a request (has ID)
+        is_notification = request_id is None
+        
+        self.logger.info("Handling request: %s (ID: %s)", method, request_id)
+        self.logger.debug("Processing as %s; full request: %s",
+                          "notification (no response expected)" if is_notification else "request (response required)", request)
+        
+        try:
+            handler = self._method_handlers.get(method)
+            if handler is None:
+                if not method.startswith("notifications/"):
+                    raise Exception(f"Unknown method: {method}")
+                handler = self._handle_notification
+            return await handler(request, method, params, request_id, is_notification)
+        
+        except Exception as e:
+            # Enhanced error logging for initialize requests
+            if method == "initialize":
+                self.logger.error("❌ INITIALIZE REQUEST FAILED")
+                self.logger.error("=" * 50)
+                self.logger.error(f"Initialize request processing failed: {str(e)}")
+                self.logger.error(f"Request ID: {request_id}")
+                self.logger.error(f"Request params: {params}")
+                self.logger.error(f"Full request: {request}")
+                self.logger.error("Stack trace:", exc_info=True)
+                self.logger.error("=" * 50)
+            else:
+                self.logger.error(f"Error handling request {method}: {str(e)}", exc_info=True)
+            
+            # Create error response with proper ID handling
+            error_response = {
+                "jsonrpc": "2.0",
+                "error": {
+                    "code": -32603,
+                    "message": str(e)
+                }
+            }
+            
+            # Only add ID if the original request had one
+            if not is_notification:
+                error_response["id"] = request_id
+            
+            # Log error response for initialize requests
+            if method == "initialize":
+                self.logger.error("Initialize error response being sent:")
+                self.logger.error(_dumps_pretty(error_response))
+            
+            return error_response
+    
+    async def _handle_initialize(self, request: Dict[str, Any], method: str, params: Dict[str, Any], request_id: Any, is_notification: bool) -> Optional[Dict[str, Any]]:
+        """Answer the initialize handshake"""
+        # Enhanced logging for initialize requests
+        self.logger.info(f"🚀 INITIALIZE REQUEST RECEIVED")
+        # Formatting the timestamp and serializing just to log the size are skipped when
+        # INFO records are filtered out
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Request timestamp: %s", datetime.now().isoformat())
+            self.logger.info("Request size: %d bytes", len(_dumps(request)))
+        
+        # Log request validation for initialize
+        self.logger.info("Validating initialize request format:")
+        self.logger.info(f"  jsonrpc field: {request.get('jsonrpc', 'MISSING')}")
+        self.logger.info(f"  method field: {request.get('method', 'MISSING')}")
+        self.logger.info(f"  id field: {request.get('id', 'MISSING')} (type: {type(request.get('id')).__name__})")
+        self.logger.info(f"  params field: {'present' if 'params' in request else 'MISSING'}")
+        
+        # Validate JSON-RPC 2.0 compliance
+        if request.get("jsonrpc") != "2.0":
+            self.logger.warning(f"⚠️  Non-standard jsonrpc version: {request.get('jsonrpc')}")
+        else:
+            self.logger.info("✅ JSON-RPC 2.0 version confirmed")
+        
+        self.logger.info("=" * 60)
+        self.logger.info("INITIALIZE REQUEST PROCESSING")
+        self.logger.info("=" * 60)
+        
+        # Log the full request details
+        self.logger.info(f"Initialize request received:")
+        self.logger.info(f"  Request ID: {request_id} (type: {type(request_id).__name__})")
+        self.logger.info(f"  Request method: {method}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("  Request params: %s", _dumps_pretty(params))
+            self.logger.info("  Full request: %s", _dumps_pretty(request))
+        
+        # Initialize must have an ID (not a notification)
+        if is_notification:
+            self.logger.error("Initialize request missing ID - this is invalid")
+            self.logger.error("MCP initialize requests MUST have an ID field")
+            return None  # Can't respond to a malformed initialize
+        
+        # Validate request structure
+        self.logger.info("Validating initialize request structure:")
+        
+        # Check required params
+        required_params = ["protocolVersion", "capabilities", "clientInfo"]
+        for param in required_params:
+            if param in params:
+                self.logger.info(f"  ✅ {param}: {type(params[param]).__name__}")
+                if param == "protocolVersion":
+                    self.logger.info(f"     Protocol version: {params[param]}")
+                elif param == "clientInfo":
+                    client_info = params[param]
+                    self.logger.info(f"     Client name: {client_info.get('name', 'unknown')}")
+                    self.logger.info(f"     Client version: {client_info.get('version', 'unknown')}")
+                elif param == "capabilities":
+                    caps = params[param]
+                    self.logger.info(f"     Client capabilities: {list(caps.keys()) if isinstance(caps, dict) else 'invalid'}")
+            else:
+                self.logger.warning(f"  ⚠️  Missing parameter: {param}")
+        
+        # Build response
+        self.logger.info("Building initialize response:")
+        
+        response = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": self._init_result
+        }
+        
+        # Log response construction details
+        self.logger.info(f"Response structure built:")
+        self.logger.info(f"  Response ID: {response['id']} (type: {type(response['id']).__name__})")
+        self.logger.info(f"  Protocol version: {response['result']['protocolVersion']}")
+        self.logger.info(f"  Server name: {response['result']['serverInfo']['name']}")
+        self.logger.info(f"  Server version: {response['result']['serverInfo']['version']}")
+        self.logger.info(f"  Capabilities: {response['result']['capabilities']}")
+        
+        # Safety check: never send null ID
+        if response["id"] is None:
+            self.logger.error(f"Response ID is None for {method} - this should not happen!")
+            self.logger.error(f"Original request ID was: {request_id} (type: {type(request_id).__name__})")
+            del response["id"]  # Remove the field entirely
+        
+        # The response dumps are diagnostics only, so they are skipped entirely when
+        # INFO records would be filtered out
+        if self.logger.isEnabledFor(logging.INFO):
+            # Log the complete response
+            self.logger.info("Complete initialize response:")
+            self.logger.info(_dumps_pretty(response))
+            
+            # Log serialized response (as it will be sent over STDIO)
+            try:
+                serialized_response = _dumps(response)
+                self.logger.info(f"Serialized response ({len(serialized_response)} bytes):")
+                self.logger.info(serialized_response)
+            except Exception as serialize_err:
+                self.logger.error(f"❌ Response serialization failed: {serialize_err}")
+        
+        # Log ID consistency check
+        if request.get("id") == response.get("id"):
+            self.logger.info(f"✅ ID consistency verified: {request.get('id')} == {response.get('id')}")
+        else:
+            self.logger.error(f"❌ ID mismatch: request={request.get('id')} != response={response.get('id')}")
+        
+        self.logger.info("=" * 60)
+        self.logger.info("INITIALIZE REQUEST PROCESSING COMPLETE")
+        self.logger.info("=" * 60)
+        
+        return response
+    
+    async def _handle_tools_list(self, request: Dict[str, Any], method: str, params: Dict[str, Any], request_id: Any, is_notification: bool) -> Optional[Dict[str, Any]]:
+        """Return the registered tools"""
+        # tools/list must have an ID (not a notification)
+        if is_notification:
+            self.logger.error("tools/list request missing ID - this is invalid")
+            return None
+        
+        response = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": self._tools_list_result
+        }
+        
+        # Safety check: never send null ID
+        if response["id"] is None:
+            self.logger.error(f"Response ID is None for {method} - this should not happen!")
+            del response["id"]
+        
+        return response
+    
+    async def _handle_tools_call(self, request: Dict[str, Any], method: str, params: Dict[str, Any], request_id: Any, is_notification: bool) -> Optional[Dict[str, Any]]:
+        """Run a tool and wrap its result as text content"""
+        # tools/call must have an ID (not a notification)
+        if is_notification:
+            self.logger.error("tools/call request missing ID - this is invalid")
+            return None
+        
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+        
+        if tool_name in self.tools:
+            # Handle MCP Inspector wrapped parameters format
+            # Check if arguments contain a single key that matches our expected input wrapper
+            if len(arguments) == 1:
+                # Get the expected wrapper key name
+                expected_wrapper_key = self._tool_meta[tool_name]['wrapper_key']
+                actual_key = next(iter(arguments.keys()))
+                
+                # If the argument key matches our wrapper key, unwrap it
+                if actual_key == expected_wrapper_key and isinstance(arguments[actual_key], dict):
+                    self.logger.debug("Unwrapping MCP Inspector format parameters for %s", tool_name)
+                    arguments = arguments[actual_key]
+                # Otherwise, check if it's the old direct format by looking for expected parameters
+                elif not _DIRECT_PARAM_KEYS.isdisjoint(arguments):
+                    self.logger.debug("Using direct parameter format for %s", tool_name)
+                    # Keep arguments as-is for backward compatibility
+                else:
+                    self.logger.debug("Unknown parameter format for %s, trying as-is", tool_name)
+            
+            # Pass request_id to tools that support progress notifications; progress is only
+            # delivered over stdio, so other transports skip reporting it altogether
+            if self._tool_meta[tool_name]['accepts_progress']:
+                arguments['_request_id'] = request_id
+                if self._current_mode == 'stdio':
+                    arguments['_progress_callback'] = ProgressThrottle(self.send_progress_notification)
+            
+            result = await self.tools[tool_name](**arguments)
+            
+            # Progress for this call must reach the client before its result
+            if self._tool_meta[tool_name]['accepts_progress']:
+                self.flush_progress()
+            response = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "result": {
+                    "content": [{
+                        "type": "text",
+                        "text": str(result)
+                    }]
+                }
+            }
+            
+            # Safety check: never send null ID
+            if response["id"] is None:
+                self.logger.error(f"Response ID is None for {method}/{tool_name} - this should not happen!")
+                del response["id"]
+            
+            return response
+        else:
+            raise Exception(f"Unknown tool: {tool_name}")
+    
+    async def _handle_ping(self, request: Dict[str, Any], method: str, params: Dict[str, Any], request_id: Any, is_notification: bool) -> Optional[Dict[str, Any]]:
+        """Answer a liveness check with an empty result"""
+        if is_notification:
+            return None
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": self._ping_result
+        }
+    
+    async def _handle_initialized_notification(self, request: Dict[str, Any], method: str, params: Dict[str, Any], request_id: Any, is_notification: bool) -> Optional[Dict[str, Any]]:
+        """Acknowledge that the client finished initializing"""
+        # This is a notification sent by the client after receiving initialize response
+        # It should not have an ID (it's a notification, not a request)
+        self.logger.info("📢 NOTIFICATIONS/INITIALIZED RECEIVED")
+        self.logger.info("Client has confirmed initialization is complete")
+        
+        if not is_notification:
+            self.logger.warning(f"notifications/initialized should be a notification (no ID), but received ID: {request_id}")
+        
+        # Log the notification details
+        self.logger.info(f"Initialization notification params: {params}")
+        
+        # Notifications don't require a response
+        self.logger.info("✅ Client initialization confirmed - server is ready for requests")
+        return None  # No response for notifications
+    
+    async def _handle_notification(self, request: Dict[str, Any], method: str, params: Dict[str, Any], request_id: Any, is_notification: bool) -> Optional[Dict[str, Any]]:
+        """Acknowledge any other notification (notifications never get a response)"""
+        # Handle other MCP notifications
+        self.logger.info(f"📢 NOTIFICATION RECEIVED: {method}")
+        self.logger.info(f"Notification params: {params}")
+        
+        if not is_notification:
+            self.logger.warning(f"Notification {method} should not have an ID, but received ID: {request_id}")
+        
+        if method in _KNOWN_NOTIFICATIONS:
+            self.logger.info(f"✅ Acknowledged known notification: {method}")
+        else:
+            self.logger.info(f"ℹ️  Received unknown notification: {method} (ignoring)")
+        
+        return None  # No response for notifications
+    
+    async def run_stdio(self):
+        """Run server in stdio mode"""
+        self._current_mode = 'stdio'
+        connection_id = f"stdio_{int(time.time())}"
+        self.logger.info(f"Starting RFC MCP Server in stdio mode (Connection ID: {connection_id})")
+        self.logger.info(f"Connection details - PID: {os.getpid()}, stdin: {sys.stdin}, stdout: {sys.stdout}")
+        print("RFC MCP Server running on stdio", file=sys.stderr)
+        
+        request_count = 0
+        last_activity = time.monotonic()
+        
+        reader = await self._open_stdin_reader()
+        
+        # Requests are handled as concurrent tasks; a task returns False once stdout is unusable
+        pending = set()
+        closing = asyncio.Event()
+        
+        def on_done(task):
+            pending.discard(task)
+            if not task.cancelled() and task.exception() is None and task.result() is False:
+                closing.set()
+        
+        while True:
+            try:
+                self.logger.debug("Waiting for input (Connection: %s, Requests processed: %s)", connection_id, request_count)
+                
+                # Check if stdin is still available
+                if sys.stdin.closed:
+                    self.logger.error(f"STDIN is closed (Connection: {connection_id})")
+                    break
+                
+                if sys.stdout.closed:
+                    self.logger.error(f"STDOUT is closed (Connection: {connection_id})")
+                    break
+                
+                line = await self._read_stdin_line(reader)
+                if not line:
+                    raise EOFError("end of input")
+                if closing.is_set():
+                    self.logger.info(f"Output closed, stopping stdio loop (Connection: {connection_id})")
+                    break
+                current_time = time.monotonic()
+                time_since_last = current_time - last_activity
+                last_activity = current_time
+                request_count += 1
+                
+                self.logger.info("Received request #%s (Connection: %s, Time since last: %.2fs)", request_count, connection_id, time_since_last)
+                
+                task = asyncio.create_task(self._handle_stdio_line(line, request_count, connection_id))
+                pending.add(task)
+                task.add_done_callback(on_done)
+                
+            except EOFError as eof_error:
+                self.logger.info(f"Received EOF - client closed connection (Connection: {connection_id}): {str(eof_error)}")
+                self.logger.info(f"Connection stats - Requests processed: {request_count}, Duration: {time.monotonic() - (last_activity - time_since_last if 'time_since_last' in locals() else 0):.2f}s")
+                break
+            except KeyboardInterrupt as kb_interrupt:
+                self.logger.info(f"Keyboard interrupt received (Connection: {connection_id}): {str(kb_interrupt)}")
+                break
+            except BrokenPipeError as pipe_error:
+                self.logger.error(f"Broken pipe in main loop - client disconnected abruptly (Connection: {connection_id}): {str(pipe_error)}")
+                break
+            except ConnectionResetError as conn_reset:
+                self.logger.error(f"Connection reset by peer (Connection: {connection_id}): {str(conn_reset)}")
+                break
+            except OSError as os_error:
+                self.logger.error(f"OS error in stdio loop (Connection: {connection_id}): {str(os_error)}")
+                if os_error.errno == 32:  # EPIPE
+                    self.logger.error("Broken pipe detected - client disconnected")
+                break
+            except Exception as e:
+                self.logger.error(f"Unexpected error in stdio loop (Connection: {connection_id}): {str(e)}", exc_info=True)
+                self.logger.error(f"Error type: {type(e).__name__}")
+                
+                # Try to send error response if possible
+                try:
+                    if not sys.stdout.closed:
+                        error_response = {
+                            "jsonrpc": "2.0",
+                            "error": {
+                                "code": -32603,
+                                "message": f"Server error: {str(e)}"
+                            }
+                        }
+                        self._write_stdout(json.dumps(error_response, ensure_ascii=True) + '\n')
+                        self.logger.info(f"Error response sent for unexpected error (Connection: {connection_id})")
+                except Exception as error_send_error:
+                    self.logger.error(f"Failed to send error response for unexpected error (Connection: {connection_id}): {str(error_send_error)}")
+                
+                # Continue processing unless it's a critical error
+                if isinstance(e, (SystemExit, KeyboardInterrupt)):
+                    break
+        
+        # Let in-flight requests finish writing their responses
+        if pending:
+            self.logger.info(f"Waiting for {len(pending)} in-flight request(s) to finish (Connection: {connection_id})")
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Connection cleanup logging
+        final_time = time.monotonic()
+        total_duration = final_time - (last_activity - time_since_last if 'time_since_last' in locals() else final_time)
+        
+        self.logger.info(f"STDIO connection closed (Connection: {connection_id})")
+        self.logger.info(f"Final connection stats:")
+        self.logger.info(f"  - Total requests processed: {request_count}")
+        self.logger.info(f"  - Connection duration: {total_duration:.2f} seconds")
+        self.logger.info(f"  - Average request rate: {request_count/max(total_duration, 1):.2f} req/sec")
+        self.logger.info(f"  - STDIN status: {'closed' if sys.stdin.closed else 'open'}")
+        self.logger.info(f"  - STDOUT status: {'closed' if sys.stdout.closed else 'open'}")
+        self.logger.info(f"  - Process PID: {os.getpid()}")
+    
+    async def _open_stdin_reader(self) -> Optional[asyncio.StreamReader]:
+        """Connect an asyncio StreamReader to stdin, or return None if stdin is not a pipe"""
+        # Terminals share their file description with stdout, and regular files cannot be
+        # watched by the event loop; both fall back to reading in a worker thread
+        if sys.stdin.isatty():
+            return None
+        reader = asyncio.StreamReader(limit=16 * 1024 * 1024)
+        protocol = asyncio.StreamReaderProtocol(reader)
+        try:
+            await asyncio.get_running_loop().connect_read_pipe(lambda: protocol, sys.stdin)
+        except (ValueError, OSError) as e:
+            self.logger.debug("stdin cannot be read asynchronously (%s), using a reader thread", e)
+            return None
+        return reader
+    
+    async def _read_stdin_line(self, reader: Optional[asyncio.StreamReader]) -> str:
+        """Read one line from stdin without blocking the event loop ('' at EOF)"""
+        if reader is None:
+            # Read bytes and decode the whole line once rather than going through the text layer
+            stdin = getattr(sys.stdin, 'buffer', sys.stdin)
+            line = await asyncio.to_thread(stdin.readline)
+            return line.decode('utf-8') if isinstance(line, bytes) else line
+        return (await reader.readline()).decode('utf-8')
+    
+    def _validate_response(self, response: Any) -> Dict[str, Any]:
+        """Return a response that is safe to send over stdio, repairing or replacing a malformed one"""
+        if not isinstance(response, dict):
+            self.logger.error(f"Response is not a dict: {type(response)} - {response}")
+            return {
+                "jsonrpc": "2.0",
+                "error": {
+                    "code": -32603,
+                    "message": "Invalid response type"
+                }
+            }
+        
+        # Ensure response has required fields
+        if "jsonrpc" not in response:
+            response["jsonrpc"] = "2.0"
+        
+        # Validate ID field if present
+        if "id" in response:
+            response_id = response["id"]
+            if response_id is None:
+                self.logger.warning(f"Response has null ID, removing it")
+                del response["id"]
+            elif not isinstance(response_id, (str, int, float)):
+                self.logger.error(f"Response has invalid ID type: {type(response_id)} - {response_id}")
+                del response["id"]
+        return response
+    
+    def _truncate_stdio_text(self, response: Dict[str, Any], longer_than: int) -> bool:
+        """Cut a tool result text longer than longer_than down to STDIO_MAX_TEXT; returns True if it was cut"""
+        result = response.get("result")
+        if not isinstance(result, dict) or "content" not in result:
+            return False
+        content_list = result["content"]
+        if not (content_list and "text" in content_list[0]):
+            return False
+        text = content_list[0]["text"]
+        if len(text) <= max(longer_than, self.STDIO_MAX_TEXT):
+            return False
+        content_list[0]["text"] = text[:self.STDIO_MAX_TEXT] + "\n\n[TRUNCATED: Response too large for stdio transport]"
+        return True
+    
+    async def _handle_stdio_line(self, line: str, request_count: int, connection_id: str) -> bool:
+        """Parse, handle and answer one stdio request line; returns False if the connection should close"""
+        try:
+            if not line.strip():
+                self.logger.debug("Empty line received, skipping (Connection: %s)", connection_id)
+                return True
+            
+            self.logger.debug("Processing input: %.100s... (Connection: %s)", line, connection_id)
+            
+            try:
+                request = _loads(line)
+                self.logger.debug("JSON parsed successfully (Connection: %s)", connection_id)
+                self.logger.debug("Parsed request: %s", request)
+                
+                # Validate basic request structure
+                if not isinstance(request, dict):
+                    self.logger.error(f"Request is not a dict: {type(request)}")
+                    return True
+                
+                if "method" not in request:
+                    self.logger.error(f"Request missing method field: {request}")
+                    return True
+                    
+            except json.JSONDecodeError as json_err:
+                self.logger.error(f"JSON parse error (Connection: {connection_id}): {str(json_err)}")
+                self.logger.error(f"Problematic input: {line}")
+                return True
+            
+            self.logger.debug("Handling request (Connection: %s)", connection_id)
+            response = await self.handle_request(request)
+            self.logger.debug("Request handled, preparing response (Connection: %s)", connection_id)
+            
+            # Only send response if it's not None (notifications don't require responses)
+            if response is not None:
+                self.logger.debug("Preparing to send response (Connection: %s)", connection_id)
+                try:
+                    # Check stdout status before serialization
+                    if sys.stdout.closed:
+                        self.logger.error(f"STDOUT closed before response serialization (Connection: {connection_id})")
+                        return False
+                    
+                    # Validate response structure before serialization
+                    response = self._validate_response(response)
+                    
+                    # Serialize with additional safety checks
+                    try:
+                        # Debug: Log the response object before serialization
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("Response object before serialization: %s", response)
+                            if "id" in response:
+                                self.logger.debug("Response ID value: %s (type: %s)", response['id'], type(response['id']).__name__)
+                        
+                        # A text that alone exceeds the truncation threshold is certain to be cut below,
+                        # so it is cut now rather than serialized in full and then serialized again
+                        if self._truncate_stdio_text(response, self.STDIO_TRUNCATE_SIZE):
+                            self.logger.warning(f"Large response text detected - truncating for stdio transport (Connection: {connection_id})")
+                        
+                        response_str = self._spliced_response_json(response) or _dumps(response)
+                        response_size = len(response_str)
+                        self.logger.info("Response serialized: %s bytes (Connection: %s)", response_size, connection_id)
+                        
+                        # Debug: Log the actual JSON string being sent
+                        self.logger.debug("JSON being sent: %.500s...", response_str)
+                        
+                        # Serializer output always parses back, so the "undefined" scan and the
+                        # round trip are debugging aids and only run when DEBUG records are kept
+                        debug_checks = self.logger.isEnabledFor(logging.DEBUG)
+                        
+                        # Final validation: ensure the JSON doesn't contain "undefined"
+                        if debug_checks and '"undefined"' in response_str:
+                            self.logger.error(f"Response contains 'undefined' string: {response_str}")
+                            # Create a safe fallback response
+                            safe_response = {
+                                "jsonrpc": "2.0",
+                                "error": {
+                                    "code": -32603,
+                                    "message": "Response validation failed"
+                                }
+                            }
+                            response_str = json.dumps(safe_response, ensure_ascii=True)
+                            response_size = len(response_str)
+                            self.logger.info(f"Safe fallback response created: {response_size} bytes")
+                        
+                        # Validate the JSON can be parsed back
+                        if debug_checks:
+                            _loads(response_str)
+                            self.logger.debug("JSON validation passed (Connection: %s)", connection_id)
+                        
+                    except (UnicodeDecodeError, UnicodeEncodeError) as unicode_error:
+                        self.logger.error(f"Unicode encoding error in response (Connection: {connection_id}): {str(unicode_error)}")
+                        # Create a safe ASCII-only response
+                        response_str = json.dumps(response, ensure_ascii=True, separators=(',', ':'))
+                        response_size = len(response_str)
+                        self.logger.info(f"Fallback ASCII response created: {response_size} bytes (Connection: {connection_id})")
+                        
+                    except json.JSONDecodeError as json_decode_error:
+                        self.logger.error(f"JSON validation failed (Connection: {connection_id}): {str(json_decode_error)}")
+                        # Create minimal error response
+                        error_response = {
+                            "jsonrpc": "2.0",
+                            "error": {
+                                "code": -32603,
+                                "message": "Response contains invalid JSON characters"
+                            }
+                        }
+                        # Add ID only if we have one from the original response
+                        if isinstance(response, dict) and response.get("id") is not None:
+                            error_response["id"] = response["id"]
+                        response_str = json.dumps(error_response, ensure_ascii=True)
+                        response_size = len(response_str)
+                        self.logger.info(f"Safe error response created: {response_size} bytes (Connection: {connection_id})")
+                    
+                    # Debug: Check for potentially problematic characters in the first 200 characters
+                    # (scanned in place, so no preview copy is made)
+                    if _PROBLEMATIC_CHARS_RE.search(response_str, 0, 200) and self.logger.isEnabledFor(logging.WARNING):
+                        problematic_chars = [f"\\x{ord(char):02x}" if ord(char) < 32 else f"\\u{ord(char):04x}"
+                                             for char in _PROBLEMATIC_CHARS_RE.findall(response_str, 0, 200)[:10]]
+                        self.logger.warning(f"Found potentially problematic characters: {problematic_chars} (Connection: {connection_id})")
+                    
+                    self.logger.debug("Response preview: %.200s...", response_str)
+                    
+                    # Check for large responses that might cause stdio issues
+                    if response_size > self.STDIO_TRUNCATE_SIZE:
+                        self.logger.warning(f"Large response detected: {response_size} bytes - truncating for stdio transport (Connection: {connection_id})")
+                        # Truncate the response if it's too large
+                        if self._truncate_stdio_text(response, self.STDIO_MAX_TEXT):
+                            response_str = _dumps(response)
+                            response_size = len(response_str)
+                            self.logger.info(f"Response truncated to {response_size} bytes (Connection: {connection_id})")
+                    
+                    # Final size check - if still too large, create a minimal error response
+                    if response_size > self.STDIO_MAX_SIZE:
+                        self.logger.error(f"Response still too large after truncation: {response_size} bytes - creating minimal response (Connection: {connection_id})")
+                        minimal_response = {
+                            "jsonrpc": "2.0",
+                            "error": {
+                                "code": -32603,
+                                "message": f"Response too large for stdio transport ({response_size} bytes). Try using HTTP mode or request metadata format only."
+                            }
+                        }
+                        # Add ID only if we have one from the original response
+                        if isinstance(response, dict) and response.get("id") is not None:
+                            minimal_response["id"] = response["id"]
+                        response_str = json.dumps(minimal_response, ensure_ascii=True)
+                        response_size = len(response_str)
+                        self.logger.info(f"Minimal error response created: {response_size} bytes (Connection: {connection_id})")
+                    
+                    # Attempt to write response with detailed error handling (stdout was checked
+                    # before serializing; a close since then surfaces as a write error below)
+                    try:
+                        # Final safety check - ensure response is stdio-safe. The encoded bytes are
+                        # what gets written, so the check costs no extra pass over the response
+                        try:
+                            response_bytes = (response_str + '\n').encode('utf-8')
+                        except UnicodeEncodeError as safety_error:
+                            self.logger.error(f"Response failed safety check (Connection: {connection_id}): {str(safety_error)}")
+                            # Create ultra-safe ASCII response
+                            safe_response = {
+                                "jsonrpc": "2.0",
+                                "error": {
+                                    "code": -32603,
+                                    "message": "Response contains unsafe characters for stdio transport"
+                                }
+                            }
+                            # Add ID only if we have one from the original response
+                            if isinstance(response, dict) and response.get("id") is not None:
+                                safe_response["id"] = response["id"]
+                            response_str = json.dumps(safe_response, ensure_ascii=True)
+                            response_bytes = (response_str + '\n').encode('utf-8')
+                            response_size = len(response_str)
+                            self.logger.info(f"Ultra-safe response created: {response_size} bytes (Connection: {connection_id})")
+                        
+                        self.logger.debug("Writing %s byte response to stdout (Connection: %s)", response_size, connection_id)
+                        
+                        # Special logging for initialize responses (the wire dump only at TRACE)
+                        is_initialize = response.get("result") is self._init_result
+                        if is_initialize and self.logger.isEnabledFor(TRACE):
+                            self.logger.log(TRACE, "📤 SENDING INITIALIZE RESPONSE")
+                            self.logger.log(TRACE, "  Response size: %s bytes", response_size)
+                            self.logger.log(TRACE, "  Response ID: %s (type: %s)", response.get('id'), type(response.get('id')).__name__)
+                            self.logger.log(TRACE, "  Raw JSON being sent: %s", response_str)
+                        
+                        # Write and flush the response
+                        self._write_stdout(response_bytes)
+                        self.logger.debug("Response written and flushed to stdout (Connection: %s)", connection_id)
+                        
+                        # Special confirmation for initialize responses
+                        if is_initialize:
+                            self.logger.info("✅ INITIALIZE RESPONSE SENT (protocol version %s)", self._init_result["protocolVersion"])
+                        
+                        self.logger.info("Response sent successfully for request #%s (Connection: %s)", request_count, connection_id)
+                        
+                    except BrokenPipeError as pipe_error:
+                        self.logger.error(f"Broken pipe during response transmission (Connection: {connection_id}): {str(pipe_error)}")
+                        self.logger.error(f"Client likely disconnected while receiving {response_size} byte response")
+                        return False
+                    except IOError as io_error:
+                        self.logger.error(f"IO error during response transmission (Connection: {connection_id}): {str(io_error)}")
+                        self.logger.error(f"Error details: errno={getattr(io_error, 'errno', 'unknown')}")
+                        return False
+                    except OSError as os_error:
+                        self.logger.error(f"OS error during response transmission (Connection: {connection_id}): {str(os_error)}")
+                        self.logger.error(f"OS error details: errno={getattr(os_error, 'errno', 'unknown')}")
+                        if os_error.errno == 32:  # EPIPE
+                            self.logger.error("Broken pipe (EPIPE) - client disconnected during response")
+                        return False
+                    except Exception as write_error:
+                        self.logger.error(f"Unexpected error during response transmission (Connection: {connection_id}): {str(write_error)}", exc_info=True)
+                        return False
+                        
+                except BrokenPipeError as pipe_error:
+                    self.logger.error(f"Broken pipe error - client disconnected (Connection: {connection_id}): {str(pipe_error)}")
+                    return False
+                except IOError as io_error:
+                    self.logger.error(f"IO error during response transmission (Connection: {connection_id}): {str(io_error)}")
+                    return False
+                except Exception as json_error:
+                    self.logger.error(f"Error serializing/sending response (Connection: {connection_id}): {str(json_error)}", exc_info=True)
+                    try:
+                        error_response = {
+                            "jsonrpc": "2.0",
+                            "error": {
+                                "code": -32603,
+                                "message": f"Response serialization error: {str(json_error)}"
+                            }
+                        }
+                        # Add ID only if we have one from the original response
+                        if isinstance(response, dict) and response.get("id") is not None:
+                            error_response["id"] = response["id"]
+                        self._write_stdout(json.dumps(error_response, ensure_ascii=True) + '\n')
+                        self.logger.info(f"Error response sent (Connection: {connection_id})")
+                    except Exception as error_send_error:
+                        self.logger.error(f"Failed to send error response (Connection: {connection_id}): {str(error_send_error)}")
+                        return False
+            else:
+                self.logger.debug("No response needed for request #%s (notification) (Connection: %s)", request_count, connection_id)
+            
+        except BrokenPipeError as pipe_error:
+            self.logger.error(f"Broken pipe while handling request #{request_count} - client disconnected abruptly (Connection: {connection_id}): {str(pipe_error)}")
+            return False
+        except ConnectionResetError as conn_reset:
+            self.logger.error(f"Connection reset by peer (Connection: {connection_id}): {str(conn_reset)}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Unexpected error handling request #{request_count} (Connection: {connection_id}): {str(e)}", exc_info=True)
+            self.logger.error(f"Error type: {type(e).__name__}")
+            
+            # Try to send error response if possible
+            try:
+                if not sys.stdout.closed:
+                    error_response = {
+                        "jsonrpc": "2.0",
+                        "error": {
+                            "code": -32603,
+                            "message": f"Server error: {str(e)}"
+                        }
+                    }
+                    self._write_stdout(json.dumps(error_response, ensure_ascii=True) + '\n')
+                    self.logger.info(f"Error response sent for unexpected error (Connection: {connection_id})")
+            except Exception as error_send_error:
+                self.logger.error(f"Failed to send error response for unexpected error (Connection: {connection_id}): {str(error_send_error)}")
+        return True
+    
+    def run_http(self, port: int = 3000):
+        """Run server in HTTP mode"""
+        self.logger.info(f"Starting RFC MCP Server in HTTP mode on port {port}")
+        
+        class MCPHTTPHandler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps client connections open between requests; every response
+            # therefore carries a Content-Length (see _send_json)
+            protocol_version = 'HTTP/1.1'
+            # Socket timeout: an idle client no longer holds its handler thread forever
+            timeout = self.HTTP_IDLE_TIMEOUT
+            
+            def __init__(self, mcp_server, *args, **kwargs):
+                self.mcp_server = mcp_server
+                super().__init__(*args, **kwargs)
+            
+            def _send_json(self, status: int, body: bytes):
+                """Send a JSON response body"""
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Access-Control-Allow-Origin', '*')
+                if self.close_connection:
+                    self.send_header('Connection', 'close')
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_OPTIONS(self):
+                """Handle CORS preflight requests"""
+                self.mcp_server.logger.debug("OPTIONS request from %s", self.client_address[0])
+                self.send_response(200)
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+                self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+            
+            def do_GET(self):
+                """Handle GET requests"""
+                client_info = f"{self.client_address[0]}:{self.client_address[1]}"
+                self.mcp_server.logger.info(f"HTTP GET {self.path} from {client_info}")
+                if self.mcp_server.logger.isEnabledFor(logging.DEBUG):
+                    self.mcp_server.logger.debug("HTTP headers: %s", dict(self.headers))
+                
+                if self.path == '/' or self.path == '/health':
+                    # Health check endpoint
+                    self._send_json(200, _HTTP_HEALTH_BODY)
+                elif self.path == '/sse' or self.path.startswith('/sse/'):
+                    # SSE endpoint for MCP Inspector compatibility
+                    self.mcp_server.logger.info(f"SSE connection request ({client_info})")
+                    
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/event-stream')
+                    self.send_header('Cache-Control', 'no-cache')
+                    self.send_header('Connection', 'keep-alive')
+                    self.send_header('Access-Control-Allow-Origin', '*')
+                    self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+                    self.end_headers()
+                    
+                    # Send initial SSE connection established event
+                    self.wfile.write(_SSE_CONNECTED_EVENT)
+                    self.wfile.flush()
+                    
+                    # Keep connection alive (simplified - real SSE would need proper handling);
+                    # the stream has no length, so it ends when the connection closes
+                    self.close_connection = True
+                    self.mcp_server.logger.info(f"SSE connection established ({client_info})")
+                else:
+                    error_response = {
+                        "error": "Not Found",
+                        "message": f"Path '{self.path}' not found. Available paths: /, /health, /mcp, /message",
+                        "available_paths": ["/", "/health", "/mcp", "/message", "/sse"]
+                    }
+                    self._send_json(404, _dumpb(error_response))
+            
+            def do_POST(self):
+                """Handle POST requests"""
+                client_info = f"{self.client_address[0]}:{self.client_address[1]}"
+                request_start = time.monotonic()
+                self.mcp_server.logger.info(f"HTTP POST {self.path} from {client_info}")
+                
+                if self.path == '/mcp' or self.path == '/message':
+                    endpoint_type = "SSE-compatible" if self.path == '/message' else "standard MCP"
+                    self.mcp_server.logger.debug("%s request to %s (%s)", endpoint_type, self.path, client_info)
+                    
+                    try:
+                        # Read request body with error handling
+                        content_length = int(self.headers.get('Content-Length', 0))
+                        
+                        if content_length == 0:
+                            self.mcp_server.logger.info(f"Empty request body - treating as connection test ({client_info})")
+                            # A body framed some other way (chunked) is left unread, so the connection
+                            # cannot carry another request
+                            if 'Transfer-Encoding' in self.headers:
+                                self.close_connection = True
+                            self._send_json(200, _HTTP_CONNECTION_TEST_BODIES[self.path])
+                            return
+                        
+                        body = self.rfile.read(content_length)
+                        
+                        if not body.strip():
+                            self.mcp_server.logger.info(f"Whitespace-only request body - treating as connection test ({client_info})")
+                            self._send_json(200, _HTTP_CONNECTION_TEST_BODIES[self.path])
+                            return
+                        
+                        if self.mcp_server.logger.isEnabledFor(logging.DEBUG):
+                            self.mcp_server.logger.debug("Received HTTP request body (%s bytes): %s...", len(body), body[:200].decode('utf-8', 'replace'))
+                        
+                        # Parse JSON request (bytes are accepted directly, no decode step)
+                        request = _loads(body)
+                        
+                        # Process request on the server's background event loop
+                        fut = asyncio.run_coroutine_threadsafe(self.mcp_server.handle_request(request), self.mcp_server._loop)
+                        response = fut.result(timeout=60)
+                        
+                        # Handle response
+                        if response is not None:
+                            spliced = self.mcp_server._spliced_response_json(response)
+                            response_json = spliced.encode('utf-8') if spliced is not None else _dumpb(response)
+                            response_size = len(response_json)
+                            processing_time = time.monotonic() - request_start
+                            
+                            self.mcp_server.logger.info(f"HTTP response ready: {response_size} bytes, processed in {processing_time:.2f}s ({client_info})")
+                            if self.mcp_server.logger.isEnabledFor(logging.DEBUG):
+                                self.mcp_server.logger.debug("Response preview: %s...", response_json[:200].decode('utf-8', 'replace'))
+                            
+                            self._send_json(200, response_json)
+                            
+                            self.mcp_server.logger.info(f"HTTP response sent successfully ({client_info})")
+                        else:
+                            # For notifications
+                            processing_time = time.monotonic() - request_start
+                            self.mcp_server.logger.info(f"HTTP notification processed in {processing_time:.2f}s ({client_info})")
+                            
+                            self._send_json(200, _HTTP_NOTIFICATION_BODY)
+                    
+                    except json.JSONDecodeError as json_err:
+                        self.mcp_server.logger.error(f"JSON parse error ({client_info}): {str(json_err)}")
+                        error_response = {
+                            "jsonrpc": "2.0",
+                            "error": {
+                                "code": -32700,
+                                "message": f"Parse error: {str(json_err)}"
+                            }
+                        }
+                        self._send_json(400, _dumpb(error_response))
+                    
+                    except Exception as e:
+                        processing_time = time.monotonic() - request_start
+                        self.mcp_server.logger.error(f"Error processing HTTP request from {client_info} after {processing_time:.2f}s: {str(e)}", exc_info=True)
+                        # The request body may not have been consumed, so the connection cannot be reused
+                        self.close_connection = True
+                        
+                        error_response = {
+                            "jsonrpc": "2.0",
+                            "error": {
+                                "code": -32603,
+                                "message": f"Server error: {str(e)}"
+                            }
+                        }
+                        self._send_json(500, _dumpb(error_response))
+                        
+                    except Exception as e:
+                        self.mcp_server.logger.error(f"Error processing HTTP request: {str(e)}", exc_info=True)
+                        
+                        error_response = {
+                            "jsonrpc": "2.0",
+                            "error": {
+                                "code": -32603,
+                                "message": f"Server error: {str(e)}"
+                            }
+                        }
+                        
+                        self._send_json(500, _dumpb(error_response))
+                else:
+                    # The unread request body would otherwise be parsed as the next request
+                    self.close_connection = True
+                    error_response = {
+                        "error": "Not Found",
+                        "message": f"Path '{self.path}' not found. Available paths: /, /health, /mcp, /message",
+                        "available_paths": ["/", "/health", "/mcp", "/message", "/sse"]
+                    }
+                    self._send_json(404, _dumpb(error_response))
+            
+            def log_message(self, format, *args):
+                """Override to use our logger"""
+                self.mcp_server.logger.debug("HTTP: " + format, *args)
+        
+        # Create handler with MCP server reference
+        def handler_factory(*args, **kwargs):
+            return MCPHTTPHandler(self, *args, **kwargs)
+        
+        # Start HTTP server (one thread per connection, all sharing the event loop below)
+        server = ThreadingHTTPServer(('localhost', port), handler_factory)
+        server.daemon_threads = True
+        print(f"RFC MCP Server running on HTTP port {port}", file=sys.stderr)
+        print(f"Health check: http://localhost:{port}/health", file=sys.stderr)
+        print(f"MCP endpoint: http://localhost:{port}/mcp", file=sys.stderr)
+        
+        # One event loop for the lifetime of the server, shared by all requests
+        self.background_loop()
+        
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down HTTP server...", file=sys.stderr)
+            server.shutdown()
+        finally:
+            self.stop_background_loop()
+
+
+# Simple HTML parser for extracting content
+class SimpleHTMLParser(HTMLParser):
+    HEADING_TAGS = ('h2', 'h3', 'h4')
+    
+    def __init__(self):
+        super().__init__()
+        self.text_content = []
+        self._title_parts = []
+        self.in_title = False
+        self.h1_text = None  # text of the first <h1>, if any
+        self.headings = []  # text of every <h2>-<h4>, in document order
+        self._heading_tag = None
+        self._heading_parts = []
+    
+    @property
+    def title(self) -> str:
+        return ''.join(self._title_parts)
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'title':
+            self.in_title = True
+        elif self._heading_tag is None and (tag == 'h1' or tag in self.HEADING_TAGS):
+            self._heading_tag = tag
+            self._heading_parts = []
+    
+    def handle_endtag(self, tag):
+        if tag == 'title':
+            self.in_title = False
+        elif self._heading_tag is not None and (
+                tag == self._heading_tag or (tag in self.HEADING_TAGS and self._heading_tag in self.HEADING_TAGS)):
+            text = ''.join(self._heading_parts).strip()
+            if self._heading_tag != 'h1':
+                self.headings.append(text)
+            elif self.h1_text is None:
+                self.h1_text = text
+            self._heading_tag = None
+    
+    def handle_data(self, data):
+        stripped = data.strip()
+        if self.in_title:
+            self._title_parts.append(stripped)
+        if self._heading_tag is not None:
+            self._heading_parts.append(data)
+        self.text_content.append(stripped)
+    
+    def get_text(self):
+        return ' '.join(filter(None, self.text_content))
+
+
+# Streaming parser for RFC Editor search result tables
+class RFCSearchParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self.in_tr = False
+        self.in_td = False
+        self.cells = []
+        self.cell_text = []
+        self.row_markup = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr':
+            self._finish_row()
+            self.in_tr = True
+        elif tag == 'td' and self.in_tr:
+            self._finish_cell()
+            self.in_td = True
+        if self.in_tr:
+            # Keep attribute values (e.g. links to /info/rfcNNNN) for RFC number lookup
+            self.row_markup.extend(value for _, value in attrs if value)
+    
+    def handle_endtag(self, tag):
+        if tag == 'td':
+            self._finish_cell()
+        elif tag == 'tr':
+            self._finish_row()
+    
+    def handle_data(self, data):
+        if self.in_tr:
+            self.row_markup.append(data)
+            if self.in_td:
+                self.cell_text.append(data)
+    
+    def close(self):
+        super().close()
+        self._finish_row()
+    
+    def _finish_cell(self):
+        if self.in_td:
+            self.cells.append(''.join(self.cell_text).strip())
+            self.cell_text = []
+            self.in_td = False
+    
+    def _finish_row(self):
+        if self.in_tr:
+            self._finish_cell()
+            self.rows.append({'cells': self.cells, 'markup': ' '.join(self.row_markup)})
+            self.cells = []
+            self.row_markup = []
+            self.in_tr = False
+
+
+class DiskCache:
+    """SQLite-backed key/value store that keeps cached documents across restarts"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS docs(key TEXT PRIMARY KEY, ts REAL, payload BLOB, validators BLOB)')
+        # Databases created before validators were stored lack the column
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(docs)')}
+        if 'validators' not in columns:
+            self._conn.execute('ALTER TABLE docs ADD COLUMN validators BLOB')
+        self._conn.commit()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, ttl: Optional[float] = None) -> Any:
+        """Return a stored value, or None if it is missing or older than ttl seconds"""
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+        fetched_at, value, _ = entry
+        if ttl is not None and time.time() - fetched_at > ttl:
+            return None
+        return value
+    
+    def get_entry(self, key: str) -> Optional[tuple]:
+        """Return (fetched_at, value, validators) for a stored key, or None"""
+        with self._lock:
+            row = self._conn.execute('SELECT ts, payload, validators FROM docs WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], _loads(row[1]), _loads(row[2]) if row[2] is not None else None
+    
+    def set(self, key: str, value: Any, validators: Optional[Dict[str, str]] = None) -> None:
+        """Store a JSON-serializable value (and its HTTP cache validators) stamped with the current time"""
+        payload = _dumpb(value)
+        validators_blob = _dumpb(validators) if validators is not None else None
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO docs(key, ts, payload, validators) VALUES (?, ?, ?, ?)',
+                               (key, time.time(), payload, validators_blob))
+            self._conn.commit()
+    
+    def touch(self, key: str) -> None:
+        """Restamp a stored value as freshly fetched"""
+        with self._lock:
+            self._conn.execute('UPDATE docs SET ts = ? WHERE key = ?', (time.time(), key))
+            self._conn.commit()
+    
+    def invalidate(self, prefix: str = '') -> int:
+        """Delete every stored value whose key starts with prefix; returns the count"""
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM docs WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+            self._conn.commit()
+            return cursor.rowcount
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class BoundedCache:
+    """Size-bounded LRU cache with optional time-to-live, settable per key prefix
+    
+    Expired entries stored with HTTP validators (ETag/Last-Modified) are kept until evicted
+    so they can be revalidated with a conditional GET instead of downloaded again.
+    """
+    
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None, prefix_ttls: Optional[Dict[str, float]] = None,
+                 backing: Optional[DiskCache] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.prefix_ttls = prefix_ttls or {}
+        self.backing = backing  # optional write-through store consulted on memory misses
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _ttl_for(self, key: str) -> Optional[float]:
+        """Return the time-to-live for a key (the first matching prefix wins, else the default)"""
+        for prefix, ttl in self.prefix_ttls.items():
+            if key.startswith(prefix):
+                return ttl
+        return self.ttl
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a cached value, or default if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value, validators = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    return value
+                if validators is None:
+                    del self._entries[key]
+                # An expired entry is never served from disk either
+                return default
+        if self.backing is None:
+            return default
+        entry = self.backing.get_entry(key)
+        if entry is None:
+            return default
+        fetched_at, value, validators = entry
+        ttl = self._ttl_for(key)
+        if ttl is None:
+            self._store(key, value, None, validators)
+            return value
+        remaining = ttl - (time.time() - fetched_at)
+        if remaining <= 0:
+            return default
+        # Promote disk hits into memory for whatever is left of their lifetime
+        self._store(key, value, time.monotonic() + remaining, validators)
+        return value
+    
+    def get_stale(self, key: str) -> Optional[tuple]:
+        """Return (value, validators) for an entry that can be revalidated, expired or not, else None"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self.backing is not None:
+            entry = self.backing.get_entry(key)
+        if entry is None or entry[2] is None:
+            return None
+        return entry[1], entry[2]
+    
+    def set(self, key: str, value: Any, validators: Optional[Dict[str, str]] = None) -> None:
+        """Store a value, evicting the least recently used entries when full"""
+        self._store(key, value, self._expiry_for(key), validators)
+        if self.backing is not None:
+            self.backing.set(key, value, validators)
+    
+    def refresh(self, key: str, value: Any, validators: Optional[Dict[str, str]] = None) -> None:
+        """Renew the lifetime of a value the upstream server reported as not modified"""
+        self._store(key, value, self._expiry_for(key), validators)
+        if self.backing is not None:
+            self.backing.touch(key)
+    
+    def _expiry_for(self, key: str) -> Optional[float]:
+        """Return the monotonic expiry time for a key stored now"""
+        ttl = self._ttl_for(key)
+        return time.monotonic() + ttl if ttl is not None else None
+    
+    def _store(self, key: str, value: Any, expires_at: Optional[float], validators: Optional[Dict[str, str]] = None) -> None:
+        """Insert a value in memory only"""
+        with self._lock:
+            self._entries[key] = (expires_at, value, validators)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, prefix: str = '') -> int:
+        """Drop every entry whose key starts with prefix (all entries by default); returns the count"""
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+        if self.backing is not None:
+            self.backing.invalidate(prefix)
+        return len(keys)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Cache for storing fetched documents. Published RFCs never change; drafts get new
+# revisions, so "latest version" results (and the revision a bare name resolved to) must not be served for long
+document_cache = BoundedCache(maxsize=512, prefix_ttls={'rfc_': 24 * 3600, 'draft_': 3600, 'latest_': 3600})
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_url(url: str) -> tuple:
+    """Split a URL into its connection pool key (scheme, host, port) and request path"""
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https'):
+        raise Exception(f"Unsupported URL scheme: {parts.scheme}")
+    key = (scheme, parts.hostname, parts.port or (443 if scheme == 'https' else 80))
+    path = parts.path or '/'
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return key, path
+
+
+class HTTPConnectionPool:
+    """Keep-alive connection pool for upstream HTTP(S) fetches"""
+    
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+    RETRY_CODES = (429, 503)  # rate limited / temporarily unavailable
+    
+    def __init__(self, maxsize: int = 16, timeout: float = 30, retries: int = 3, max_redirects: int = 5,
+                 max_concurrent: int = 8, backoff: float = 0.5):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.retries = retries
+        self.max_redirects = max_redirects
+        self.backoff = backoff
+        self.headers = {'User-Agent': f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"}
+        self._idle: Dict[tuple, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: Optional[ssl.SSLContext] = None  # shared by all HTTPS connections, see _acquire
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Caps requests in flight across all callers so bursts do not trip upstream rate limits
+        self.set_max_concurrent(max_concurrent)
+        self.logger = logging.getLogger('rfc_server.http_pool')
+    
+    def set_max_concurrent(self, max_concurrent: int) -> None:
+        """Set how many upstream requests may be in flight at once (call before requests are made)"""
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        # Async callers get a dedicated executor of the same size, so fetches waiting for a slot
+        # never tie up the default executor that parsing and stdin reads run on
+        previous, self._executor = self._executor, ThreadPoolExecutor(max_workers=max_concurrent,
+                                                                      thread_name_prefix='http-pool')
+        if previous is not None:
+            previous.shutdown(wait=False)
+    
+    async def run(self, func: Callable, *args) -> Any:
+        """Run a blocking request method (e.g. request_text) on the pool's executor and await it"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, *args))
+    
+    def request(self, url: str, read_body: Optional[Callable[[http.client.HTTPResponse], Any]] = None) -> Any:
+        """GET a URL following redirects and return the response body (as produced by read_body)"""
+        return self._follow(url, read_body or http.client.HTTPResponse.read)[2]
+    
+    def request_text(self, url: str, chunk_size: int = 65536) -> str:
+        """GET a URL and decode the UTF-8 body chunk by chunk as it is read"""
+        return self.request(url, lambda response: self._read_text(response, chunk_size))
+    
+    def request_text_conditional(self, url: str, validators: Optional[Dict[str, str]] = None) -> tuple:
+        """GET a URL as text, revalidating with ETag/Last-Modified validators from an earlier fetch
+        
+        Returns (text, validators); text is None when the server answered 304 Not Modified.
+        """
+        extra_headers = {}
+        if validators:
+            if validators.get('etag'):
+                extra_headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                extra_headers['If-Modified-Since'] = validators['last_modified']
+        status, headers, text = self._follow(url, self._read_text, extra_headers)
+        if status == 304:
+            return None, validators
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return text, None
+        return text, {'url': url, 'etag': etag, 'last_modified': last_modified}
+    
+    def _follow(self, url: str, read_body: Callable[[http.client.HTTPResponse], Any],
+                extra_headers: Optional[Dict[str, str]] = None) -> tuple:
+        """GET a URL following redirects and retrying rate-limited responses; returns (status, headers, body)"""
+        redirects = 0
+        throttled = 0
+        while True:
+            with self._slots:
+                status, reason, headers, body = self._get(url, read_body, extra_headers)
+            if status in self.RETRY_CODES and throttled < self.retries:
+                delay = self._retry_delay(headers.get('Retry-After'), throttled)
+                throttled += 1
+                self.logger.warning(f"HTTP {status} from {url}, retrying in {delay:.1f}s ({throttled}/{self.retries})")
+                time.sleep(delay)
+                continue
+            location = headers.get('Location')
+            if status in self.REDIRECT_CODES and location:
+                if redirects == self.max_redirects:
+                    raise Exception(f"Too many redirects (limit {self.max_redirects})")
+                redirects += 1
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if status >= 400:
+                raise Exception(f"HTTP Error {status}: {reason}")
+            return status, headers, body
+    
+    def _retry_delay(self, retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait before retrying: the server's Retry-After if given, else jittered exponential backoff"""
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), self.timeout)
+        return self.backoff * 2 ** attempt + random.uniform(0, self.backoff)
+    
+    @staticmethod
+    def _read_text(response: http.client.HTTPResponse, chunk_size: int = 65536) -> str:
+        """Decode a UTF-8 response body chunk by chunk as it is read"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        parts = []
+        for chunk in iter(lambda: response.read(chunk_size), b''):
+            # RFC and draft text is nearly always pure ASCII, which needs no UTF-8 decoding
+            # (only safe when no partial multi-byte sequence is pending in the decoder)
+            if chunk.isascii() and not decoder.getstate()[0]:
+                parts.append(chunk.decode('ascii'))
+            else:
+                parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
+    
+    def request_json(self, url: str) -> Any:
+        """GET a URL and parse the JSON body straight from the response bytes"""
+        return _loads(self.request(url))
+    
+    def _get(self, url: str, read_body: Callable[[http.client.HTTPResponse], Any],
+             extra_headers: Optional[Dict[str, str]] = None) -> tuple:
+        """Issue a single GET on a pooled connection"""
+        key, path = _split_url(url)
+        headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+        
+        attempt = 0
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = read_body(response)
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                # Idle keep-alive connections may have been dropped by the server - retry on a new one
+                if reused and attempt < self.retries:
+                    attempt += 1
+                    self.logger.debug("Stale pooled connection to %s, retrying (%s/%s)", key[1], attempt, self.retries)
+                    continue
+                raise
+            except BaseException:
+                # Anything else (e.g. a body that is not valid UTF-8) leaves the connection in an
+                # unknown state, so it is not returned to the pool
+                conn.close()
+                raise
+            
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+            return response.status, response.reason, response.headers, body
+    
+    def _acquire(self, key: tuple) -> tuple:
+        """Return an idle connection for key, or open a new one"""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port = key
+        if scheme == 'https':
+            # Building a context loads the CA bundle (tens of milliseconds), so it is done once
+            with self._lock:
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+    
+    def _release(self, key: tuple, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full"""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+
+# Shared connection pool for all upstream services
+http_pool = HTTPConnectionPool(maxsize=16, timeout=30, retries=3, max_concurrent=8)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into a single in-flight task"""
+    
+    def __init__(self):
+        self._tasks: Dict[tuple, asyncio.Task] = {}
+    
+    async def run(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Await the task already running for key, or start one from factory()"""
+        # Tasks are per event loop: stdio tool calls and resource reads run on different loops
+        key = (asyncio.get_running_loop(), key)
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _, key=key: self._tasks.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the fetch for everyone else
+        return await asyncio.shield(task)
+    
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+
+# Upstream fetches currently in progress, keyed like document_cache
+inflight_fetches = SingleFlight()
+
+
+async def _fetch_text_revalidated(url: str, cache_key: str) -> tuple:
+    """Fetch a document's text, revalidating an expired cache entry that was fetched from the same URL
+    
+    Returns (text, validators, unchanged): on 304 Not Modified text is None and unchanged is the
+    cached value, whose lifetime has been renewed.
+    """
+    stale = document_cache.get_stale(cache_key)
+    validators = stale[1] if stale is not None and stale[1].get('url') == url else None
+    try:
+        text, validators = await http_pool.run(http_pool.request_text_conditional, url, validators)
+    except Exception as e:
+        raise Exception(f"Failed to fetch {url}: {str(e)}")
+    if text is None:
+        logging.getLogger('rfc_server.http_pool').debug("%s not modified, reusing cached copy", url)
+        document_cache.refresh(cache_key, stale[0], validators)
+        return None, validators, stale[0]
+    return text, validators, None
+
+# Background thread writing queued log records (see setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Below DEBUG: full wire dumps of protocol exchanges, off unless --log-level TRACE is given
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+
+def _stop_log_listener() -> None:
+    """Flush queued log records and stop the listener thread"""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+atexit.register(_stop_log_listener)
+
+
+def setup_logging(log_dir: str = "/tmp/rfc_server", log_level: str = "INFO") -> logging.Logger:
+    """Setup logging with rotation and instance-specific files"""
+    
+    # Create log directory if it doesn't exist
+    os.makedirs(log_dir, exist_ok=True)
+    
+    # Create instance-specific log filename with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    pid = os.getpid()
+    log_filename = f"rfc_server_{timestamp}_{pid}.log"
+    log_path = os.path.join(log_dir, log_filename)
+    
+    # Create logger
+    logger = logging.getLogger('rfc_server')
+    logger.setLevel(logging.getLevelName(log_level.upper()))
+    
+    # Clear any existing handlers
+    logger.handlers.clear()
+    
+    # Create rotating file handler (10MB max, keep 5 files)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path,
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8'
+    )
+    
+    # Create console handler for errors
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(logging.WARNING)
+    
+    # Create formatter
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+    )
+    
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+    
+    # Log calls only enqueue records; a listener thread does the file and console I/O
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _log_listener.start()
+    
+    # Log startup information
+    logger.info(f"RFC MCP Server starting - PID: {pid}")
+    logger.info(f"Log file: {log_path}")
+    logger.info(f"Log level: {log_level}")
+    logger.info(f"Python version: {sys.version}")
+    
+    return logger
+
+# Global logger instance
+logger = setup_logging()
+
+class SimpleRFCService:
+    """Simplified RFC service using only standard library"""
+    
+    BASE_URL = "https://www.ietf.org/rfc"
+    
+    def __init__(self):
+        self.logger = logging.getLogger('rfc_server.rfc_service')
+    
+    async def fetch_url(self, url: str) -> str:
+        """Fetch content from URL without blocking the event loop"""
+        try:
+            return await http_pool.run(http_pool.request_text, url)
+        except Exception as e:
+            raise Exception(f"Failed to fetch {url}: {str(e)}")
+    
+    async def fetch_rfc(self, rfc_number: str) -> Dict[str, Any]:
+        """Fetch an RFC document by its number"""
+        self.logger.info(f"Fetching RFC {rfc_number}")
+        
+        cache_key = f"rfc_{rfc_number}"
+        cached = document_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("RFC %s found in cache", rfc_number)
+            return cached
+        
+        return await inflight_fetches.run(cache_key, lambda: self._download_rfc(rfc_number, cache_key))
+    
+    async def _download_rfc(self, rfc_number: str, cache_key: str) -> Dict[str, Any]:
+        """Download and parse an RFC into the cache"""
+        # Try TXT format (more reliable)
+        txt_url = f"{self.BASE_URL}/rfc{rfc_number}.txt"
+        self.logger.debug("Fetching RFC from URL: %s", txt_url)
+        
+        try:
+            txt_content, validators, unchanged = await _fetch_text_revalidated(txt_url, cache_key)
+            if unchanged is not None:
+                self.logger.info(f"RFC {rfc_number} not modified upstream, reusing cached copy")
+                return unchanged
+            self.logger.info(f"Successfully fetched RFC {rfc_number} ({len(txt_content)} bytes)")
+            
+            rfc_data = self._parse_txt_rfc(txt_content, rfc_number, txt_url)
+            document_cache.set(cache_key, rfc_data, validators)
+            
+            self.logger.debug("Parsed RFC %s: %s sections", rfc_number, len(rfc_data['sections']))
+            return rfc_data
+        except Exception as e:
+            self.logger.error(f"Failed to fetch RFC {rfc_number}: {str(e)}")
+            raise Exception(f"Failed to fetch RFC {rfc_number}: {str(e)}")
+    
+    async def search_rfcs(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search for RFCs using the RFC Editor search API"""
+        self.logger.info(f"Searching RFCs for query: {query}")
+        
+        try:
+            # Use the RFC Editor search API
+            search_url = f"https://www.rfc-editor.org/search/rfc_search_detail.php?title={urllib.parse.quote(query)}&pubstatus%5B%5D=Any&pub_date_type=any"
+            self.logger.debug("RFC search URL: %s", search_url)
+            
+            html_content = await self.fetch_url(search_url)
+            results = self._parse_rfc_search_results(html_content)
+            
+            self.logger.info(f"RFC search found {len(results)} results")
+            return results[:limit]
+            
+        except Exception as e:
+            self.logger.error(f"RFC search failed: {str(e)}")
+            # Don't return mock data - return empty list if search fails
+            return []
+    
+    def _parse_rfc_search_results(self, html: str) -> List[Dict[str, Any]]:
+        """Parse RFC search results from HTML"""
+        results = []
+        
+        try:
+            # The RFC Editor search returns results in a table - scan it in a single pass
+            parser = RFCSearchParser()
+            parser.feed(html)
+            parser.close()
+            
+            for row in parser.rows:
+                # Look for RFC number in the row
+                rfc_match = _RFCNUM_RE.search(row['markup'])
+                if not rfc_match:
+                    continue
+                
+                rfc_number = rfc_match.group(1)
+                clean_cells = row['cells']
+                
+                if len(clean_cells) >= 3:
+                    # Try to extract title (usually in second or third cell)
+                    title = ""
+                    for cell in clean_cells[1:4]:  # Check cells 1-3 for title
+                        if len(cell) > 10 and not cell.isdigit():  # Likely a title
+                            title = cell
+                            break
+                    
+                    if title:
+                        results.append({
+                            'number': rfc_number,
+                            'title': title,
+                            'authors': [],  # Would need more complex parsing
+                            'date': '',     # Would need more complex parsing
+                            'status': '',   # Would need more complex parsing
+                            'abstract': '',
+                            'url': f"https://www.rfc-editor.org/info/rfc{rfc_number}"
+                        })
+            
+            self.logger.debug("Parsed %s RFC search results", len(results))
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Failed to parse RFC search results: {str(e)}")
+            return []
+    
+    def _parse_txt_rfc(self, text: str, rfc_number: str, url: str) -> Dict[str, Any]:
+        """Parse RFC from TXT format in a single pass over its lines"""
+        scan = _scan_txt_document(text, header_titles=True)
+        
+        title = scan['field_title'] or scan['dated_title']
+        if not title:
+            title = next((t for t in scan['pattern_titles'] if t), f"RFC {rfc_number}")
+        
+        return {
+            'metadata': {
+                'number': rfc_number,
+                'title': title,
+                'authors': scan['authors'],
+                'date': '',
+                'status': '',
+                'abstract': scan['abstract'],
+                'url': url
+            },
+            'sections': scan['sections'],
+            # The raw text is rarely requested, so it is cached compressed
+            'fullText': LazyText(text)
+        }
+    
+    
+class SimpleOpenIDService:
+    """OpenID Foundation drafts and standards service"""
+    
+    BASE_URL = "https://openid.net"
+    SPECS_URL = "https://openid.net/developers/specs"
+    
+    def __init__(self):
+        self.logger = logging.getLogger('rfc_server.openid_service')
+    
+    async def fetch_url(self, url: str) -> str:
+        """Fetch content from URL without blocking the event loop"""
+        try:
+            return await http_pool.run(http_pool.request_text, url)
+        except Exception as e:
+            raise Exception(f"Failed to fetch {url}: {str(e)}")
+    
+    async def fetch_openid_spec(self, spec_name: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
+        """Fetch an OpenID specification by name"""
+        self.logger.info(f"Fetching OpenID spec: {spec_name}")
+        
+        cache_key = f"openid_{spec_name}"
+        cached = document_cache.get(cache_key)
+        if cached is not None:
+            if progress_callback and request_id:
+                await progress_callback(request_id, 80, "Found in cache, retrieving...")
+            return cached
+        
+        if progress_callback and request_id:
+            await progress_callback(request_id, 20, "Searching OpenID specifications...")
+        
+        # Try to find the spec URL
+        spec_url = await self._find_spec_url(spec_name, request_id, progress_callback)
+        
+        if not spec_url:
+            raise Exception(f"Could not find OpenID specification: {spec_name}")
+        
+        if progress_callback and request_id:
+            await progress_callback(request_id, 50, f"Fetching specification from {spec_url}")
+        
+        try:
+            content, validators, unchanged = await _fetch_text_revalidated(spec_url, cache_key)
+            if unchanged is not None:
+                self.logger.info(f"OpenID spec {spec_name} not modified upstream, reusing cached copy")
+                return unchanged
+            self.logger.info(f"Successfully fetched content from {spec_url}, length: {len(content)}")
+            
+            if progress_callback and request_id:
+                await progress_callback(request_id, 70, "Parsing specification content...")
+            
+            spec_data = self._parse_openid_spec(content, spec_name, spec_url)
+            self.logger.info(f"Successfully parsed OpenID spec {spec_name}")
+            document_cache.set(cache_key, spec_data, validators)
+            return spec_data
+            
+        except Exception as e:
+            self.logger.error(f"Failed to fetch OpenID spec {spec_name}: {str(e)}")
+            raise Exception(f"Failed to fetch OpenID spec {spec_name}: {str(e)}")
+    
+    async def _find_spec_url(self, spec_name: str, request_id: str = None, progress_callback = None) -> Optional[str]:
+        """Find the URL for an OpenID specification"""
+        try:
+            if progress_callback and request_id:
+                await progress_callback(request_id, 25, "Fetching OpenID specs page...")
+            
+            # Fetch the main specs page
+            specs_content = await self.fetch_url(self.SPECS_URL)
+            
+            if progress_callback and request_id:
+                await progress_callback(request_id, 35, "Searching for specification...")
+            
+            # Common OpenID spec patterns and their likely URLs
+            spec_patterns = {
+                'openid-connect-core': 'https://openid.net/specs/openid-connect-core-1_0.html',
+                'openid-connect-discovery': 'https://openid.net/specs/openid-connect-discovery-1_0.html',
+                'openid-connect-registration': 'https://openid.net/specs/openid-connect-registration-1_0.html',
+                'openid-connect-session': 'https://openid.net/specs/openid-connect-session-1_0.html',
+                'openid-connect-frontchannel': 'https://openid.net/specs/openid-connect-frontchannel-1_0.html',
+                'openid-connect-backchannel': 'https://openid.net/specs/openid-connect-backchannel-1_0.html',
+                'oauth-2.0-multiple-response-types': 'https://openid.net/specs/oauth-v2-multiple-response-types-1_0.html',
+                'oauth-2.0-form-post-response-mode': 'https://openid.net/specs/oauth-v2-form-post-response-mode-1_0.html',
+                'openid-financial-api-part-1': 'https://openid.net/specs/openid-financial-api-part-1-1_0.html',
+                'openid-financial-api-part-2': 'https://openid.net/specs/openid-financial-api-part-2-1_0.html',
+            }
+            
+            # Normalize spec name for lookup
+            normalized_name = spec_name.lower().replace('_', '-').replace(' ', '-')
+            
+            # Try direct pattern match first
+            if normalized_name in spec_patterns:
+                return spec_patterns[normalized_name]
+            
+            # Try partial matches
+            for pattern, url in spec_patterns.items():
+                if normalized_name in pattern or pattern in normalized_name:
+                    return url
+            
+            # Try to parse the specs page for links that might match the spec name
+            links = _SPEC_LINK_RE.findall(specs_content)
+            
+            for url, link_text in links:
+                if (normalized_name in link_text.lower() or 
+                    normalized_name in url.lower() or
+                    any(word in link_text.lower() for word in normalized_name.split('-') if len(word) > 3)):
+                    
+                    # Make URL absolute if relative
+                    if url.startswith('/'):
+                        return f"{self.BASE_URL}{url}"
+                    elif not url.startswith('http'):
+                        return f"{self.BASE_URL}/specs/{url}"
+                    else:
+                        return url
+            
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"Error finding spec URL for {spec_name}: {e}")
+            return None
+    
+    def _parse_openid_spec(self, content: str, spec_name: str, url: str) -> Dict[str, Any]:
+        """Parse OpenID specification content"""
+        
+        self.logger.debug("Parsing OpenID spec content, length: %s", len(content))
+        
+        # Try to extract title
+        title_match = _HTML_TITLE_RE.search(content)
+        title = title_match.group(1).strip() if title_match else spec_name
+        self.logger.debug("Extracted title: %s", title)
+        
+        # Try to extract abstract/introduction
+        abstract = ""
+        for pattern in _SPEC_ABSTRACT_RES:
+            match = pattern.search(content)
+            if match:
+                # Clean HTML tags, limiting the length
+                abstract = _strip_tags(content, 500, match.start('body'), match.end('body'))
+                break
+        
+        # Extract sections
+        sections = []
+        
+        # Look for section headings
+        for pattern in _SPEC_SECTION_RES:
+            for match in pattern.finditer(content):
+                level = int(match.group('level'))
+                # Only the first pattern captures an id attribute
+                section_id = match.groupdict().get('id') or ""
+                section_title = match.group('title').strip()
+                
+                # Extract content after this heading until next heading of same or higher level
+                start_pos = match.end()
+                next_match = _SPEC_NEXT_HEADING_RES[level].search(content, start_pos)
+                
+                if next_match:
+                    end_pos = next_match.start()
+                else:
+                    end_pos = start_pos + 2000  # Limit content
+                
+                # Clean HTML from content, limiting the length
+                clean_content = _strip_tags(content, 1000, start_pos, end_pos)
+                
+                sections.append({
+                    'title': section_title,
+                    'content': clean_content,
+                    'level': level,
+                    'id': section_id
+                })
+        
+        # Extract authors if available
+        authors = []
+        for pattern in _SPEC_AUTHOR_RES:
+            for match in pattern.finditer(content):
+                author = match.group('value').strip()
+                if author and author not in authors:
+                    authors.append(author)
+        
+        # Extract date
+        date = ""
+        for pattern in _SPEC_DATE_RES:
+            match = pattern.search(content)
+            if match:
+                date = match.group('value').strip()
+                break
+        
+        return {
+            'metadata': {
+                'name': spec_name,
+                'title': title,
+                'authors': authors,
+                'date': date,
+                'abstract': abstract,
+                'url': url,
+                'type': 'OpenID Specification'
+            },
+            'sections': sections,
+            'fullText': content[:10000]  # Limit full text size
+        }
+    
+    async def search_openid_specs(self, query: str, limit: int = 10, request_id: str = None, progress_callback = None) -> List[Dict[str, Any]]:
+        """Search OpenID specifications"""
+        self.logger.info(f"Searching OpenID specs for: {query}")
+        
+        try:
+            if progress_callback and request_id:
+                await progress_callback(request_id, 20, "Fetching OpenID specifications list...")
+            
+            specs_content = await self.fetch_url(self.SPECS_URL)
+            
+            if progress_callback and request_id:
+                await progress_callback(request_id, 50, "Parsing specifications...")
+            
+            results = []
+            
+            # Extract links and titles from the specs page
+            links = [match.group('url', 'title') for match in _SPEC_ANCHOR_RE.finditer(specs_content)]
+            
+            query_lower = query.lower()
+            
+            for url, title in links:
+                # The link pattern's text group cannot contain tags
+                title_clean = title.strip()
+                
+                # Check if query matches title or URL
+                if (query_lower in title_clean.lower() or 
+                    query_lower in url.lower() or
+                    any(word in title_clean.lower() for word in query_lower.split() if len(word) > 2)):
+                    
+                    # Make URL absolute
+                    if url.startswith('/'):
+                        full_url = f"{self.BASE_URL}{url}"
+                    elif not url.startswith('http'):
+                        full_url = f"{self.BASE_URL}/specs/{url}"
+                    else:
+                        full_url = url
+                    
+                    results.append({
+                        'name': title_clean,
+                        'title': title_clean,
+                        'url': full_url,
+                        'type': 'OpenID Specification',
+                        'abstract': '',
+                        'authors': [],
+                        'date': ''
+                    })
+                    
+                    if len(results) >= limit:
+                        break
+            
+            if progress_callback and request_id:
+                await progress_callback(request_id, 80, f"Found {len(results)} matching specifications")
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"OpenID search failed: {e}")
+            return []
+
+
+class SimpleInternetDraftService:
+    """Simplified Internet Draft service"""
+    
+    BASE_URL = "https://datatracker.ietf.org"
+    # Seconds a TXT download may take before the HTML rendering is requested alongside it
+    HTML_HEDGE_DELAY = 2.0
+    # Seconds a name search may take before the title search is requested alongside it
+    SEARCH_HEDGE_DELAY = 2.0
+    
+    def __init__(self):
+        self.logger = logging.getLogger('rfc_server.draft_service')
+    
+    async def fetch_url(self, url: str) -> str:
+        """Fetch content from URL without blocking the event loop"""
+        try:
+            return await http_pool.run(http_pool.request_text, url)
+        except Exception as e:
+            raise Exception(f"Failed to fetch {url}: {str(e)}")
+    
+    async def fetch_json(self, url: str) -> Any:
+        """Fetch and parse a JSON API response without blocking the event loop"""
+        try:
+            return await http_pool.run(http_pool.request_json, url)
+        except Exception as e:
+            raise Exception(f"Failed to fetch {url}: {str(e)}")
+    
+    async def fetch_internet_draft(self, draft_name: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
+        """Fetch an Internet Draft by its name"""
+        draft_name = draft_name.replace('.txt', '')
+        self.logger.info(f"Fetching Internet Draft: {draft_name}")
+        
+        # Check if this is a versioned draft or base name
+        has_version = _VERSION_RE.search(draft_name)
+        
+        if not has_version:
+            self.logger.debug("No version detected in %s, trying to find latest version", draft_name)
+            if progress_callback and request_id:
+                await progress_callback(request_id, 20, "Searching for latest version...")
+            
+            # Try to find the latest version
+            try:
+                return await self.get_latest_version(draft_name, request_id, progress_callback)
+            except Exception as e:
+                self.logger.warning(f"Could not find latest version, trying direct fetch: {e}")
+        
+        cache_key = f"draft_{draft_name}"
+        cached = document_cache.get(cache_key)
+        if cached is not None:
+            if progress_callback and request_id:
+                await progress_callback(request_id, 80, "Found in cache, retrieving...")
+            return cached
+        
+        if progress_callback and request_id:
+            await progress_callback(request_id, 30, "Fetching draft content...")
+        
+        try:
+            return await self._fetch_draft_document(draft_name, cache_key, request_id, progress_callback)
+        except Exception as e:
+            raise Exception(f"Failed to fetch Internet Draft {draft_name}: {str(e)}")
+    
+    async def _fetch_draft_document(self, draft_name: str, cache_key: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
+        """Fetch and parse a specific draft, joining a fetch of the same draft that is already in progress"""
+        return await inflight_fetches.run(
+            cache_key, lambda: self._download_draft_document(draft_name, cache_key, request_id, progress_callback))
+    
+    async def _download_draft_document(self, draft_name: str, cache_key: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
+        """Download and parse a specific draft, falling back to the HTML rendering if the TXT one fails"""
+        txt_url = f"{self.BASE_URL}/doc/txt/{draft_name}.txt"
+        html_url = f"{self.BASE_URL}/doc/html/{draft_name}"
+        
+        if progress_callback and request_id:
+            await progress_callback(request_id, 50, "Downloading TXT format...")
+        
+        # The HTML rendering is only used if the TXT one is missing, so it is requested once the
+        # TXT request fails, or alongside it if that request is slow. A download cannot be
+        # cancelled once it holds a connection, so a TXT hit must not start an HTML one
+        txt_task = asyncio.create_task(_fetch_text_revalidated(txt_url, cache_key))
+        html_task = None
+        try:
+            done, _ = await asyncio.wait((txt_task,), timeout=self.HTML_HEDGE_DELAY)
+            if not done:
+                self.logger.debug("TXT fetch of %s is slow, requesting HTML as well", draft_name)
+                html_task = asyncio.create_task(_fetch_text_revalidated(html_url, cache_key))
+            txt_content, validators, unchanged = await txt_task
+        except Exception as txt_error:
+            self.logger.warning(f"TXT fetch failed: {txt_error}")
+            
+            if progress_callback and request_id:
+                await progress_callback(request_id, 60, "TXT failed, using HTML format...")
+            
+            if html_task is None:
+                html_task = asyncio.create_task(_fetch_text_revalidated(html_url, cache_key))
+            try:
+                html_content, validators, unchanged = await html_task
+            except Exception as html_error:
+                self.logger.warning(f"HTML fetch also failed: {html_error}")
+                raise Exception(f"TXT error: {txt_error}, HTML error: {html_error}")
+            if unchanged is not None:
+                return unchanged
+            
+            if progress_callback and request_id:
+                await progress_callback(request_id, 70, "Parsing HTML content...")
+            
+            draft_data = self._parse_html_draft(html_content, draft_name, html_url)
+            document_cache.set(cache_key, draft_data, validators)
+            return draft_data
+        finally:
+            _discard_task(txt_task)
+            if html_task is not None:
+                _discard_task(html_task)
+        if unchanged is not None:
+            return unchanged
+        
+        if progress_callback and request_id:
+            await progress_callback(request_id, 70, "Parsing draft content...")
+        
+        draft_data = self._parse_txt_draft(txt_content, draft_name, txt_url)
+        document_cache.set(cache_key, draft_data, validators)
+        return draft_data
+    
+    async def get_latest_version(self, base_name: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
+        """Get the latest version of an Internet Draft"""
+        # A bare name seen recently skips the version search when its revision is still cached
+        latest_version = document_cache.get(f"latest_{base_name}")
+        if latest_version is not None:
+            cached = document_cache.get(f"draft_{latest_version}")
+            if cached is not None:
+                if progress_callback and request_id:
+                    await progress_callback(request_id, 80, "Found in cache, retrieving...")
+                return cached
+        
+        # Concurrent lookups of the same draft share one version search and download
+        return await inflight_fetches.run(
+            f"latest_{base_name}", lambda: self._get_latest_version(base_name, request_id, progress_callback))
+    
+    async def _get_latest_version(self, base_name: str, request_id: str = None, progress_callback = None) -> Dict[str, Any]:
+        """Resolve the latest revision of an Internet Draft and fetch it"""
+        try:
+            if progress_callback and request_id:
+                await progress_callback(request_id, 25, "Querying IETF API for versions...")
+            
+            # Search for all versions of this draft
+            search_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&name__startswith={urllib.parse.quote(base_name)}&limit=50"
+            
+            data = await self.fetch_json(search_url)
+            
+            if progress_callback and request_id:
+                await progress_callback(request_id, 35, "Finding latest version...")
+            
+            names = [doc.get('name', '') for doc in data.get('objects', ())]
+            
+            # Only "<base_name>-NN" revisions count; the prefix search also returns
+            # other drafts whose names merely start with base_name
+            versions = [(int(match.group(1)), name) for name in names
+                        if (match := _VERSION_RE.search(name)) and match.start() == len(base_name)
+                        and name.startswith(base_name)]
+            if versions:
+                latest_version = max(versions)[1]
+            else:
+                # Exact match without version - this might be the base name
+                latest_version = base_name if base_name in names else ''
+            
+            if latest_version:
+                document_cache.set(f"latest_{base_name}", latest_version)
+                
+                # Directly fetch without going through get_latest_version again
+                cache_key = f"draft_{latest_version}"
+                cached = document_cache.get(cache_key)
+                if cached is not None:
+                    if progress_callback and request_id:
+                        await progress_callback(request_id, 80, "Found in cache, retrieving...")
+                    return cached
+                
+                if progress_callback and request_id:
+                    await progress_callback(request_id, 40, f"Fetching latest version: {latest_version}")
+                
+                try:
+                    return await self._fetch_draft_document(latest_version, cache_key, request_id, progress_callback)
+                except Exception as fetch_error:
+                    raise Exception(f"Failed to fetch latest version {latest_version}: {str(fetch_error)}")
+            else:
+                # If no versioned drafts found, try the base name directly
+                raise Exception(f"No versions found for {base_name}")
+                
+        except Exception as e:
+            print(f"Latest version search failed: {e}", file=sys.stderr)
+            # Fallback: try to fetch the base name directly with a version suffix
+            fallback_name = f"{base_name}-00"  # Try version 00 as fallback
+            cache_key = f"draft_{fallback_name}"
+            
+            if progress_callback and request_id:
+                await progress_callback(request_id, 45, f"Trying fallback: {fallback_name}")
+            
+            cached = document_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Same TXT-then-HTML fallback as a regular fetch, so a fallback without a TXT rendering still
+            # resolves, and a TXT hit leaves no HTML download running
+            try:
+                return await self._fetch_draft_document(fallback_name, cache_key, request_id, progress_callback)
+            except Exception:
+                raise Exception(f"Could not find any version of {base_name}")
+    
+    async def search_internet_drafts(self, query: str, limit: int = 10, failures: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Search for Internet Drafts using IETF Datatracker API (failed lookups are appended to failures)"""
+        self.logger.info(f"Searching Internet Drafts for query: {query}")
+        failures = [] if failures is None else failures
+        
+        try:
+            # Try API search first
+            search_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&name__icontains={urllib.parse.quote(query)}&limit={limit}"
+            title_search_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&title__icontains={urllib.parse.quote(query)}&limit={limit}"
+            
+            # The title search is only a fallback, so it is requested once the name search fails,
+            # or alongside it if that search is slow. A request cannot be cancelled once it holds
+            # a connection, so a name hit must not start a title search
+            name_task = asyncio.create_task(self.fetch_json(search_url))
+            title_task = None
+            
+            try:
+                done, _ = await asyncio.wait((name_task,), timeout=self.SEARCH_HEDGE_DELAY)
+                if not done:
+                    self.logger.debug("Name search for %s is slow, requesting title search as well", query)
+                    title_task = asyncio.create_task(self.fetch_json(title_search_url))
+                data = await name_task
+                results = [self._draft_summary(doc) for doc in data.get('objects', [])]
+                
+                return results
+            
+            except Exception as api_error:
+                print(f"API search failed, trying title search: {api_error}", file=sys.stderr)
+                failures.append(f"name search: {api_error}")
+                
+                # Fallback: search by title
+                if title_task is None:
+                    title_task = asyncio.create_task(self.fetch_json(title_search_url))
+                try:
+                    data = await title_task
+                    return [self._draft_summary(doc) for doc in data.get('objects', [])]
+                
+                except Exception as title_error:
+                    self.logger.error(f"Title search also failed: {title_error}")
+                    
+                    # Try one more approach: search without API filters
+                    try:
+                        simple_search_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&limit={limit * 2}"
+                        self.logger.debug("Trying simple search: %s", simple_search_url)
+                        
+                        data = await self.fetch_json(simple_search_url)
+                        results = []
+                        
+                        query_lower = query.lower()
+                        
+                        for doc in data.get('objects', []):
+                            name = doc.get('name', '').lower()
+                            title = doc.get('title', '').lower()
+                            
+                            # Filter results that match the query
+                            if (query_lower in name or query_lower in title):
+                                results.append(self._draft_summary(doc))
+                                
+                                if len(results) >= limit:
+                                    break
+                        
+                        self.logger.info(f"Simple search found {len(results)} matching results")
+                        return results
+                        
+                    except Exception as simple_error:
+                        self.logger.error(f"Simple search also failed: {simple_error}")
+                        failures.append(f"simple search: {simple_error}")
+                        # Return empty list - no mock data
+                        return []
+            
+            finally:
+                _discard_task(name_task)
+                if title_task is not None:
+                    _discard_task(title_task)
+        
+        except Exception as e:
+            self.logger.error(f"Search failed completely: {e}")
+            failures.append(f"search: {e}")
+            return []
+    
+    async def search_draft_by_exact_name(self, draft_name: str) -> List[Dict[str, Any]]:
+        """Search for a specific draft by exact name"""
+        self.logger.info(f"Searching for exact draft name: {draft_name}")
+        
+        try:
+            # Try to get the specific document
+            doc_url = f"{self.BASE_URL}/api/v1/doc/document/{draft_name}/?format=json"
+            self.logger.debug("Exact search URL: %s", doc_url)
+            
+            doc = await self.fetch_json(doc_url)
+            
+            if doc and doc.get('name'):
+                result = self._draft_summary(doc)
+                
+                self.logger.info(f"Found exact match for {draft_name}")
+                return [result]
+            
+        except Exception as e:
+            self.logger.debug("Exact name search failed: %s", e)
+        
+        return []
+    
+    async def get_working_group_documents(self, working_group: str, include_rfcs: bool = True, include_drafts: bool = True, limit: int = 50,
+                                          failures: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get all active RFCs and Internet Drafts for a specific IETF working group (failed lookups, 'wg', 'rfc' or 'draft', are appended to failures)"""
+        self.logger.info(f"Getting documents for working group: {working_group}")
+        failures = [] if failures is None else failures
+        
+        result = {
+            'workingGroup': working_group,
+            'rfcs': [],
+            'internetDrafts': [],
+            'summary': {
+                'totalRfcs': 0,
+                'totalDrafts': 0,
+                'totalDocuments': 0
+            }
+        }
+        
+        try:
+            wg_url = f"{self.BASE_URL}/api/v1/group/group/?format=json&acronym={working_group}"
+            # Search for RFCs that contain the working group name in their name
+            rfc_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=rfc&name__icontains={working_group}&limit={limit * 2}"
+            # Search for drafts that contain the working group name
+            draft_url = f"{self.BASE_URL}/api/v1/doc/document/?format=json&type=draft&name__icontains=ietf-{working_group}&limit={limit * 2}"
+            self.logger.debug("Working group info URL: %s", wg_url)
+            
+            # The lookups are independent, so they are fetched concurrently (errors are handled per lookup below)
+            urls = {'wg': wg_url}
+            if include_rfcs:
+                self.logger.debug("RFC search URL: %s", rfc_url)
+                urls['rfc'] = rfc_url
+            if include_drafts:
+                self.logger.debug("Draft search URL: %s", draft_url)
+                urls['draft'] = draft_url
+            fetched = await asyncio.gather(*(self.fetch_json(url) for url in urls.values()), return_exceptions=True)
+            responses = dict(zip(urls, fetched))
+            
+            # Get working group information first - try different API endpoints
+            wg_info_found = False
+            
+            # Try the group API endpoint
+            try:
+                wg_data = responses['wg']
+                if isinstance(wg_data, BaseException):
+                    raise wg_data
+                
+                if wg_data.get('objects') and len(wg_data['objects']) > 0:
+                    wg_obj = wg_data['objects'][0]
+                    result['workingGroupInfo'] = {
+                        'name': wg_obj.get('name', working_group),
+                        'acronym': wg_obj.get('acronym', working_group),
+                        'description': wg_obj.get('description', ''),
+                        'state': wg_obj.get('state', ''),
+                        'type': wg_obj.get('type', '')
+                    }
+                    wg_info_found = True
+                    self.logger.debug("Found working group info: %s", wg_obj.get('name', working_group))
+            except Exception as wg_error:
+                self.logger.debug("First WG API attempt failed: %s", wg_error)
+                failures.append('wg')
+            
+            if not wg_info_found:
+                self.logger.warning(f"Could not fetch working group info for {working_group}")
+                result['workingGroupInfo'] = {
+                    'name': working_group.upper(),
+                    'acronym': working_group,
+                    'description': 'Working group information not available',
+                    'state': 'unknown',
+                    'type': 'wg'
+                }
+            
+            # Get RFCs for the working group - search by name pattern
+            if include_rfcs:
+                self.logger.debug("Fetching RFCs for working group")
+                try:
+                    rfc_data = responses['rfc']
+                    if isinstance(rfc_data, BaseException):
+                        raise rfc_data
+                    
+                    rfc_count = 0
+                    for doc in rfc_data.get('objects', []):
+                        if rfc_count >= limit:
+                            break
+                            
+                        # Extract RFC number from name (e.g., "rfc7540" -> "7540")
+                        rfc_number = ""
+                        name = doc.get('name', '')
+                        if name.startswith('rfc'):
+                            rfc_number = name[3:]
+                        
+                        rfc_info = {
+                            'number': rfc_number,
+                            'name': name,
+                            'title': doc.get('title', ''),
+                            'authors': self._extract_authors_from_api(doc),
+                            'date': doc.get('time', ''),
+                            'status': doc.get('intended_std_level', ''),
+                            'abstract': doc.get('abstract', ''),
+                            'url': f"https://www.rfc-editor.org/info/{name}",
+                            'workingGroup': working_group
+                        }
+                        result['rfcs'].append(rfc_info)
+                        rfc_count += 1
+                    
+                    result['summary']['totalRfcs'] = len(result['rfcs'])
+                    self.logger.info(f"Found {len(result['rfcs'])} RFCs for working group {working_group}")
+                    
+                except Exception as rfc_error:
+                    self.logger.error(f"Failed to fetch RFCs for working group: {rfc_error}")
+                    failures.append('rfc')
+            
+            # Get Internet Drafts for the working group - search by name pattern
+            if include_drafts:
+                self.logger.debug("Fetching Internet Drafts for working group")
+                try:
+                    draft_data = responses['draft']
+                    if isinstance(draft_data, BaseException):
+                        raise draft_data
+                    
+                    draft_count = 0
+                    for doc in draft_data.get('objects', []):
+                        if draft_count >= limit:
+                            break
+                            
+                        # Only include active drafts (not expired or replaced)
+                        doc_states = doc.get('states', [])
+                        is_active = True
+                        
+                        # Check document states
+                        for state in doc_states:
+                            if isinstance(state, dict):
+                                state = state.get('name', '')
+                            elif not isinstance(state, str):
+                                continue
+                            
+                            if _INACTIVE_STATE_RE.search(state):
+                                is_active = False
+                                break
+                        
+                        if is_active:
+                            draft_info = {
+                                'name': doc.get('name', ''),
+                                'title': doc.get('title', ''),
+                                'authors': self._extract_authors_from_api(doc),
+                                'date': doc.get('time', ''),
+                                'status': doc.get('intended_std_level', ''),
+                                'abstract': doc.get('abstract', ''),
+                                'url': f"{self.BASE_URL}/doc/{doc.get('name', '')}/",
+                                'version': _extract_version(doc.get('name', '')),
+                                'workingGroup': working_group,
+                                'state': [s.get('name', '') if isinstance(s, dict) else str(s) for s in doc_states]
+                            }
+                            result['internetDrafts'].append(draft_info)
+                            draft_count += 1
+                    
+                    result['summary']['totalDrafts'] = len(result['internetDrafts'])
+                    self.logger.info(f"Found {len(result['internetDrafts'])} active Internet Drafts for working group {working_group}")
+                    
+                except Exception as draft_error:
+                    self.logger.error(f"Failed to fetch Internet Drafts for working group: {draft_error}")
+                    failures.append('draft')
+            
+            result['summary']['totalDocuments'] = result['summary']['totalRfcs'] + result['summary']['totalDrafts']
+            self.logger.info(f"Total documents found for {working_group}: {result['summary']['totalDocuments']}")
+            
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get working group documents: {str(e)}")
+            raise Exception(f"Failed to get documents for working group {working_group}: {str(e)}")
+    
+    def _draft_summary(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a search result entry from a Datatracker API document object"""
+        name = doc.get('name', '')
+        return {
+            'name': name,
+            'title': doc.get('title', ''),
+            'authors': [],  # Would need additional API call for authors
+            'date': doc.get('time', ''),
+            'status': doc.get('intended_std_level', ''),
+            'abstract': doc.get('abstract', ''),
+            'url': f"{self.BASE_URL}/doc/{name}/",
+            'version': _extract_version(name),
+            'workingGroup': doc.get('group', '')
+        }
+    
+    def _extract_authors_from_api(self, doc: Dict[str, Any]) -> List[str]:
+        """Extract authors from API document response"""
+        authors = []
+        
+        # Authors come as {'person': {...}}, {'person': <uri>}, {'name': ...} or plain strings
+        for author in doc.get('authors') or ():
+            match author:
+                case {'person': dict() as person} if person:
+                    if name := person.get('name', ''):
+                        authors.append(name)
+                case {'person': person} if person:
+                    if name := str(person):
+                        authors.append(name)
+                case {'name': name}:
+                    authors.append(name)
+                case dict():
+                    pass
+                case _:
+                    authors.append(str(author))
+        
+        return authors
+    
+    def _parse_txt_draft(self, text: str, draft_name: str, url: str) -> Dict[str, Any]:
+        """Parse Internet Draft from TXT format in a single pass over its lines"""
+        scan = _scan_txt_document(text)
+        title = scan['field_title'] if scan['field_title'] is not None else draft_name
+        authors = scan['authors']
+        abstract = scan['abstract']
+        sections = scan['sections']
+        
+        return {
+            'metadata': {
+                'name': draft_name,
+                'title': title,
+                'authors': authors,
+                'date': '',
+                'status': '',
+                'abstract': abstract,
+                'url': url,
+                'version': _extract_version(draft_name)
+            },
+            'sections': sections,
+            'fullText': LazyText(text)
+        }
+    
+    def _parse_html_draft(self, html: str, draft_name: str, url: str) -> Dict[str, Any]:
+        """Parse Internet Draft from HTML format (simple parsing)"""
+        # Simple HTML parsing without BeautifulSoup - one pass collects the title,
+        # headings and text content
+        parser = SimpleHTMLParser()
+        parser.feed(html)
+        parser.close()
+        
+        # Extract title from HTML title tag or h1
+        title = parser.title or draft_name
+        if not title or title == draft_name:
+            # Try to find title in content
+            if parser.h1_text is not None:
+                title = parser.h1_text
+        
+        # Extract text content
+        text_content = parser.get_text()
+        
+        # Try to extract sections from HTML
+        sections = []
+        for clean_title in parser.headings:
+            if clean_title:
+                sections.append({
+                    'title': clean_title,
+                    'content': f"Section content for {clean_title}"  # Simplified
+                })
+        
+        return {
+            'metadata': {
+                'name': draft_name,
+                'title': title,
+                'authors': [],  # Would need more complex parsing
+                'date': '',
+                'status': '',
+                'abstract': '',  # Would need more complex parsing
+                'url': url,
+                'version': _extract_version(draft_name)
+            },
+            'sections': sections,
+            'fullText': LazyText(text_content)
+        }
+
+
+
+# Initialize server and services
+mcp = SimpleMCPServer("RFC and Internet Draft Server")
+rfc_service = SimpleRFCService()
+draft_service = SimpleInternetDraftService()
+openid_service = SimpleOpenIDService()
+
+# Serialized responses of the Datatracker-backed tools. Draft listings change on the order
+# of hours, so identical calls within the TTL skip both the upstream requests and the encoding
+response_cache = BoundedCache(maxsize=512, ttl=600)
+inflight_responses = SingleFlight()
+
+
+class DegradedResponse(str):
+    """A response built around failed upstream lookups: returned to the caller, but never cached"""
+
+
+async def _cached_response(key: str, build: Callable[[], Any]) -> str:
+    """Return the response cached under key, or await build() once for all concurrent callers"""
+    response = response_cache.get(key)
+    if response is not None:
+        logger.debug("Serving %s from the response cache", key)
+        return response
+    
+    async def build_and_store() -> str:
+        response = await build()
+        if isinstance(response, DegradedResponse):
+            logger.debug("Not caching %s: built from failed upstream lookups", key)
+            return str(response)
+        response_cache.set(key, response)
+        return response
+    
+    return await inflight_responses.run(key, build_and_store)
+
+
+# Lower-cased section titles per draft. Each entry remembers the sections list it was built
+# from, so a draft that has been fetched again gets a fresh index
+section_indexes = BoundedCache(maxsize=128)
+
+
+def _draft_section_index(name: str, sections: List[Dict[str, Any]]) -> tuple:
+    """Return (title -> section, [(title, section), ...]) for a draft, with lower-cased titles"""
+    entry = section_indexes.get(name)
+    if entry is None or entry[0] is not sections:
+        titled = [(sect["title"].lower(), sect) for sect in sections]
+        by_title = {}
+        for title, sect in titled:
+            by_title.setdefault(title, sect)
+        entry = (sections, by_title, titled)
+        section_indexes.set(name, entry)
+    return entry[1], entry[2]
+
+
+# RFC Tools
+@mcp.tool
+async def get_rfc(number: str, format: str = "full", include_full_text: bool = False, _request_id: str = None, _progress_callback = None) -> str:
+    """Fetch an RFC document by its number"""
+    logger.info("Tool call: get_rfc(number=%s, format=%s, include_full_text=%s)", number, format, include_full_text)
+    
+    try:
+        rfc = await rfc_service.fetch_rfc(number)
+        
+        if format == "metadata":
+            result = rfc["metadata"]
+        elif format == "sections":
+            result = rfc["sections"]
+        elif include_full_text:
+            result = rfc
+        else:
+            # The raw text duplicates the sections - only send it when asked for
+            result = {key: value for key, value in rfc.items() if key != "fullText"}
+        
+        logger.info("Successfully processed get_rfc for RFC %s", number)
+        return _dumps_pretty(result)
+    except Exception as e:
+        logger.error(f"Error in get_rfc for RFC {number}: {str(e)}")
+        return f"Error fetching RFC {number}: {str(e)}"
+
+
+@mcp.tool
+async def search_rfcs(query: str, limit: int = 10) -> str:
+    """Search for RFCs by keyword"""
+    logger.info("Tool call: search_rfcs(query=%s, limit=%s)", query, limit)
+    
+    try:
+        results = await rfc_service.search_rfcs(query, limit)
+        logger.info("Successfully processed search_rfcs, found %s results", len(results))
+        return _dumps_pretty(results)
+    except Exception as e:
+        logger.error(f"Error in search_rfcs: {str(e)}")
+        return f"Error searching for RFCs: {str(e)}"
+
+
+@mcp.tool
+async def get_rfc_section(number: str, section: str) -> str:
+    """Get a specific section from an RFC"""
+    try:
+        rfc = await rfc_service.fetch_rfc(number)
+        
+        # Find matching section
+        section_query = section.lower()
+        for sect in rfc["sections"]:
+            title = sect["title"].lower()
+            if title == section_query or section_query in title:
+                return _dumps_pretty(sect)
+        
+        return f'Section "{section}" not found in RFC {number}'
+    except Exception as e:
+        return f"Error fetching section from RFC {number}: {str(e)}"
+
+
+# Internet Draft Tools
+@mcp.tool
+async def get_internet_draft(name: str, format: str = "full", _request_id: str = None, _progress_callback = None) -> str:
+    """Fetch an Internet Draft document by its name"""
+    logger.info("Tool call: get_internet_draft(name=%s, format=%s)", name, format)
+    
+    try:
+        # Send initial progress notification
+        if _progress_callback and _request_id:
+            await _progress_callback(_request_id, 10, f"Starting to fetch Internet Draft: {name}")
+        
+        # Pass progress callback to the service
+        draft = await draft_service.fetch_internet_draft(name, _request_id, _progress_callback)
+        
+        if _progress_callback and _request_id:
+            await _progress_callback(_request_id, 90, "Processing draft content...")
+        
+        if format == "metadata":
+            result = draft["metadata"]
+        elif format == "sections":
+            result = draft["sections"]
+        else:
+            result = draft
+        
+        if _progress_callback and _request_id:
+            await _progress_callback(_request_id, 100, "Internet Draft fetch completed")
+        
+        logger.info("Successfully processed get_internet_draft for %s", name)
+        return _dumps_pretty(result)
+    except Exception as e:
+        logger.error(f"Error in get_internet_draft for {name}: {str(e)}")
+        return f"Error fetching Internet Draft {name}: {str(e)}"
+
+
+@mcp.tool
+async def search_internet_drafts(query: str, limit: int = 10) -> str:
+    """Search for Internet Drafts by keyword"""
+    logger.info("Tool call: search_internet_drafts(query=%s, limit=%s)", query, limit)
+    
+    # Nothing can match an empty query or a non-positive limit, so skip the upstream requests
+    query = query.lower().strip()
+    if not query or limit <= 0:
+        return "[]"
+    
+    try:
+        return await _cached_response(repr(('search_internet_drafts', query, limit)),
+                                      lambda: _search_internet_drafts(query, limit))
+    except Exception as e:
+        logger.error(f"Error in search_internet_drafts: {str(e)}")
+        return f"Error searching for Internet Drafts: {str(e)}"
+
+
+async def _search_internet_drafts(query: str, limit: int) -> str:
+    """Run a draft search and serialize the results"""
+    failures = []
+    search_task = None
+    results = []
+    try:
+        # First try exact name search if query looks like a draft name. The general search is
+        # only used on a miss, so it is started then, or alongside a slow exact lookup: its
+        # requests cannot be cancelled once sent, so an exact hit must not start it
+        if query.startswith('draft-'):
+            logger.debug("Query looks like draft name, trying exact search first")
+            exact_task = asyncio.create_task(draft_service.search_draft_by_exact_name(query))
+            try:
+                done, _ = await asyncio.wait((exact_task,), timeout=draft_service.SEARCH_HEDGE_DELAY)
+                if not done:
+                    logger.debug("Exact search for %s is slow, starting general search as well", query)
+                    search_task = asyncio.create_task(draft_service.search_internet_drafts(query, limit, failures))
+                results.extend(await exact_task)
+            finally:
+                _discard_task(exact_task)
+        
+        # If no exact results or query doesn't look like draft name, use the general search
+        if not results:
+            logger.debug("Doing general search")
+            if search_task is None:
+                search_task = asyncio.create_task(draft_service.search_internet_drafts(query, limit, failures))
+            results.extend(await search_task)
+    finally:
+        if search_task is not None:
+            _discard_task(search_task)
+    
+    # Remove duplicates while preserving order (the first result for a name wins),
+    # stopping as soon as enough results have been collected
+    unique_results = {}
+    for result in results:
+        unique_results.setdefault(result['name'], result)
+        if len(unique_results) == limit:
+            break
+    
+    final_results = list(unique_results.values())[:limit]
+    logger.info("Successfully processed search_internet_drafts, found %s results", len(final_results))
+    
+    response = _dumps_pretty(final_results)
+    return DegradedResponse(response) if failures else response
+
+
+@mcp.tool
+async def get_internet_draft_section(name: str, section: str) -> str:
+    """Get a specific section from an Internet Draft"""
+    async def find_section() -> str:
+        draft = await draft_service.fetch_internet_draft(name)
+        
+        # Find matching section: an exact title match first, else the first title containing the query
+        section_query = section.lower()
+        by_title, titled = _draft_section_index(name, draft["sections"])
+        sect = by_title.get(section_query)
+        if sect is not None:
+            return _dumps_pretty(sect)
+        for title, sect in titled:
+            if section_query in title:
+                return _dumps_pretty(sect)
+        
+        return f'Section "{section}" not found in Internet Draft {name}'
+    
+    # An empty section name would otherwise match the first section
+    if not section.strip():
+        return f'Section "{section}" not found in Internet Draft {name}'
+    
+    try:
+        return await _cached_response(repr(('get_internet_draft_section', name, section.lower())), find_section)
+    except Exception as e:
+        return f"Error fetching section from Internet Draft {name}: {str(e)}"
+
+
+# OpenID Foundation Tools
+@mcp.tool
+async def get_openid_spec(name: str, format: str = "full", _request_id: str = None, _progress_callback = None) -> str:
+    """Fetch an OpenID Foundation specification by its name"""
+    logger.info("Tool call: get_openid_spec(name=%s, format=%s)", name, format)
+    
+    try:
+        # Send initial progress notification
+        if _progress_callback and _request_id:
+            await _progress_callback(_request_id, 10, f"Starting to fetch OpenID spec: {name}")
+        
+        # Pass progress callback to the service
+        spec = await openid_service.fetch_openid_spec(name, _request_id, _progress_callback)
+        
+        if _progress_callback and _request_id:
+            await _progress_callback(_request_id, 90, "Processing specification content...")
+        
+        if format == "metadata":
+            result = spec["metadata"]
+        elif format == "sections":
+            result = spec["sections"]
+        else:
+            result = spec
+        
+        if _progress_callback and _request_id:
+            await _progress_callback(_request_id, 100, "OpenID specification fetch completed")
+        
+        logger.info("Successfully processed get_openid_spec for %s", name)
+        return _dumps_pretty(result)
+    except Exception as e:
+        logger.error(f"Error in get_openid_spec for {name}: {str(e)}")
+        return f"Error fetching OpenID specification {name}: {str(e)}"
+
+
+@mcp.tool
+async def search_openid_specs(query: str, limit: int = 10, _request_id: str = None, _progress_callback = None) -> str:
+    """Search for OpenID Foundation specifications by keyword"""
+    logger.info("Tool call: search_openid_specs(query=%s, limit=%s)", query, limit)
+    
+    try:
+        if _progress_callback and _request_id:
+            await _progress_callback(_request_id, 10, f"Searching OpenID specs for: {query}")
+        
+        results = await openid_service.search_openid_specs(query, limit, _request_id, _progress_callback)
+        
+        if _progress_callback and _request_id:
+            await _progress_callback(_request_id, 100, f"Found {len(results)} OpenID specifications")
+        
+        logger.info("Successfully processed search_openid_specs for '%s': %s results", query, len(results))
+        return _dumps_pretty(results)
+    except Exception as e:
+        logger.error(f"Error in search_openid_specs for '{query}': {str(e)}")
+        return f"Error searching OpenID specifications for '{query}': {str(e)}"
+
+
+@mcp.tool
+async def get_openid_spec_section(name: str, section: str) -> str:
+    """Get a specific section from an OpenID Foundation specification"""
+    logger.info("Tool call: get_openid_spec_section(name=%s, section=%s)", name, section)
+    
+    try:
+        spec = await openid_service.fetch_openid_spec(name)
+        
+        # Find matching section
+        section_query = section.lower()
+        for sect in spec["sections"]:
+            title = sect["title"].lower()
+            if title == section_query or section_query in title:
+                logger.info("Successfully found section '%s' in OpenID spec %s", section, name)
+                return _dumps_pretty(sect)
+        
+        logger.warning(f"Section '{section}' not found in OpenID spec {name}")
+        return f'Section "{section}" not found in OpenID specification {name}'
+    except Exception as e:
+        logger.error(f"Error in get_openid_spec_section for {name}, section {section}: {str(e)}")
+        return f"Error fetching section from OpenID specification {name}: {str(e)}"
+
+
+# Single-class listings (include_rfcs, include_drafts) derivable from a combined one, with the
+# lookup each needs besides the working group info
+_WG_SUBSET_VARIANTS = ((True, False, 'rfc'), (False, True, 'draft'))
+
+
+def _working_group_variant(result: Dict[str, Any], include_rfcs: bool, include_drafts: bool) -> Dict[str, Any]:
+    """Restrict a full working group listing to the requested document classes"""
+    variant = dict(result)
+    variant['rfcs'] = result['rfcs'] if include_rfcs else []
+    variant['internetDrafts'] = result['internetDrafts'] if include_drafts else []
+    variant['summary'] = {
+        'totalRfcs': len(variant['rfcs']),
+        'totalDrafts': len(variant['internetDrafts']),
+        'totalDocuments': len(variant['rfcs']) + len(variant['internetDrafts'])
+    }
+    return variant
+
+
+@mcp.tool
+async def get_working_group_documents(working_group: str, include_rfcs: bool = True, include_drafts: bool = True, limit: int = 50) -> str:
+    """Get all active RFCs and Internet Drafts for a specific IETF working group"""
+    logger.info("Tool call: get_working_group_documents(working_group=%s, include_rfcs=%s, include_drafts=%s, limit=%s)", working_group, include_rfcs, include_drafts, limit)
+    
+    def cache_key(rfcs: bool, drafts: bool) -> str:
+        return repr(('get_working_group_documents', working_group, rfcs, drafts, limit))
+    
+    async def list_documents() -> str:
+        # Only the requested document classes are fetched. A combined listing also answers the
+        # RFC-only and draft-only calls, so those are cached too when their own lookups succeeded
+        failures = []
+        result = await draft_service.get_working_group_documents(working_group, include_rfcs, include_drafts, limit, failures)
+        if include_rfcs and include_drafts and 'wg' not in failures:
+            for rfcs, drafts, lookup in _WG_SUBSET_VARIANTS:
+                if lookup not in failures:
+                    response_cache.set(cache_key(rfcs, drafts), _dumps_pretty(_working_group_variant(result, rfcs, drafts)))
+        
+        logger.info("Successfully processed get_working_group_documents for %s: %s documents", working_group, result['summary']['totalDocuments'])
+        response = _dumps_pretty(result)
+        return DegradedResponse(response) if failures else response
+    
+    # Datatracker acronyms are lower case, so differently cased calls share one entry
+    working_group = working_group.lower().strip()
+    if not _WG_ACRONYM_RE.fullmatch(working_group):
+        return f"Error fetching documents for working group {working_group}: not a valid working group acronym"
+    
+    try:
+        include_rfcs, include_drafts = bool(include_rfcs), bool(include_drafts)
+        return await _cached_response(cache_key(include_rfcs, include_drafts), list_documents)
+    except Exception as e:
+        logger.error(f"Error in get_working_group_documents for {working_group}: {str(e)}")
+        return f"Error fetching documents for working group {working_group}: {str(e)}"
+
+
+def main():
+    """Main entry point with command line argument parsing"""
+    parser = argparse.ArgumentParser(description='RFC and Internet Draft MCP Server')
+    parser.add_argument('--http', action='store_true', help='Run in HTTP mode')
+    parser.add_argument('--port', type=int, default=3000, help='Port for HTTP mode (default: 3000)')
+    parser.add_argument('--stdio', action='store_true', help='Run in stdio mode (default)')
+    parser.add_argument('--log-dir', default='/tmp/rfc_server', help='Log directory (default: /tmp/rfc_server)')
+    parser.add_argument('--log-level', default='INFO', choices=['TRACE', 'DEBUG', 'INFO', 'WARNING', 'ERROR'], 
+                       help='Log level (default: INFO)')
+    parser.add_argument('--cache-db', help='SQLite file for persisting fetched documents across restarts (default: memory only)')
+    parser.add_argument('--max-concurrent', type=int, default=http_pool.max_concurrent,
+                       help=f'Maximum upstream requests in flight at once (default: {http_pool.max_concurrent})')
+    
+    args = parser.parse_args()
+    if args.max_concurrent < 1:
+        parser.error('--max-concurrent must be at least 1')
+    
+    # Setup logging with custom directory and level
+    global logger
+    logger = setup_logging(args.log_dir, args.log_level)
+    
+    # Update service loggers
+    rfc_service.logger = logging.getLogger('rfc_server.rfc_service')
+    draft_service.logger = logging.getLogger('rfc_server.draft_service')
+    
+    # Log startup configuration
+    logger.info(f"Starting RFC MCP Server with arguments: {vars(args)}")
+    
+    if args.cache_db:
+        document_cache.backing = DiskCache(args.cache_db)
+        logger.info(f"Persisting document cache to {args.cache_db}")
+    
+    if args.max_concurrent != http_pool.max_concurrent:
+        http_pool.set_max_concurrent(args.max_concurrent)
+    
+    # Default to stdio if no mode specified
+    if not args.http and not args.stdio:
+        args.stdio = True
+    
+    # Use the libuv-based event loop when available (not supported on Windows)
+    if uvloop is not None and sys.platform != 'win32':
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    
+    try:
+        if args.http:
+            logger.info(f"Starting HTTP server on port {args.port}")
+            # Run HTTP server
+            mcp.run_http(args.port)
+        else:
+            logger.info("Starting stdio server")
+            # Run stdio server
+            asyncio.run(mcp.run_stdio())
+    except KeyboardInterrupt:
+        logger.info("Received keyboard interrupt, shutting down")
+    except Exception as e:
+        logger.error(f"Server crashed: {str(e)}", exc_info=True)
+        raise
+    finally:
+        if document_cache.backing is not None:
+            document_cache.backing.close()
+        logger.info("RFC MCP Server shutdown complete")
+
+
+if __name__ == "__main__":
+    main()
+
+# Resources (synchronous handlers run on the server's shared background loop, so upstream
+# connections and cached state are reused across calls)
+@mcp.resource("rfc://{number}")
+def get_rfc_resource(number: str) -> str:
+    """Get an RFC document by its number"""
+    return mcp.run_coroutine(get_rfc(number))
+
+
+@mcp.resource("draft://{name}")
+def get_draft_resource(name: str) -> str:
+    """Get an Internet Draft document by its name"""
+    return mcp.run_coroutine(get_internet_draft(name))
+
+
+@mcp.resource("wg://{group}")
+def get_working_group_resource(group: str) -> str:
+    """Get all documents for a working group"""
+    return mcp.run_coroutine(get_working_group_documents(group))
+
+
+@mcp.resource("wg://{group}/rfcs")
+def get_working_group_rfcs_resource(group: str) -> str:
+    """Get only RFCs for a working group"""
+    return mcp.run_coroutine(get_working_group_documents(group, include_rfcs=True, include_drafts=False))
+
+
+@mcp.resource("wg://{group}/drafts")
+def get_working_group_drafts_resource(group: str) -> str:
+    """Get only Internet Drafts for a working group"""
+    return mcp.run_coroutine(get_working_group_documents(group, include_rfcs=False, include_drafts=True))
\ No newline at end of file
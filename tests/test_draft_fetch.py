@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Internet Draft TXT/HTML download order
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+import standard_finder
+from standard_finder import SimpleInternetDraftService, document_cache
+
+DRAFT_TXT = """
+OAuth Working Group                                          A. Author
+Internet-Draft                                                Example
+Intended status: Standards Track                          1 March 2024
+Expires: 2 September 2024
+
+
+                    OAuth 2.0 Example Extension
+                   draft-ietf-oauth-example-03
+
+Abstract
+
+   This specification defines an example extension
+   for OAuth 2.0.
+
+Status of This Memo
+
+   This Internet-Draft is submitted in full conformance.
+
+1.  Introduction
+
+   Intro text.
+
+2.  Protocol
+
+   Protocol text.
+
+2.1.  Details
+
+   Detail text.
+"""
+DRAFT_HTML = '<html><head><title>Example (HTML)</title></head><body><h1>OAuth 2.0 Example Extension</h1></body></html>'
+
+
+class FakeRenderings:
+    """Serves the TXT and HTML renderings with a delay each, failing those mapped to None"""
+
+    def __init__(self, txt=(0, DRAFT_TXT), html=(0, DRAFT_HTML)):
+        self.renderings = {'/doc/txt/': txt, '/doc/html/': html}
+        self.requested = []
+        self.urls = []
+
+    async def fetch(self, url, cache_key):
+        kind = next(prefix for prefix in self.renderings if prefix in url)
+        self.requested.append(kind)
+        self.urls.append(url)
+        delay, text = self.renderings[kind]
+        await asyncio.sleep(delay)
+        if text is None:
+            raise Exception(f"Failed to fetch {url}: HTTP Error 404: Not Found")
+        return text, None, None
+
+
+class DraftDownloadTest(unittest.IsolatedAsyncioTestCase):
+    """The HTML rendering is only downloaded when the TXT one fails or is slow"""
+
+    def setUp(self):
+        document_cache.invalidate('draft_')
+        document_cache.invalidate('latest_')
+        self.service = SimpleInternetDraftService()
+
+    def tearDown(self):
+        document_cache.invalidate('draft_')
+        document_cache.invalidate('latest_')
+
+    def serve(self, fake):
+        return mock.patch.object(standard_finder, '_fetch_text_revalidated', fake.fetch)
+
+    async def test_txt_hit_does_not_download_html(self):
+        fake = FakeRenderings()
+        with self.serve(fake):
+            draft = await self.service.fetch_internet_draft('draft-ietf-oauth-example-03')
+        self.assertEqual(fake.requested, ['/doc/txt/'])
+        self.assertTrue(draft['metadata']['abstract'].startswith('This specification defines'))
+
+    async def test_txt_miss_falls_back_to_html(self):
+        fake = FakeRenderings(txt=(0, None))
+        with self.serve(fake):
+            draft = await self.service.fetch_internet_draft('draft-ietf-oauth-example-03')
+        self.assertEqual(fake.requested, ['/doc/txt/', '/doc/html/'])
+        self.assertEqual(draft['metadata']['title'], 'Example (HTML)')
+
+    async def test_slow_txt_is_hedged_with_html(self):
+        fake = FakeRenderings(txt=(0.3, None), html=(0, DRAFT_HTML))
+        with self.serve(fake), mock.patch.object(SimpleInternetDraftService, 'HTML_HEDGE_DELAY', 0.05):
+            draft = await self.service.fetch_internet_draft('draft-ietf-oauth-example-03')
+        self.assertEqual(fake.requested, ['/doc/txt/', '/doc/html/'])
+        self.assertEqual(draft['metadata']['title'], 'Example (HTML)')
+
+    async def test_both_renderings_missing(self):
+        fake = FakeRenderings(txt=(0, None), html=(0, None))
+        with self.serve(fake):
+            with self.assertRaises(Exception):
+                await self.service.fetch_internet_draft('draft-ietf-oauth-example-03')
+        self.assertEqual(fake.requested, ['/doc/txt/', '/doc/html/'])
+
+
+    async def failing_version_search(self, url):
+        raise Exception(f"Failed to fetch {url}: HTTP Error 503: Service Unavailable")
+
+    async def test_fallback_txt_hit_does_not_download_html(self):
+        fake = FakeRenderings()
+        with self.serve(fake), mock.patch.object(self.service, 'fetch_json', self.failing_version_search):
+            draft = await self.service.fetch_internet_draft('draft-ietf-oauth-example')
+        self.assertEqual(fake.requested, ['/doc/txt/'])
+        self.assertTrue(fake.urls[0].endswith('/doc/txt/draft-ietf-oauth-example-00.txt'))
+        self.assertEqual(draft['metadata']['version'], '00')
+
+    async def test_fallback_txt_miss_falls_back_to_html(self):
+        fake = FakeRenderings(txt=(0, None))
+        with self.serve(fake), mock.patch.object(self.service, 'fetch_json', self.failing_version_search):
+            draft = await self.service.fetch_internet_draft('draft-ietf-oauth-example')
+        self.assertEqual(fake.requested, ['/doc/txt/', '/doc/html/'])
+        self.assertTrue(fake.urls[1].endswith('/doc/html/draft-ietf-oauth-example-00'))
+        self.assertEqual(draft['metadata']['title'], 'Example (HTML)')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the HTTP transport connection handling
+"""
+
+import http.server
+import socket
+import threading
+import time
+import unittest
+from unittest import mock
+
+from standard_finder import HTTPConnectionPool, SimpleMCPServer
+
+IDLE_TIMEOUT = 0.5
+HEALTH_REQUEST = b"GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+
+class HTTPKeepAliveTest(unittest.TestCase):
+    """Kept-alive connections are reused, and closed once idle"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.port = free_port()
+        patcher = mock.patch.object(SimpleMCPServer, 'HTTP_IDLE_TIMEOUT', IDLE_TIMEOUT)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        # serve_forever never returns; the daemon thread ends with the test process
+        threading.Thread(target=SimpleMCPServer("test-http").run_http, args=(cls.port,), daemon=True).start()
+        deadline = time.monotonic() + 5
+        while True:
+            try:
+                socket.create_connection(('localhost', cls.port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def read_response(self, sock):
+        data = b""
+        while b"\r\n\r\n" not in data:
+            chunk = sock.recv(4096)
+            self.assertTrue(chunk, "connection closed before the response headers")
+            data += chunk
+        head, _, body = data.partition(b"\r\n\r\n")
+        length = int(next(line.split(b":", 1)[1] for line in head.split(b"\r\n") if line.lower().startswith(b"content-length")))
+        while len(body) < length:
+            body += sock.recv(4096)
+        return head
+
+    def test_idle_connection_is_closed(self):
+        with socket.create_connection(('localhost', self.port), timeout=5) as sock:
+            for _ in range(2):
+                sock.sendall(HEALTH_REQUEST)
+                self.assertTrue(self.read_response(sock).startswith(b"HTTP/1.1 200"))
+            started = time.monotonic()
+            self.assertEqual(sock.recv(4096), b"")
+            self.assertLess(time.monotonic() - started, IDLE_TIMEOUT + 2)
+
+    def test_chunked_post_closes_connection(self):
+        # The chunked body is not read, so it must not be parsed as the next request
+        body = b'{"jsonrpc":"2.0","id":1,"method":"ping"}'
+        request = (b"POST /mcp HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                   b"Transfer-Encoding: chunked\r\n\r\n" + b"%x\r\n" % len(body) + body + b"\r\n0\r\n\r\n")
+        with socket.create_connection(('localhost', self.port), timeout=5) as sock:
+            sock.sendall(request)
+            head = self.read_response(sock)
+            self.assertTrue(head.startswith(b"HTTP/1.1 200"))
+            self.assertIn(b"\r\nConnection: close", head)
+            sock.sendall(HEALTH_REQUEST)
+            try:
+                self.assertEqual(sock.recv(4096), b"")
+            except ConnectionResetError:
+                pass
+
+
+class LatinOneHandler(http.server.BaseHTTPRequestHandler):
+    """Answers every GET with a kept-alive body that is not valid UTF-8"""
+
+    protocol_version = "HTTP/1.1"
+    body = "Café".encode('latin-1')
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HTTPConnectionPoolTest(unittest.TestCase):
+    """Connections that fail mid-request are closed rather than pooled"""
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('localhost', 0), LatinOneHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def test_undecodable_body_closes_connection(self):
+        pool = HTTPConnectionPool(retries=0)
+        acquired = []
+        acquire = pool._acquire
+
+        def record(key):
+            conn, reused = acquire(key)
+            acquired.append(conn)
+            return conn, reused
+
+        url = f"http://localhost:{self.server.server_address[1]}/doc.txt"
+        with mock.patch.object(pool, '_acquire', record):
+            with self.assertRaises(UnicodeDecodeError):
+                pool.request_text(url)
+        self.assertIsNone(acquired[0].sock)
+        self.assertEqual(sum(map(len, pool._idle.values())), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
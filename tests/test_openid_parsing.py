@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the OpenID specification page patterns
+"""
+
+import time
+import unittest
+
+import standard_finder
+from standard_finder import SimpleOpenIDService
+
+# Generous bound: the pre-atomic patterns took seconds on a 1 KB tag and minutes on these inputs
+TIME_LIMIT = 2.0
+SIZE = 8 * 1024
+
+
+class OpenIDPatternTest(unittest.TestCase):
+    """Match semantics and backtracking bounds of the OpenID page patterns"""
+
+    def setUp(self):
+        self.service = SimpleOpenIDService()
+
+    def parse(self, content):
+        return self.service._parse_openid_spec(content, 'spec', 'https://example.org/spec.html')
+
+    def assertFast(self, pattern, text, find_all=True):
+        started = time.perf_counter()
+        if find_all:
+            list(pattern.finditer(text))
+        else:
+            pattern.search(text)
+        elapsed = time.perf_counter() - started
+        self.assertLess(elapsed, TIME_LIMIT, f"{pattern.pattern[:40]!r} took {elapsed:.2f}s on {len(text)} chars")
+
+    def test_abstract_word_anywhere_after_class(self):
+        content = '<div class="section" id="abstract"><p>We define things.</p></div>'
+        self.assertEqual(self.parse(content)['metadata']['abstract'], "We define things.")
+
+    def test_abstract_class_and_section(self):
+        self.assertEqual(self.parse('<div class="abstract">Short <b>text</b></div>')['metadata']['abstract'], "Short text")
+        self.assertEqual(self.parse('<section data-id="abstract">Sec</section>')['metadata']['abstract'], "Sec")
+        # "abstract" before "class" is not enough
+        self.assertEqual(self.parse('<div id="abstract" class="x">No</div>')['metadata']['abstract'], "")
+
+    def test_section_headings(self):
+        content = ('<h2 id="intro">Introduction</h2><p>Body</p>'
+                   '<h3 class="x" data-id=\'sub\'>Sub</h3><p>More</p>'
+                   '<h2>2. Terms</h2><p>End</p>')
+        sections = self.parse(content)['sections']
+        self.assertEqual([(s['id'], s['title'], s['level']) for s in sections],
+                         [('intro', 'Introduction', 2), ('sub', 'Sub', 3), ('', '2. Terms', 2)])
+        # The id is taken from the last "=" after the first "id"
+        match = standard_finder._SPEC_SECTION_RES[0].search('<h2 id=a x="b">T</h2>')
+        self.assertEqual(match.group('id'), 'b')
+
+    def test_authors_and_date(self):
+        content = ('<meta name="author" content="Jane Doe">'
+                   '<div class="author-name">John Roe</div>'
+                   '<meta name="dc.date" content="2014-11-08">')
+        metadata = self.parse(content)['metadata']
+        self.assertEqual(metadata['authors'], ['Jane Doe', 'John Roe'])
+        self.assertEqual(metadata['date'], '2014-11-08')
+
+    def test_anchor_links(self):
+        content = ('<a href="openid-connect-core-1_0.html">Core</a>'
+                   '<a class="x" href="a.html" data-href="b.pdf">Both</a>'
+                   '<a href="notes.txt">Skip</a>')
+        links = [match.group('url', 'title') for match in standard_finder._SPEC_ANCHOR_RE.finditer(content)]
+        self.assertEqual(links, [('openid-connect-core-1_0.html', 'Core'), ('a.html', 'Both')])
+
+    def test_unclosed_tags_do_not_backtrack(self):
+        count = SIZE // 4
+        for pattern in (standard_finder._SPEC_ABSTRACT_RES[0], standard_finder._SPEC_AUTHOR_RES[1]):
+            self.assertFast(pattern, '<div ' + 'class abstract author ' * (SIZE // 22))
+            self.assertFast(pattern, '<div' * count + ' class')
+        self.assertFast(standard_finder._SPEC_ABSTRACT_RES[1], '<section ' + 'id abstract ' * (SIZE // 12))
+        self.assertFast(standard_finder._SPEC_ABSTRACT_RES[1], '<section' * (SIZE // 8) + ' id')
+        section = standard_finder._SPEC_SECTION_RES[0]
+        self.assertFast(section, '<h2 ' + 'id=' * (SIZE // 3))
+        self.assertFast(section, '<h2 id="' + 'a' * SIZE + '">' + 't' * SIZE)
+        self.assertFast(section, '<h2 ' + ' ' * SIZE + 'id=x')
+        self.assertFast(section, '<h2' * (SIZE // 3) + ' id=x')
+        anchor = standard_finder._SPEC_ANCHOR_RE
+        self.assertFast(anchor, '<a ' + 'href="x.html" ' * (SIZE // 14))
+        self.assertFast(anchor, '<a href="' + 'x' * SIZE)
+        self.assertFast(anchor, '<a' * (SIZE // 2) + ' href=')
+        for pattern in (standard_finder._SPEC_AUTHOR_RES[0], standard_finder._SPEC_DATE_RES[0]):
+            self.assertFast(pattern, '<meta ' + 'name author date content = ' * (SIZE // 27))
+            self.assertFast(pattern, '<meta' * (SIZE // 5) + ' name')
+
+    def test_unclosed_tags_parse(self):
+        content = '<h2 ' + 'id=' * (SIZE // 3) + '<div class="abstract" ' + 'x' * SIZE
+        started = time.perf_counter()
+        self.parse(content)
+        self.assertLess(time.perf_counter() - started, TIME_LIMIT * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Datatracker tool response cache
+"""
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import standard_finder
+from standard_finder import SimpleInternetDraftService, draft_service, response_cache
+
+DRAFT = {'name': 'draft-ietf-oauth-example-01', 'title': 'OAuth Example', 'states': [{'name': 'Active'}]}
+RFC = {'name': 'rfc6749', 'title': 'The OAuth 2.0 Authorization Framework'}
+GROUP = {'name': 'Web Authorization Protocol', 'acronym': 'oauth'}
+
+
+class FakeDatatracker:
+    """Answers fetch_json from canned objects, failing the lookups whose URL contains a marker"""
+
+    def __init__(self, failing=(), delays=None):
+        self.failing = set(failing)
+        self.delays = delays or {}
+        self.urls = []
+
+    async def fetch_json(self, url):
+        self.urls.append(url)
+        for marker, delay in self.delays.items():
+            if marker in url:
+                await asyncio.sleep(delay)
+        for marker in self.failing:
+            if marker in url:
+                raise Exception(f"Failed to fetch {url}: HTTP Error 503: Service Unavailable")
+        if '/group/group/' in url:
+            return {'objects': [GROUP]}
+        if '/doc/document/draft-' in url:
+            return DRAFT
+        if 'type=rfc' in url:
+            return {'objects': [RFC]}
+        return {'objects': [DRAFT]}
+
+
+class ResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+    """Only complete upstream answers are cached"""
+
+    def setUp(self):
+        response_cache.invalidate()
+
+    def tearDown(self):
+        response_cache.invalidate()
+
+    def serve(self, fake):
+        return mock.patch.object(draft_service, 'fetch_json', fake.fetch_json)
+
+    async def test_search_is_cached(self):
+        fake = FakeDatatracker()
+        with self.serve(fake):
+            first = await standard_finder.search_internet_drafts('oauth', 5)
+            calls = len(fake.urls)
+            second = await standard_finder.search_internet_drafts('oauth', 5)
+        self.assertEqual(first, second)
+        self.assertEqual(json.loads(first)[0]['name'], DRAFT['name'])
+        self.assertEqual(len(fake.urls), calls)
+
+    async def test_failed_search_is_not_cached(self):
+        fake = FakeDatatracker(failing=['/api/'])
+        with self.serve(fake):
+            self.assertEqual(await standard_finder.search_internet_drafts('oauth', 5), '[]')
+            calls = len(fake.urls)
+            await standard_finder.search_internet_drafts('oauth', 5)
+        self.assertGreater(len(fake.urls), calls)
+        self.assertEqual(len(response_cache), 0)
+
+    async def test_fallback_search_is_not_cached(self):
+        # The name search failed, so the title search results are served but not kept
+        fake = FakeDatatracker(failing=['name__icontains'])
+        with self.serve(fake):
+            results = json.loads(await standard_finder.search_internet_drafts('oauth', 5))
+        self.assertEqual(results[0]['name'], DRAFT['name'])
+        self.assertEqual(len(response_cache), 0)
+
+    async def test_working_group_lookup_failures_are_not_cached(self):
+        # Only the single-class listing whose lookups all succeeded is kept
+        for marker, cached in (('/group/group/', 0), ('type=rfc', 1), ('type=draft', 1)):
+            with self.subTest(failing=marker):
+                response_cache.invalidate()
+                fake = FakeDatatracker(failing=[marker])
+                with self.serve(fake):
+                    result = json.loads(await standard_finder.get_working_group_documents('oauth'))
+                self.assertEqual(result['workingGroup'], 'oauth')
+                self.assertEqual(len(response_cache), cached)
+
+    async def test_working_group_listing_is_cached(self):
+        fake = FakeDatatracker()
+        with self.serve(fake):
+            first = await standard_finder.get_working_group_documents('OAuth')
+            calls = len(fake.urls)
+            second = await standard_finder.get_working_group_documents('oauth')
+        self.assertEqual(first, second)
+        self.assertEqual(json.loads(first)['summary']['totalDocuments'], 2)
+        self.assertEqual(len(fake.urls), calls)
+
+    async def test_working_group_subset_fetches_only_its_class(self):
+        fake = FakeDatatracker()
+        with self.serve(fake):
+            result = json.loads(await standard_finder.get_working_group_documents('oauth', include_rfcs=False))
+        self.assertFalse(any('type=rfc' in url for url in fake.urls))
+        self.assertEqual(result['summary'], {'totalRfcs': 0, 'totalDrafts': 1, 'totalDocuments': 1})
+        # Nothing else can be derived from a draft-only listing
+        self.assertEqual(len(response_cache), 1)
+
+    async def test_working_group_variants_need_their_own_lookups(self):
+        fake = FakeDatatracker(failing=['type=draft'])
+        with self.serve(fake):
+            await standard_finder.get_working_group_documents('oauth')
+            calls = len(fake.urls)
+            rfcs_only = json.loads(await standard_finder.get_working_group_documents('oauth', include_drafts=False))
+            self.assertEqual(len(fake.urls), calls)
+            await standard_finder.get_working_group_documents('oauth', include_rfcs=False)
+        self.assertGreater(len(fake.urls), calls)
+        self.assertEqual(rfcs_only['summary'], {'totalRfcs': 1, 'totalDrafts': 0, 'totalDocuments': 1})
+
+
+class DraftSearchRequestTest(unittest.IsolatedAsyncioTestCase):
+    """Fallback searches are only requested when the preferred lookup fails or is slow"""
+
+    def setUp(self):
+        response_cache.invalidate()
+
+    def tearDown(self):
+        response_cache.invalidate()
+
+    def serve(self, fake):
+        return mock.patch.object(draft_service, 'fetch_json', fake.fetch_json)
+
+    async def test_name_hit_sends_no_title_search(self):
+        fake = FakeDatatracker()
+        with self.serve(fake):
+            await draft_service.search_internet_drafts('oauth', 5)
+        self.assertEqual(len(fake.urls), 1)
+        self.assertIn('name__icontains', fake.urls[0])
+
+    async def test_slow_name_search_is_hedged(self):
+        fake = FakeDatatracker(failing=['name__icontains'], delays={'name__icontains': 0.3})
+        with self.serve(fake), mock.patch.object(SimpleInternetDraftService, 'SEARCH_HEDGE_DELAY', 0.05):
+            results = await draft_service.search_internet_drafts('oauth', 5)
+        self.assertEqual(len(fake.urls), 2)
+        self.assertIn('name__icontains', fake.urls[0])
+        self.assertIn('title__icontains', fake.urls[1])
+        self.assertEqual(results[0]['name'], DRAFT['name'])
+
+    async def test_exact_hit_sends_no_general_search(self):
+        # The exact lookup yields, as a real request does, but answers before the hedge delay
+        fake = FakeDatatracker(delays={'/doc/document/draft-': 0.05})
+        with self.serve(fake):
+            results = json.loads(await standard_finder.search_internet_drafts(DRAFT['name'], 5))
+        self.assertEqual(len(fake.urls), 1)
+        self.assertIn('/doc/document/draft-', fake.urls[0])
+        self.assertEqual(results[0]['name'], DRAFT['name'])
+
+    async def test_exact_miss_falls_back_to_general_search(self):
+        fake = FakeDatatracker(failing=['/doc/document/draft-'])
+        with self.serve(fake):
+            results = json.loads(await standard_finder.search_internet_drafts('draft-ietf-oauth-example', 5))
+        self.assertEqual(len(fake.urls), 2)
+        self.assertIn('name__icontains', fake.urls[1])
+        self.assertEqual(results[0]['name'], DRAFT['name'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the pre-serialized initialize, tools/list and ping responses
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+import standard_finder
+
+MODULE_PATH = os.path.abspath(standard_finder.__file__)
+REQUEST_IDS = (0, 7, -3, 2 ** 53, "req-1", "", 'quote " backslash \\ newline \n tab \t nul \x00', "é   😀 </script>")
+METHODS = (
+    ("initialize", {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "test", "version": "1"}}),
+    ("tools/list", {}),
+    ("ping", {}),
+)
+
+
+def load_without_orjson():
+    """Load a separate copy of standard_finder that falls back to the stdlib json module"""
+    spec = importlib.util.spec_from_file_location('standard_finder_stdlib_json', MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {'orjson': None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class SplicedResponseTest(unittest.TestCase):
+    """_spliced_response_json produces exactly what _dumps produces for the same response"""
+
+    def assertSplicedMatchesDumps(self, module):
+        server = module.SimpleMCPServer("test-splice")
+        for method, params in METHODS:
+            for request_id in REQUEST_IDS:
+                with self.subTest(method=method, request_id=request_id):
+                    request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+                    response = asyncio.run(server.handle_request(request))
+                    spliced = server._spliced_response_json(response)
+                    self.assertIsNotNone(spliced)
+                    self.assertEqual(spliced, module._dumps(response))
+                    self.assertEqual(json.loads(spliced), response)
+        # Anything but a bare static response is left to _dumps
+        self.assertIsNone(server._spliced_response_json({"jsonrpc": "2.0", "id": 1, "result": {}}))
+        response = asyncio.run(server.handle_request({"jsonrpc": "2.0", "id": 1, "method": "ping"}))
+        self.assertIsNone(server._spliced_response_json(dict(response, extra=True)))
+
+    @unittest.skipIf(standard_finder.orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        self.assertSplicedMatchesDumps(standard_finder)
+
+    def test_stdlib_json(self):
+        module = load_without_orjson()
+        self.assertIsNone(module.orjson)
+        self.assertSplicedMatchesDumps(module)
+
+    def test_tool_registration_refreshes_tools_list(self):
+        server = standard_finder.SimpleMCPServer("test-splice")
+        request = {"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}}
+        before = server._spliced_response_json(asyncio.run(server.handle_request(request)))
+
+        @server.tool
+        async def echo(text: str) -> str:
+            """Echo the text back"""
+            return text
+
+        response = asyncio.run(server.handle_request(request))
+        after = server._spliced_response_json(response)
+        self.assertNotEqual(before, after)
+        self.assertEqual(after, standard_finder._dumps(response))
+
+
+if __name__ == '__main__':
+    unittest.main()
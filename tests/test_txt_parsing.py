@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the single-pass TXT RFC and Internet Draft parser
+"""
+
+import os
+import random
+import re
+import unittest
+
+from standard_finder import _scan_txt_document, _section_header_title, rfc_service, draft_service
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+# The section header pattern the parser used before it was inlined into _section_header_title
+SECTION_RE = re.compile(r'^(?:\d+\.)+\s+(.+)$')
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+class SectionHeaderTest(unittest.TestCase):
+    """_section_header_title accepts exactly the lines matching ^(?:\\d+\\.)+\\s+(.+)$"""
+
+    def assertSameAsPattern(self, line):
+        match = SECTION_RE.match(line)
+        self.assertEqual(_section_header_title(line), match.group(1).strip() if match else None, repr(line))
+
+    def test_header_shapes(self):
+        self.assertEqual(_section_header_title("1.  Introduction"), "Introduction")
+        self.assertEqual(_section_header_title("2.3.1.  Client Password"), "Client Password")
+        self.assertEqual(_section_header_title("10.\tSecurity  "), "Security")
+        # Two blanks after the number are a header with an empty title, as with the pattern
+        self.assertEqual(_section_header_title("1.  "), "")
+        for line in ("1 Introduction", "1.Introduction", "1. ", "1..  Double", "A.1.  Appendix",
+                     "   1.  Indented", "2016", "3.2", "", "1.2 Missing dot"):
+            self.assertIsNone(_section_header_title(line), repr(line))
+
+    def test_matches_pattern(self):
+        for name in ('rfc_sample.txt', 'draft_sample.txt'):
+            for line in read_fixture(name).split('\n'):
+                self.assertSameAsPattern(line)
+        rng = random.Random(7)
+        alphabet = ['1', '2', '10', '.', ' ', '\t', 'a', 'Title', '\x0b', '\u3000']
+        for _ in range(5000):
+            self.assertSameAsPattern(''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 8))))
+
+
+class TxtDocumentTest(unittest.TestCase):
+    """Title, authors, abstract and sections of representative TXT documents"""
+
+    def test_rfc(self):
+        rfc = rfc_service._parse_txt_rfc(read_fixture('rfc_sample.txt'), '6749', 'https://www.rfc-editor.org/rfc/rfc6749.txt')
+        metadata = rfc['metadata']
+        self.assertEqual(metadata['title'], "The OAuth 2.0 Authorization Framework")
+        self.assertEqual(metadata['authors'], [])
+        self.assertEqual(metadata['abstract'],
+                         "The OAuth 2.0 authorization framework enables a third-party"
+                         "    application to obtain limited access to an HTTP service.")
+        self.assertEqual([section['title'] for section in rfc['sections']],
+                         ['Introduction', 'Roles', 'Client Registration', 'Client Password', 'Security Considerations'])
+        self.assertEqual(rfc['sections'][1]['content'],
+                         "\n   OAuth defines four roles:\n\n   resource owner\n"
+                         "      An entity capable of granting access to a protected resource.\n")
+
+    def test_draft(self):
+        name = 'draft-ietf-oauth-browser-based-apps-18'
+        draft = draft_service._parse_txt_draft(read_fixture('draft_sample.txt'), name, f'https://datatracker.ietf.org/doc/txt/{name}.txt')
+        metadata = draft['metadata']
+        self.assertEqual(metadata['title'], "OAuth 2.0 for Browser-Based Applications")
+        self.assertEqual(metadata['authors'], ['A. Parecki, D. Waite,', 'P. De Ryck'])
+        self.assertTrue(metadata['abstract'].startswith("This specification details the threats"))
+        self.assertTrue(metadata['abstract'].endswith("use OAuth 2.0."))
+        self.assertEqual(metadata['version'], '18')
+        self.assertEqual([section['title'] for section in draft['sections']],
+                         ['Introduction', 'Terminology', 'Backend For Frontend (BFF)', 'Application Architecture', 'References'])
+        self.assertEqual(draft['sections'][3]['content'],
+                         "\n   In this architecture, the JavaScript code is loaded from a BFF.\n")
+        self.assertEqual(draft['sections'][-1]['content'], "")
+
+    def test_draft_without_title_field(self):
+        # Without a "Title:" field a draft is titled by its name; the RFC header heuristics stay off
+        text = read_fixture('draft_sample.txt').replace("Title:    ", "          ")
+        scan = _scan_txt_document(text)
+        self.assertIsNone(scan['field_title'])
+        self.assertIsNone(scan['dated_title'])
+        self.assertEqual(draft_service._parse_txt_draft(text, 'draft-x-00', 'u')['metadata']['title'], 'draft-x-00')
+
+    def test_crlf_document(self):
+        # Lines keep their carriage returns, which section titles and authors strip
+        draft = draft_service._parse_txt_draft(read_fixture('draft_sample.txt').replace('\n', '\r\n'), 'draft-x-00', 'u')
+        self.assertEqual(draft['metadata']['title'], "OAuth 2.0 for Browser-Based Applications")
+        self.assertEqual([section['title'] for section in draft['sections']][:2], ['Introduction', 'Terminology'])
+
+
+if __name__ == '__main__':
+    unittest.main()